@@ -0,0 +1,68 @@
+"""NLP size, solve time and RTOW of the elevator parameterizations against the full collocated de control.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_elevator_modes
+"""
+from toa.data import get_airplane_data
+from toa.runway import Runway
+from toa.traj.builder import build_takeoff_problem
+from toa.traj.builder import solve_problem
+from toa.traj.elevator import FullControl
+from toa.traj.elevator import PiecewiseLinearControl
+from toa.traj.elevator import PolynomialControl
+from toa.traj.elevator import RotationRateLaw
+
+MODES = [
+    FullControl(),
+    PolynomialControl(order=2),
+    PolynomialControl(order=3),
+    PiecewiseLinearControl(knots=2),
+    PiecewiseLinearControl(knots=3),
+    RotationRateLaw(q_cmd=3.0),
+    ]
+
+
+def nlp_size(p):
+    """Return the number of design variables and constraints of a set up problem."""
+    p.final_setup()
+    num_dvs = sum(meta['size'] for meta in p.driver._designvars.values())
+    num_cons = sum(meta['size'] for meta in p.driver._cons.values())
+    return num_dvs, num_cons
+
+
+def run_modes(airplane, runway, modes=MODES, flap_angle=5.0):
+    rows = []
+    for elevator in modes:
+        p = build_takeoff_problem(airplane, runway, flap_angle=flap_angle, elevator=elevator)
+        num_dvs, num_cons = nlp_size(p)
+        result = solve_problem(p)
+        telemetry = result.telemetry
+        rows.append({
+            'mode': repr(elevator),
+            'design_vars': num_dvs,
+            'constraints': num_cons,
+            'iterations': telemetry.iterations,
+            'time': telemetry.total_time,
+            'time_per_iteration': telemetry.total_time / max(telemetry.iterations, 1),
+            'rtow': result.rtow,
+            'converged': result.converged,
+            })
+    return rows
+
+
+if __name__ == '__main__':
+    runway = Runway(1800, 0.0, 0.0, 0.0, 0.0)
+
+    for name in ('b734', 'b744'):
+        airplane = get_airplane_data(name)
+        rows = run_modes(airplane, runway)
+        reference = rows[0]
+
+        print(f"\n{name}")
+        print(f"{'mode':<60} {'dvs':>5} {'cons':>5} {'iter':>5} {'time (s)':>9} {'s/iter':>7} "
+              f"{'RTOW (kg)':>10} {'loss (kg)':>10} {'conv':>5}")
+        for row in rows:
+            print(f"{row['mode']:<60} {row['design_vars']:5d} {row['constraints']:5d} {row['iterations']:5d} "
+                  f"{row['time']:9.2f} {row['time_per_iteration']:7.3f} {row['rtow']:10.1f} "
+                  f"{reference['rtow'] - row['rtow']:10.1f} {str(row['converged']):>5}")
@@ -0,0 +1,39 @@
+"""Import time of the toa modules, each in a fresh interpreter, and the heavy dependencies they load.
+
+The table, cache and batch front ends only need NumPy, OpenMDAO and dymos are imported once a problem is built.
+Run from the repository root:
+
+    python -m benchmarks.bench_import_time
+"""
+import subprocess
+import sys
+
+MODULES = ('toa.runway', 'toa.data', 'toa.traj.result', 'toa.traj.batch', 'toa.traj.airport', 'toa.cli',
+           'toa.traj.builder')
+
+HEAVY = ('scipy', 'openmdao', 'dymos', 'jax', 'matplotlib')
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+print(' '.join(name for name in {heavy!r} if name in sys.modules))
+"""
+
+
+def import_time(module, repeat=3):
+    """Return the best import time in s of module over repeat fresh interpreters and the heavy modules it loads."""
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', SCRIPT.format(module=module, heavy=HEAVY)], check=True,
+                                capture_output=True, text=True).stdout.splitlines()
+        times.append(float(output[0]))
+    return min(times), output[1].split() if len(output) > 1 else []
+
+
+if __name__ == '__main__':
+    print(f"{'module':<20} {'time (s)':>9}  heavy modules")
+    for module in MODULES:
+        elapsed, loaded = import_time(module)
+        print(f"{module:<20} {elapsed:9.3f}  {' '.join(loaded) or '-'}")
@@ -0,0 +1,44 @@
+"""Time to solution of the optimizer backends, scipy SLSQP and the pyoptsparse SLSQP and IPOPT.
+
+The pyoptsparse backends are skipped when pyoptsparse is not installed. Run from the repository root:
+
+    python -m benchmarks.bench_optimizers
+"""
+from toa.data import get_airplane_data
+from toa.runway import Runway
+from toa.traj.builder import solve_takeoff
+from toa.traj.optimizers import OPTIMIZERS
+from toa.traj.optimizers import get_optimizer
+
+
+def run_optimizers(airplane, runway, names=tuple(OPTIMIZERS), flap_angle=5.0):
+    rows = []
+    for name in names:
+        optimizer = get_optimizer(name)
+        if not optimizer.available:
+            continue
+        result = solve_takeoff(airplane, runway, flap_angle=flap_angle, optimizer=optimizer)
+        telemetry = result.telemetry
+        rows.append({
+            'optimizer': name,
+            'iterations': telemetry.iterations,
+            'time': telemetry.total_time,
+            'rtow': result.rtow,
+            'violation': telemetry.constraint_violation,
+            'converged': result.converged,
+            })
+    return rows
+
+
+if __name__ == '__main__':
+    runway = Runway(1800, 0.0, 0.0, 0.0, 0.0)
+
+    for name in ('b734', 'b744'):
+        airplane = get_airplane_data(name)
+        rows = run_optimizers(airplane, runway)
+
+        print(f"\n{name}")
+        print(f"{'optimizer':<12} {'iter':>5} {'time (s)':>9} {'RTOW (kg)':>10} {'violation':>10} {'conv':>5}")
+        for row in rows:
+            print(f"{row['optimizer']:<12} {row['iterations']:5d} {row['time']:9.2f} {row['rtow']:10.1f} "
+                  f"{row['violation']:10.2e} {str(row['converged']):>5}")
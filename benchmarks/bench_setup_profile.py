@@ -0,0 +1,45 @@
+"""Setup time of the takeoff problem under the development and production profiles.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_setup_profile
+"""
+import contextlib
+import io
+import time
+
+from toa.data import get_airplane_data
+from toa.runway import Runway
+from toa.traj.aeo import build_problem
+from toa.traj.profile import DEVELOPMENT
+from toa.traj.profile import PRODUCTION
+
+REPEAT = 5
+
+
+def time_setup(airplane, runway, profile, repeat=REPEAT):
+    """Return the setup times (build, setup and final setup) in seconds."""
+    times = []
+    for _ in range(repeat):
+        # The development profile prints a lot, keep it out of the benchmark output.
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            p = build_problem(airplane, runway, flap_angle=5.0, profile=profile)
+            p.final_setup()
+            times.append(time.perf_counter() - start)
+    return times
+
+
+if __name__ == '__main__':
+    runway = Runway(1800, 0.0, 0.0, 0.0, 0.0)
+    airplane = get_airplane_data('b734')
+
+    results = {profile.name: time_setup(airplane, runway, profile) for profile in (DEVELOPMENT, PRODUCTION)}
+
+    print(f"{'profile':<12} {'min (s)':>9} {'mean (s)':>9}")
+    for name, times in results.items():
+        print(f"{name:<12} {min(times):9.3f} {sum(times) / len(times):9.3f}")
+
+    dev = min(results[DEVELOPMENT.name])
+    prod = min(results[PRODUCTION.name])
+    print(f"Setup time saved by the production profile: {dev - prod:.3f} s ({(dev - prod) / dev * 100:.1f} %)")
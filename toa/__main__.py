@@ -0,0 +1,5 @@
+import sys
+
+from toa.cli import main
+
+sys.exit(main())
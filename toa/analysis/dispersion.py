@@ -0,0 +1,213 @@
+import numpy as np
+from scipy.constants import degree
+from scipy.constants import foot
+
+from toa.models.aero.drag_coef_comp import DragCoeffComp
+from toa.models.aero.flap_slat_comp import FlapSlatComp
+from toa.models.aero.ground_effect_comp import GroundEffectComp
+from toa.models.atmosphere import P0
+from toa.models.atmosphere import atmosphere
+from toa.models.eom.initialrun_eom import InitialRunEOM
+from toa.models.eom.rotation_eom import RotationEOM
+from toa.models.eom.transition_oem import TransitionOEM
+from toa.models.propulsion.fuel_flow_comp import FuelFlowComp
+from toa.models.propulsion.thrust_comp import ThrustComp
+
+GRAV = 9.80665
+
+# Flight phases of the simulated takeoffs
+GROUND_RUN, ROTATION, AIRBORNE, DONE = range(4)
+
+
+class Dispersion:
+    """Normal distributions, as (mean, standard deviation), of the uncertain takeoff inputs.
+
+    mu is the rolling friction coefficient, thrust a factor applied to the engine thrust, wind the wind speed along
+    the runway in m/s (positive for a headwind) and mass the takeoff mass in kg, by default 95 % of the MTOW with a
+    standard deviation of 2 % of the MTOW. Samples are clipped to physical values and the mass to the MTOW.
+    """
+
+    def __init__(self, mu=(0.025, 0.005), thrust=(1.0, 0.02), wind=(0.0, 3.0), mass=None):
+        self.mu = mu
+        self.thrust = thrust
+        self.wind = wind
+        self.mass = mass
+
+    def sample(self, airplane, n, seed=None):
+        rng = np.random.default_rng(seed)
+        mtow = airplane.limits.MTOW
+        mass = self.mass or (0.95 * mtow, 0.02 * mtow)
+        return {
+            'mu': np.clip(rng.normal(*self.mu, size=n), 0.005, 0.1),
+            'thrust': np.clip(rng.normal(*self.thrust, size=n), 0.5, 1.5),
+            'wind': rng.normal(*self.wind, size=n),
+            'mass': np.clip(rng.normal(*mass, size=n), 0.5 * mtow, mtow),
+            }
+
+
+class DispersionResult:
+    """Distances to 35 ft of a Monte Carlo takeoff analysis, inf where the 35 ft were not reached in time."""
+
+    def __init__(self, samples, distance, toda):
+        self.samples = samples
+        self.distance = distance
+        self.toda = toda
+
+    @property
+    def size(self):
+        return self.distance.size
+
+    def percentiles(self, q=(5, 50, 95, 99)):
+        """Return the distance percentiles in m, by nearest rank so failed takeoffs count as infinite distances."""
+        ordered = np.sort(self.distance)
+        ranks = np.clip(np.ceil(np.asarray(q, dtype=float) / 100 * self.size).astype(int) - 1, 0, self.size - 1)
+        return dict(zip(q, ordered[ranks]))
+
+    def probability_exceeding(self, distance=None):
+        """Return the probability of the distance to 35 ft exceeding distance, the runway TODA by default."""
+        distance = self.toda if distance is None else distance
+        return float(np.mean(self.distance > distance))
+
+    def summary(self):
+        lines = [f"Samples: {self.size}"]
+        lines += [f"P{q:g} distance to 35 ft: {value:.1f} m" for q, value in self.percentiles().items()]
+        lines.append(f"P(distance > TODA = {self.toda:.0f} m): {self.probability_exceeding():.4f}")
+        return '\n'.join(lines)
+
+
+def _compute(comp, **inputs):
+    """Evaluate the compute method of a component on arrays, without setting it up."""
+    outputs = {}
+    comp.compute({name: np.asarray(value, dtype=float) for name, value in inputs.items()}, outputs)
+    return outputs
+
+
+def simulate_takeoffs(airplane, runway, mu, thrust, wind, mass, flap_angle=0.0, dih=0.0, vr_ratio=1.08,
+                      pitch_rate=3.0, pitch_target=15.0, dt=0.05, t_max=120.0, isa_deviation=0.0, qnh=P0):
+    """Simulate a batch of takeoffs at once and return the distances to 35 ft of the main landing gear in m.
+
+    Every argument after runway may be an array, one value per takeoff (see Dispersion). The takeoffs follow the
+    same procedure as the optimized trajectory phases: a ground run with all wheels on the runway up to the rotation
+    speed, vr_ratio times the stall speed, a rotation on the main landing gear at pitch_rate deg/s up to the lift-off
+    and an airborne transition, pitching up to pitch_target deg without exceeding the maximum angle of attack, up to
+    35 ft. The forces and accelerations come from the same aerodynamic, propulsion and equations of motion
+    components as the phase ODEs, integrated with a fixed time step dt, in the atmosphere of isa_deviation (K) and
+    qnh (Pa). Takeoffs not reaching 35 ft within t_max have an infinite distance.
+    """
+    mu, thrust_factor, wind, mass = np.broadcast_arrays(*(np.atleast_1d(np.asarray(value, dtype=float))
+                                                          for value in (mu, thrust, wind, mass)))
+    n = mass.size
+    mass = mass.copy()
+
+    flap = _compute(FlapSlatComp(airplane=airplane), flap_angle=flap_angle)
+    CL0 = flap['CL0']
+    CLa = flap['CLa']
+    CLmax = flap['CLmax']
+    alpha_max = flap['alpha_max'] * degree
+    atmos = atmosphere(runway.elevation, isa_deviation=isa_deviation, qnh=qnh)
+    rho = atmos['rho']
+    sos = atmos['sos']
+
+    ground_effect = GroundEffectComp(num_nodes=n, airplane=airplane)
+    drag = DragCoeffComp(num_nodes=n, airplane=airplane)
+    thrust_comp = ThrustComp(num_nodes=n, airplane=airplane)
+    fuel_flow = FuelFlowComp(num_nodes=n, airplane=airplane)
+    initial_run_eom = InitialRunEOM(num_nodes=n, airplane=airplane)
+    rotation_eom = RotationEOM(num_nodes=n, airplane=airplane)
+    transition_eom = TransitionOEM(num_nodes=n, airplane=airplane)
+
+    S = airplane.wing.area
+    xmg = airplane.landing_gear.main.x
+    zmg = airplane.landing_gear.main.z
+    slope = runway.slope
+    vr = vr_ratio * np.sqrt(2 * mass * GRAV / (rho * S * CLmax))
+    q_cmd = pitch_rate * degree
+    theta_max = pitch_target * degree
+    h_screen = 35 * foot
+
+    phase = np.full(n, GROUND_RUN)
+    V = np.zeros(n)
+    x = np.full(n, xmg)
+    h = np.full(n, zmg)
+    theta = np.zeros(n)
+    gam = np.zeros(n)
+    distance = np.full(n, np.inf)
+    x_mlg = x - xmg
+    h_mlg = h - zmg
+
+    t = 0.0
+    while t < t_max and np.any(phase != DONE):
+        ground = phase <= ROTATION
+        airborne = phase == AIRBORNE
+        alpha = theta - gam
+
+        # True airspeed, see TrueAirspeedCompGroundRoll and TrueAirspeedComp
+        tas = np.hypot(V * np.cos(gam) + wind, V * np.sin(gam))
+
+        # Aerodynamics, see AerodynamicsGroup
+        effect = _compute(ground_effect, h=h)
+        CL = CL0 + CLa * alpha + airplane.coeffs.CLih * dih * degree
+        CLg = CL * effect['CLag'] / CLa - effect['CLag'] * effect['dalpha_zero'] * degree
+        CD = _compute(drag, flap_angle=flap_angle * degree, CL=CLg, mass=mass, grav=GRAV, phi=effect['phi'])['CD']
+        qS = 0.5 * rho * tas ** 2 * S
+        lift = qS * CLg
+        drag_force = qS * CD
+
+        # Propulsion, see PropulsionGroup
+        prop = _compute(thrust_comp, p_amb=atmos['pres'], mach=tas / sos, isa_deviation=isa_deviation)
+        T = prop['thrust'] * thrust_factor
+        m_dot = _compute(fuel_flow, thrust_ratio=prop['thrust_ratio'] * thrust_factor, thrust=T,
+                         elevation=atmos['pressure_altitude'])['m_dot']
+
+        # Equations of motion of the phases
+        q = np.where(phase == GROUND_RUN, 0.0, np.where(theta < theta_max, q_cmd, 0.0))
+        forces = {'thrust': T, 'lift': lift, 'drag': drag_force, 'moment': np.zeros(n), 'V': V, 'mass': mass,
+                  'alpha': alpha, 'grav': GRAV}
+        ground_run = _compute(initial_run_eom, rw_slope=slope, mu=mu, **forces)
+        rotation = _compute(rotation_eom, q=q, rw_slope=slope, mu=mu, **forces)
+        transition = _compute(transition_eom, q=q, gam=gam, **dict(forces, V=np.maximum(V, 1.0)))
+        v_dot = np.where(phase == GROUND_RUN, ground_run['v_dot'],
+                         np.where(phase == ROTATION, rotation['v_dot'], transition['v_dot']))
+        gam_dot = np.where(airborne, transition['gam_dot'], 0.0)
+        x_dot = np.where(ground, rotation['x_dot'], V * np.cos(gam))
+        h_dot = np.where(ground, rotation['h_dot'], V * np.sin(gam))
+        weight = mass * GRAV
+
+        active = phase != DONE
+        V = np.where(active, V + v_dot * dt, V)
+        x = np.where(active, x + x_dot * dt, x)
+        h = np.where(active, h + h_dot * dt, h)
+        mass = np.where(active, mass + m_dot * dt, mass)
+        theta = np.where(active, theta + q * dt, theta)
+        # The airplane does not sink back towards the runway and pitches down rather than exceed alpha_max
+        gam = np.maximum(np.where(active, gam + gam_dot * dt, gam), 0.0)
+        theta = np.minimum(theta, gam + alpha_max)
+        t += dt
+
+        # Main landing gear position, see MainLandingGearPosComp
+        prev_x_mlg, prev_h_mlg = x_mlg, h_mlg
+        x_mlg = x - xmg * np.cos(theta) + zmg * np.sin(theta)
+        h_mlg = h - xmg * np.sin(theta) - zmg * np.cos(theta)
+
+        screen = active & (h_mlg >= h_screen)
+        if np.any(screen):
+            w = (h_screen - prev_h_mlg[screen]) / (h_mlg[screen] - prev_h_mlg[screen])
+            distance[screen] = prev_x_mlg[screen] + w * (x_mlg[screen] - prev_x_mlg[screen])
+            phase[screen] = DONE
+
+        phase[(phase == GROUND_RUN) & (tas >= vr)] = ROTATION
+        phase[(phase == ROTATION) & (lift >= weight * np.cos(slope))] = AIRBORNE
+
+    return distance
+
+
+def run_monte_carlo(airplane, runway, n=10000, dispersion=None, seed=None, **kwargs):
+    """Sample n takeoffs from the dispersion and simulate them, see simulate_takeoffs for the keyword arguments.
+
+    The default dispersion is centred on the rolling friction of the runway condition.
+    """
+    dispersion = dispersion or Dispersion(mu=(runway.condition.mu, 0.005))
+    samples = dispersion.sample(airplane, n, seed=seed)
+    distance = simulate_takeoffs(airplane, runway, samples['mu'], samples['thrust'], samples['wind'],
+                                 samples['mass'], **kwargs)
+    return DispersionResult(samples, distance, runway.toda)
@@ -0,0 +1,180 @@
+import numpy as np
+from scipy.constants import degree
+from scipy.constants import foot
+
+from toa.analysis.dispersion import GRAV
+from toa.analysis.dispersion import _compute
+from toa.models.aero.drag_coef_comp import DragCoeffComp
+from toa.models.aero.flap_slat_comp import FlapSlatComp
+from toa.models.aero.ground_effect_comp import GroundEffectComp
+from toa.models.atmosphere import P0
+from toa.models.atmosphere import atmosphere
+from toa.models.propulsion.thrust_comp import ThrustComp
+
+H_SCREEN = 35 * foot
+
+
+def ground_run_distance(V, a0, aV):
+    """Return the distance and the average acceleration to reach the speed V from rest, for an acceleration varying
+    linearly with V**2 from a0 at rest to aV at V (Roskam)."""
+    agave = (1 - aV / a0) / np.log(a0 / aV) * a0
+    return V ** 2 / (2 * agave), agave
+
+
+def air_distance(wing_loading, rho, CLmax, vlof_vs, climb_gradient, h_screen=H_SCREEN):
+    """Return the air distance from the lift-off to the screen height, a transition arc followed by a straight climb
+    (Roskam). wing_loading is the weight over the wing area in N/m**2 and climb_gradient (T - D) / W."""
+    deltaCL = 0.5 * (vlof_vs ** 2 - 1) * (CLmax * (vlof_vs ** 2 - 0.53) + 0.38)
+    Rtr = 2 * wing_loading / (rho * GRAV * deltaCL)
+    Str = Rtr * np.sin(climb_gradient)
+    htr = Str * climb_gradient / 2
+    Scl = np.where(htr < h_screen, (h_screen - htr) / np.tan(climb_gradient), 0.0)
+    return Str + Scl
+
+
+def estimate_takeoff(airplane, mass, flap_angle=0.0, elevation=0.0, slope=0.0, mu=0.025, wind_speed=0.0,
+                     isa_deviation=0.0, qnh=P0, vr_ratio=1.08, vlof_ratio=1.15):
+    """Closed form estimate of the takeoff of masses in kg, distances in m, speeds in m/s and times in s.
+
+    Every argument after airplane, except the flap deflection, may be an array. The ground run has the average
+    acceleration between rest and the rotation speed, vr_ratio times the stall speed, with the wheels on the runway
+    at zero pitch. The rotation keeps the rotation speed acceleration up to the lift-off speed, vlof_ratio times the
+    stall speed, and the air distance is a transition arc followed by a straight climb to 35 ft. Speeds are airspeeds
+    and distances follow from the ground speeds, for a wind speed positive for a headwind. Takeoffs the airplane
+    cannot accelerate or climb have infinite distances.
+    """
+    mass, elevation, slope, mu, wind_speed, isa_deviation, qnh = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(value, dtype=float))
+              for value in (mass, elevation, slope, mu, wind_speed, isa_deviation, qnh)))
+    n = mass.size
+    S = airplane.wing.area
+    W = mass * GRAV
+
+    flap = _compute(FlapSlatComp(airplane=airplane), flap_angle=flap_angle)
+    CL0 = np.ravel(flap['CL0'])[0]
+    CLa = np.ravel(flap['CLa'])[0]
+    CLmax = np.ravel(flap['CLmax'])[0]
+    atmos = atmosphere(elevation, isa_deviation=isa_deviation, qnh=qnh)
+    rho = atmos['rho']
+
+    thrust_comp = ThrustComp(num_nodes=n, airplane=airplane)
+    drag = DragCoeffComp(num_nodes=n, airplane=airplane)
+
+    def thrust(tas):
+        mach = tas / atmos['sos']
+        return _compute(thrust_comp, p_amb=atmos['pres'], mach=mach, isa_deviation=isa_deviation)['thrust']
+
+    def drag_coeff(CL, phi):
+        return _compute(drag, flap_angle=flap_angle * degree, CL=CL, mass=mass, grav=GRAV, phi=phi)['CD']
+
+    # Aerodynamics with the wheels on the runway at zero pitch, see AerodynamicsGroup
+    effect = _compute(GroundEffectComp(num_nodes=n, airplane=airplane), h=np.full(n, airplane.landing_gear.main.z))
+    CLg = CL0 * effect['CLag'] / CLa - effect['CLag'] * effect['dalpha_zero'] * degree
+    CDg = drag_coeff(CLg, effect['phi'])
+
+    Vs = np.sqrt(2 * W / (rho * S * CLmax))
+    VR = vr_ratio * Vs
+    Vlof = vlof_ratio * Vs
+
+    def acceleration(tas):
+        return GRAV * (thrust(tas) / W - mu - slope) - (CDg - mu * CLg) * 0.5 * rho * tas ** 2 * S / mass
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        a0 = acceleration(np.abs(wind_speed))
+        aR = acceleration(VR)
+        VR_ground = VR - wind_speed
+        Vlof_ground = Vlof - wind_speed
+        ground_run, agave = ground_run_distance(VR_ground, a0, aR)
+        t_ground = VR_ground / agave
+
+        t_rotation = (Vlof - VR) / aR
+        rotation = 0.5 * (VR_ground + Vlof_ground) * t_rotation
+
+        CL_lof = W / (0.5 * rho * Vlof ** 2 * S)
+        climb_gradient = (thrust(Vlof) - drag_coeff(CL_lof, effect['phi']) * 0.5 * rho * Vlof ** 2 * S) / W
+        air = air_distance(W / S, rho, CLmax, vlof_ratio, climb_gradient)
+        t_air = air / Vlof_ground
+
+    feasible = (a0 > 0) & (aR > 0) & (climb_gradient > 0) & (VR_ground > 0)
+    ground_run, rotation, air = (np.where(feasible, value, np.inf) for value in (ground_run, rotation, air))
+    return {
+        'VR': VR,
+        'Vlof': Vlof,
+        'VR_ground': VR_ground,
+        'Vlof_ground': Vlof_ground,
+        't_ground': t_ground,
+        't_rotation': t_rotation,
+        't_air': t_air,
+        'ground_run': ground_run,
+        'rotation': rotation,
+        'air': air,
+        'liftoff': ground_run + rotation,
+        'distance': ground_run + rotation + air,
+        }
+
+
+def estimate_rtow(airplane, available, flap_angle=0.0, min_mass=None, distance='distance', tol=1.0, **kwargs):
+    """Return the approximate maximum takeoff mass in kg whose estimated distance fits the available distance in m.
+
+    distance is the estimate_takeoff distance compared with the available one, the distance to 35 ft for the TODA
+    or the lift-off distance for the TORA, and kwargs are the other estimate_takeoff arguments. The mass is found by
+    bisection between min_mass, half the MTOW by default, and the MTOW within tol kg. The result is the MTOW when it
+    fits and nan when not even min_mass does.
+    """
+    mtow = airplane.limits.MTOW
+    min_mass = 0.5 * mtow if min_mass is None else min_mass
+    available = np.atleast_1d(np.asarray(available, dtype=float))
+    shape = np.broadcast(available, *kwargs.values()).shape
+    available = np.broadcast_to(available, shape)
+
+    def fits(mass):
+        return estimate_takeoff(airplane, mass, flap_angle=flap_angle, **kwargs)[distance] <= available
+
+    lower = np.full(shape, float(min_mass))
+    upper = np.full(shape, float(mtow))
+    while np.any(upper - lower > tol):
+        mid = 0.5 * (lower + upper)
+        ok = fits(mid)
+        lower = np.where(ok, mid, lower)
+        upper = np.where(ok, upper, mid)
+
+    return np.where(fits(np.full(shape, float(mtow))), mtow, np.where(fits(lower), lower, np.nan))
+
+
+class TakeoffEstimate:
+    """Closed form estimate of the RTOW of a case, used to screen the case and as the initial guess of its solve.
+
+    trajectory is the estimate_takeoff of the rtow as floats. The estimate is not feasible when the airplane cannot
+    take off even at the minimum mass. It does not bound the solve, whose RTOW may be far from the estimate.
+    """
+
+    def __init__(self, rtow, trajectory):
+        self.rtow = rtow
+        self.trajectory = trajectory
+
+    @property
+    def feasible(self):
+        return not np.isnan(self.rtow)
+
+    @classmethod
+    def from_case(cls, case, min_mass=None):
+        """Estimate a TakeoffCase against its TODA, or its TORA without the transition phase."""
+        airplane = case.airplane
+        runway = case.runway
+        kwargs = dict(elevation=runway.elevation, slope=runway.slope, mu=runway.condition.mu,
+                      wind_speed=case.wind_speed, isa_deviation=case.isa_deviation, qnh=case.qnh)
+        if 'transition' in case.phases:
+            available, distance = runway.toda, 'distance'
+        else:
+            available, distance = runway.tora, 'liftoff'
+
+        rtow = float(estimate_rtow(airplane, available, flap_angle=case.flap_angle, min_mass=min_mass,
+                                   distance=distance, **kwargs)[0])
+        if np.isnan(rtow):
+            return cls(rtow, None)
+
+        trajectory = estimate_takeoff(airplane, rtow, flap_angle=case.flap_angle, **kwargs)
+        return cls(rtow, {name: float(value[0]) for name, value in trajectory.items()})
+
+    def __repr__(self):
+        return f'TakeoffEstimate(rtow={self.rtow})'
@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+
+from toa.analysis.dispersion import Dispersion
+from toa.analysis.dispersion import DispersionResult
+from toa.analysis.dispersion import run_monte_carlo
+from toa.analysis.dispersion import simulate_takeoffs
+from toa.data import get_airplane_data
+from toa.runway import Runway
+
+
+class TestSimulateTakeoffs(unittest.TestCase):
+
+    def setUp(self):
+        self.airplane = get_airplane_data('b734')
+        self.runway = Runway(2500, 0.0, 0.0, 0.0, 0.0)
+
+    def test_trends(self):
+        # reference, higher friction, less thrust, headwind, heavier
+        distance = simulate_takeoffs(self.airplane, self.runway,
+                                     mu=[0.025, 0.04, 0.025, 0.025, 0.025],
+                                     thrust=[1.0, 1.0, 0.95, 1.0, 1.0],
+                                     wind=[0.0, 0.0, 0.0, 5.0, 0.0],
+                                     mass=[60000, 60000, 60000, 60000, 66000], flap_angle=5.0)
+        self.assertTrue(np.all(np.isfinite(distance)))
+        self.assertGreater(distance[1], distance[0])
+        self.assertGreater(distance[2], distance[0])
+        self.assertLess(distance[3], distance[0])
+        self.assertGreater(distance[4], distance[0])
+
+    def test_monte_carlo(self):
+        result = run_monte_carlo(self.airplane, self.runway, n=200, seed=3, flap_angle=5.0)
+        again = run_monte_carlo(self.airplane, self.runway, n=200, seed=3, flap_angle=5.0)
+        np.testing.assert_array_equal(result.distance, again.distance)
+
+        percentiles = list(result.percentiles().values())
+        self.assertEqual(percentiles, sorted(percentiles))
+        self.assertEqual(result.probability_exceeding(), 0.0)
+        self.assertEqual(result.probability_exceeding(0.0), 1.0)
+
+
+class TestDispersion(unittest.TestCase):
+
+    def test_sample(self):
+        airplane = get_airplane_data('b734')
+        samples = Dispersion(mu=(0.025, 0.05)).sample(airplane, 1000, seed=0)
+        self.assertEqual(set(samples), {'mu', 'thrust', 'wind', 'mass'})
+        self.assertTrue(np.all(samples['mu'] >= 0.005))
+        self.assertTrue(np.all(samples['mass'] <= airplane.limits.MTOW))
+
+    def test_failed_takeoffs_count_as_exceeding(self):
+        result = DispersionResult({}, np.array([1000.0, 1500.0, np.inf, 1200.0]), toda=1400.0)
+        self.assertEqual(result.percentiles((50, 100)), {50: 1200.0, 100: np.inf})
+        self.assertEqual(result.probability_exceeding(), 0.5)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
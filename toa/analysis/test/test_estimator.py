@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+from openmdao.utils.assert_utils import assert_near_equal
+
+from toa.analysis.estimator import estimate_rtow
+from toa.analysis.estimator import estimate_takeoff
+from toa.data import get_airplane_data
+
+
+class TestEstimateTakeoff(unittest.TestCase):
+
+    def setUp(self):
+        self.airplane = get_airplane_data('b734')
+
+    def test_trends(self):
+        # reference, heavier, higher friction, headwind, uphill, hot and high
+        estimate = estimate_takeoff(self.airplane, mass=[60000, 66000, 60000, 60000, 60000, 60000], flap_angle=5.0,
+                                    mu=[0.025, 0.025, 0.04, 0.025, 0.025, 0.025],
+                                    wind_speed=[0.0, 0.0, 0.0, 5.0, 0.0, 0.0],
+                                    slope=[0.0, 0.0, 0.0, 0.0, 0.01, 0.0],
+                                    elevation=[0.0, 0.0, 0.0, 0.0, 0.0, 1500.0],
+                                    isa_deviation=[0.0, 0.0, 0.0, 0.0, 0.0, 20.0])
+        distance = estimate['distance']
+        self.assertTrue(np.all(np.isfinite(distance)))
+        self.assertGreater(distance[1], distance[0])
+        self.assertGreater(distance[2], distance[0])
+        self.assertLess(distance[3], distance[0])
+        self.assertGreater(distance[4], distance[0])
+        self.assertGreater(distance[5], distance[0])
+        assert_near_equal(distance, estimate['ground_run'] + estimate['rotation'] + estimate['air'], tolerance=1e-12)
+
+    def test_rtow_is_the_inverse(self):
+        toda = np.array([1500.0, 1800.0, 2000.0])
+        rtow = estimate_rtow(self.airplane, toda, flap_angle=5.0)
+
+        assert_near_equal(estimate_takeoff(self.airplane, rtow, flap_angle=5.0)['distance'], toda, tolerance=1e-3)
+
+    def test_rtow_limits(self):
+        rtow = estimate_rtow(self.airplane, [500.0, 5000.0], flap_angle=5.0)
+
+        self.assertTrue(np.isnan(rtow[0]))
+        self.assertEqual(rtow[1], self.airplane.limits.MTOW)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+"""Batch takeoff analysis from the command line.
+
+    python -m toa cases.csv --workers 4 --output results.jsonl
+
+Each case is a CSV row or a JSON line (for .jsonl files) of CASE_FIELDS, only airplane and tora are required. A
+result line, of OUTPUT_FIELDS, is written and flushed as soon as each case is finished, in order of completion.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
+# Case file columns and their defaults, the temperature is the outside air temperature in degC (ISA by default),
+# slope in rad, flap in deg and wind in m/s, positive for a headwind
+CASE_FIELDS = {
+    'name': '',
+    'airplane': None,
+    'tora': None,
+    'clearway': 0.0,
+    'stopway': 0.0,
+    'elevation': 0.0,
+    'slope': 0.0,
+    'condition': 'dry',
+    'flap': 0.0,
+    'wind': 0.0,
+    'temperature': None,
+    }
+
+RESULT_FIELDS = ('rtow', 'vr', 'vlof', 'v3', 'distance', 'converged', 'iterations', 'time', 'error')
+OUTPUT_FIELDS = ('index',) + tuple(CASE_FIELDS) + RESULT_FIELDS
+
+FORMATS = ('jsonl', 'csv')
+
+# Solve options of the cases, see run_batch
+DEFAULT_OPTIONS = {
+    'profile': 'production',
+    'fleet_dir': None,
+    'cache_dir': None,
+    'coloring_dir': None,
+    'screen': False,
+    'recover': False,
+    'budget': None,
+    }
+
+
+def read_cases(file, fmt):
+    """Yield the cases of a case file as dicts of CASE_FIELDS, with their defaults."""
+    rows = (json.loads(line) for line in file if line.strip()) if fmt == 'jsonl' else csv.DictReader(file)
+    for i, row in enumerate(rows):
+        row = {key.strip().lower(): value for key, value in row.items()}
+        unknown = sorted(set(row) - set(CASE_FIELDS))
+        if unknown:
+            raise ValueError(f"Unknown case fields {unknown} in case {i}, expected some of {list(CASE_FIELDS)}")
+        case = dict(CASE_FIELDS)
+        case.update({key: value for key, value in row.items() if value not in ('', None)})
+        for key in ('airplane', 'tora'):
+            if case[key] is None:
+                raise ValueError(f"Missing {key} in case {i}")
+        for key in CASE_FIELDS:
+            if key not in ('name', 'airplane', 'condition') and case[key] is not None:
+                case[key] = float(case[key])
+        yield case
+
+
+def solve_case(case, options):
+    """Solve a case of read_cases and return its result fields, the error message instead when it raises.
+
+    Runs in the worker processes, which import the solver on their first case.
+    """
+    try:
+        from toa.data import get_registry
+        from toa.data.reader import DATA_PATH
+        from toa.models.atmosphere import isa_deviation
+        from toa.runway import Runway
+        from toa.traj.batch import TakeoffCase
+        from toa.traj.batch import run_batch
+
+        directories = (DATA_PATH,) + ((options['fleet_dir'],) if options['fleet_dir'] else ())
+        airplane = get_registry(*directories).get(case['airplane'])
+        runway = Runway(case['tora'], case['clearway'], case['stopway'], case['elevation'], case['slope'],
+                        condition=case['condition'])
+        deviation = 0.0 if case['temperature'] is None else isa_deviation(case['temperature'], case['elevation'])
+        takeoff = TakeoffCase(airplane, runway, flap_angle=case['flap'], wind_speed=case['wind'],
+                              name=case['name'], isa_deviation=float(deviation))
+
+        results, summary = run_batch([takeoff], profile=options['profile'], coloring_dir=options['coloring_dir'],
+                                     screen=options['screen'], recover=options['recover'], budget=options['budget'],
+                                     hotstart_dir=options['cache_dir'])
+        result = results[0]
+        if result is None:
+            return {'error': 'skipped, the airplane cannot take off' if summary['skipped'] else 'failed'}
+        data = result.as_dict()
+        telemetry = data.pop('telemetry', {})
+        data.pop('dih')
+        data.update(converged=result.converged, iterations=telemetry.get('iterations'),
+                    time=None if result.telemetry is None else result.telemetry.total_time)
+        return data
+    except Exception as exc:
+        return {'error': f'{type(exc).__name__}: {exc}'}
+
+
+class ResultWriter:
+    """Writes a line per result to a text file, flushed right away."""
+
+    def __init__(self, file, fmt):
+        self.file = file
+        self.fmt = fmt
+        if fmt == 'csv':
+            self.writer = csv.DictWriter(file, fieldnames=OUTPUT_FIELDS, extrasaction='ignore')
+            self.writer.writeheader()
+
+    def write(self, row):
+        if self.fmt == 'csv':
+            self.writer.writerow(row)
+        else:
+            self.file.write(json.dumps({field: row.get(field) for field in OUTPUT_FIELDS}) + '\n')
+        self.file.flush()
+
+
+def run_cases(cases, writer, workers=1, options=None):
+    """Solve the cases, with workers processes, and write each result as soon as it is finished.
+
+    Returns the number of cases whose solve failed.
+    """
+    options = dict(DEFAULT_OPTIONS, **(options or {}))
+    failed = 0
+
+    def write(i, case, result):
+        writer.write({'index': i, **case, **result})
+        return result.get('error') is not None
+
+    if workers <= 1:
+        for i, case in enumerate(cases):
+            failed += write(i, case, solve_case(case, options))
+        return failed
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(solve_case, case, options): (i, case) for i, case in enumerate(cases)}
+        for future in as_completed(futures):
+            failed += write(*futures[future], future.result())
+    return failed
+
+
+def _format(path, fmt):
+    if fmt is not None:
+        return fmt
+    return 'jsonl' if path.endswith(('.jsonl', '.json')) else 'csv'
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='toa', description='Batch takeoff analysis (RTOW) of a case file.')
+    parser.add_argument('cases', help="case file, CSV or JSON lines (.jsonl), '-' for stdin")
+    parser.add_argument('-o', '--output', default='-', help="result file, stdout by default")
+    parser.add_argument('--input-format', choices=FORMATS, help='case file format, from the extension by default')
+    parser.add_argument('--format', choices=FORMATS, help='result format, from the extension or jsonl by default')
+    parser.add_argument('-j', '--workers', type=int, default=1, help='number of worker processes')
+    parser.add_argument('--fleet-dir', help='directory of additional airplane data files, see AirplaneRegistry')
+    parser.add_argument('--cache-dir', help='directory of the cached results and optimizer histories')
+    parser.add_argument('--coloring-dir', help='directory of the cached total colorings')
+    parser.add_argument('--profile', default='production', help='solver profile, see toa.traj.profile')
+    parser.add_argument('--screen', action='store_true', help='skip the cases that cannot take off, in closed form')
+    parser.add_argument('--recover', action='store_true', help='retry the failed solves, see solve_with_recovery')
+    parser.add_argument('--budget', type=float, help='time budget in s of the retries of each case')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    options = {key: getattr(args, key) for key in DEFAULT_OPTIONS}
+    for key in ('fleet_dir', 'cache_dir', 'coloring_dir'):
+        if options[key] is not None:
+            options[key] = os.path.abspath(options[key])
+
+    input_format = _format(args.cases, args.input_format)
+    output_format = args.format or (_format(args.output, None) if args.output != '-' else 'jsonl')
+    cases_file = sys.stdin if args.cases == '-' else open(args.cases, newline='')
+    output_file = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+    try:
+        cases = list(read_cases(cases_file, input_format))
+        failed = run_cases(cases, ResultWriter(output_file, output_format), workers=args.workers, options=options)
+    finally:
+        for file in (cases_file, output_file):
+            if file not in (sys.stdin, sys.stdout):
+                file.close()
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
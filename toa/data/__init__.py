@@ -1,2 +1,5 @@
+from toa.data.airplane import Airplane
+from toa.data.reader import AirplaneRegistry
 from toa.data.reader import get_airplane_data
-from toa.data.reader import Airplane
+from toa.data.reader import get_engine_deck
+from toa.data.reader import get_registry
@@ -0,0 +1,223 @@
+import dataclasses
+import typing
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Optional
+
+
+def _convert(kind, value, path):
+    if typing.get_origin(kind) is typing.Union:
+        kind = next(arg for arg in typing.get_args(kind) if arg is not type(None))
+    if dataclasses.is_dataclass(kind):
+        return kind.from_dict(value, f'{path}.')
+    # Only ints are widened to floats, bools are not numbers here
+    accepted = (int, float) if kind is float else kind
+    if isinstance(value, bool) and kind is not bool or not isinstance(value, accepted):
+        raise ValueError(f"Airplane data {path} must be of type {kind.__name__}, got {value!r}")
+    return kind(value)
+
+
+def _slotted(cls):
+    """Recreate a dataclass with __slots__ for its fields, what dataclass(slots=True) does from Python 3.10."""
+    names = tuple(f.name for f in dataclasses.fields(cls))
+    namespace = {key: value for key, value in vars(cls).items() if key not in names + ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+class _Schema:
+    """Builds a frozen dataclass from a dict, checking for missing, unknown and mistyped values."""
+
+    __slots__ = ()
+
+    # Frozen slotted instances are pickled by their field values
+    def __getstate__(self):
+        return [getattr(self, f.name) for f in dataclasses.fields(self)]
+
+    def __setstate__(self, state):
+        for f, value in zip(dataclasses.fields(self), state):
+            object.__setattr__(self, f.name, value)
+
+    @classmethod
+    def from_dict(cls, data, path=''):
+        if not isinstance(data, dict):
+            raise ValueError(f"Airplane data {path.rstrip('.') or cls.__name__} must be a mapping, got {data!r}")
+        fields = {f.name: f for f in dataclasses.fields(cls) if f.init}
+        unknown = sorted(set(data) - set(fields))
+        if unknown:
+            raise ValueError(f"Unknown airplane data {', '.join(f'{path}{name}' for name in unknown)}")
+
+        kwargs = {}
+        for name, f in fields.items():
+            value = data.get(name)
+            if value is None:
+                if f.default is dataclasses.MISSING:
+                    raise ValueError(f"Missing airplane data {path}{name}")
+                continue
+            kwargs[name] = _convert(f.type, value, f'{path}{name}')
+        return cls(**kwargs)
+
+
+def _derive(obj, **values):
+    for name, value in values.items():
+        object.__setattr__(obj, name, value)
+
+
+@_slotted
+@dataclass(frozen=True)
+class Fuselage(_Schema):
+    length: float
+    height: float
+    width: float
+
+
+@_slotted
+@dataclass(frozen=True)
+class Wing(_Schema):
+    """Wing geometry, lengths in m, area in m**2 and sweep angles in deg."""
+
+    area: float
+    span: float
+    mac: float
+    t_c: float
+    sweep_14: Optional[float] = None
+    sweep_12: Optional[float] = None
+    sweep_le: Optional[float] = None
+    sweep: Optional[float] = None
+    aspect_ratio: float = field(init=False)
+
+    def __post_init__(self):
+        _derive(self, aspect_ratio=self.span ** 2 / self.area)
+
+
+@_slotted
+@dataclass(frozen=True)
+class Flap(_Schema):
+    type: str
+    area: float
+    bf_b: float
+    sf_s: float
+    cf_c: float
+    lambda_f: float
+
+
+@_slotted
+@dataclass(frozen=True)
+class Slat(_Schema):
+    cs_c: float
+    bs_b: float
+
+
+@_slotted
+@dataclass(frozen=True)
+class Limits(_Schema):
+    MTOW: float
+
+
+@_slotted
+@dataclass(frozen=True)
+class Engine(_Schema):
+    """Engine data, thrust in N and flat rating in K of ISA deviation. zt is the thrust line height under the CG.
+
+    Without a flat_rating the thrust lapses above the ISA, as flat rated at 0 K. The engine deck id, deck, is only
+    needed by the 'deck' engine model.
+    """
+
+    type: str
+    mount: str
+    num_motors: int
+    name: str
+    max_thrust_sl: float
+    bypass_ratio: float
+    zpos: float
+    cff1: float
+    cff2: float
+    cff3: float
+    flat_rating: Optional[float] = None
+    deck: Optional[str] = None
+    zt: Optional[float] = None
+
+
+@_slotted
+@dataclass(frozen=True)
+class Polar(_Schema):
+    CD0: float
+    k: float
+    e: float
+
+
+@_slotted
+@dataclass(frozen=True)
+class Gear(_Schema):
+    """Landing gear position in m from the CG, x positive aft for the main gear and forward for the nose gear."""
+
+    x: float
+    z: float
+    number: int
+
+
+@_slotted
+@dataclass(frozen=True)
+class LandingGear(_Schema):
+    """Main and nose landing gears, wheelbase and height difference of the main over the nose gear in m.
+
+    The lever arms of the ground reactions in the pitching moment balance are wheelbase + mu * height_offset.
+    """
+
+    main: Gear
+    nose: Gear
+    wheelbase: float = field(init=False)
+    height_offset: float = field(init=False)
+
+    def __post_init__(self):
+        _derive(self, wheelbase=self.main.x + self.nose.x, height_offset=self.main.z - self.nose.z)
+
+
+@_slotted
+@dataclass(frozen=True)
+class Inertia(_Schema):
+    """Pitch moment of inertia in kg*m**2."""
+
+    iy: float
+
+
+@_slotted
+@dataclass(frozen=True)
+class Coeffs(_Schema):
+    """Aerodynamic coefficients, slopes per rad and alpha_max in deg."""
+
+    CL0: float
+    CLa: float
+    CLde: float
+    CLih: float
+    CLq: float
+    Cm0: float
+    Cma: float
+    Cmde: float
+    Cmih: float
+    Cmq: float
+    cla: Optional[float] = None
+    alpha_max: Optional[float] = None
+    CLmax: Optional[float] = None
+
+
+@_slotted
+@dataclass(frozen=True)
+class Airplane(_Schema):
+    """Airplane data, validated when loaded from its YAML file (see get_airplane_data).
+
+    Instances are immutable, hashable and picklable. Optional data is None when missing from the file, the
+    components using it require it.
+    """
+
+    aircraft: str
+    wing: Wing
+    flap: Flap
+    limits: Limits
+    engine: Engine
+    polar: Polar
+    landing_gear: LandingGear
+    inertia: Inertia
+    coeffs: Coeffs
+    fuselage: Optional[Fuselage] = None
+    slat: Optional[Slat] = None
@@ -1,44 +1,185 @@
 import os
+import pickle
+import tempfile
+
 import yaml
 
+from toa.data.airplane import Airplane
+
 DATA_PATH = os.path.join(os.path.dirname(__file__), 'airplanes')
+ENGINE_PATH = os.path.join(os.path.dirname(__file__), 'engines')
 
+# Directory of the parsed airplane sidecars, next to the data files
+SIDECAR_DIR = '__toacache__'
+# Bumped when the Airplane schema changes, so the sidecars of the previous one are not used
+SIDECAR_VERSION = 2
 
-class Airplane:
-    pass
+_LOADER = getattr(yaml, 'CFullLoader', yaml.FullLoader)
 
 
-def dict2obj(item, klss=Airplane):
-    # checking whether object d is a
-    # instance of class list
-    if isinstance(item, list):
-        item = [dict2obj(x) for x in item]
+def _read_yaml(filepath):
+    with open(filepath) as file:
+        return yaml.load(file, Loader=_LOADER)
 
-    # if d is not a instance of dict then
-    # directly object is returned
-    if not isinstance(item, dict):
-        return item
 
-    obj = klss()
+def load_airplane_data(id, datapath):
+    """Load the data file of an airplane or engine id as a dict."""
+    filepath = os.path.join(datapath, f"{id.lower()}.yaml")
+    try:
+        return _read_yaml(filepath)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"There is no data with the following id: {id} ({filepath})") from None
 
-    for k in item:
-        obj.__dict__[k] = dict2obj(item[k])
 
-    return obj
+def _merge(base, overrides):
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
 
 
-def load_airplane_data(id, datapath):
-    """Load airplane's data"""
-    filepath = os.path.join(datapath, f"{id.lower()}.yaml")
+def _fresh(sources):
     try:
-        with open(filepath) as file:
-            data = yaml.full_load(file)
-    except FileNotFoundError:
-        print(f"There is no airplane with the following id: {id}")
-    else:
-        return data
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in sources)
+    except OSError:
+        return False
+
+
+class AirplaneRegistry:
+    """Airplane data files of one or more directories, indexed by id, the file name without extension.
+
+    The later directories take precedence, so a fleet directory can add tail specific variants and override the
+    packaged types. A data file with a base id only holds the data that differs from that id, e.g. the MTOW of a
+    tail. Airplanes are parsed and validated when first requested and cached, in memory and in a pickle sidecar in a
+    __toacache__ directory next to the data file, until the modification time of the file or of its base changes.
+    """
+
+    def __init__(self, *directories, sidecar=True):
+        self.directories = []
+        self.sidecar = sidecar
+        self._index = None
+        self._cache = {}
+        for directory in directories:
+            self.add_directory(directory)
+
+    def add_directory(self, directory):
+        """Add a directory taking precedence over the others, the airplanes parsed so far are parsed again."""
+        if not os.path.isdir(directory):
+            raise FileNotFoundError(f"There is no airplane data directory {directory}")
+        self.directories.append(directory)
+        # The new directory may override an id, or the base of an id, already cached
+        self.clear()
+
+    @property
+    def index(self):
+        """Path of the data file of every id, the directories are scanned on first use without parsing the files."""
+        if self._index is None:
+            index = {}
+            for directory in self.directories:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        stem, extension = os.path.splitext(entry.name)
+                        if extension in ('.yaml', '.yml') and entry.is_file():
+                            index[stem.lower()] = entry.path
+            self._index = index
+        return self._index
+
+    def names(self):
+        return sorted(self.index)
+
+    def __contains__(self, id):
+        return id.lower() in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def path(self, id):
+        try:
+            return self.index[id.lower()]
+        except KeyError:
+            raise FileNotFoundError(f"There is no airplane with the following id: {id}") from None
+
+    def get(self, id):
+        """Return the validated Airplane of an id."""
+        id = id.lower()
+        entry = self._cache.get(id)
+        if entry is None or not _fresh(entry[0]):
+            entry = self._read_sidecar(id)
+            if entry is None:
+                data, sources = self._data(id)
+                entry = (sources, Airplane.from_dict(data))
+                self._write_sidecar(id, entry)
+            self._cache[id] = entry
+        return entry[1]
+
+    def clear(self):
+        """Forget the parsed airplanes and the index, the sidecars are kept."""
+        self._cache.clear()
+        self._index = None
+
+    def _data(self, id, chain=()):
+        if id in chain:
+            raise ValueError(f"Circular airplane base {' -> '.join(chain + (id,))}")
+        path = self.path(id)
+        sources = ((path, os.stat(path).st_mtime_ns),)
+        data = _read_yaml(path)
+        base = data.pop('base', None)
+        if base is not None:
+            base_data, base_sources = self._data(base.lower(), chain + (id,))
+            data = _merge(base_data, data)
+            sources = base_sources + sources
+        return data, sources
+
+    def _sidecar_path(self, id):
+        path = self.path(id)
+        return os.path.join(os.path.dirname(path), SIDECAR_DIR, f'{os.path.basename(path)}.pickle')
+
+    def _read_sidecar(self, id):
+        if not self.sidecar:
+            return None
+        try:
+            with open(self._sidecar_path(id), 'rb') as file:
+                version, sources, airplane = pickle.load(file)
+        except Exception:
+            return None
+        if version != SIDECAR_VERSION or not _fresh(sources) or sources[-1][0] != self.path(id):
+            return None
+        return sources, airplane
+
+    def _write_sidecar(self, id, entry):
+        if not self.sidecar:
+            return
+        filepath = self._sidecar_path(id)
+        try:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            # Written to a temporary file first, so concurrent workers never read a partial sidecar
+            with tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(filepath), delete=False) as file:
+                pickle.dump((SIDECAR_VERSION,) + entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(file.name, filepath)
+        except OSError:
+            # Read-only data directories are parsed on every new process
+            pass
+
+
+_REGISTRIES = {}
+
+
+def get_registry(*directories):
+    """Return the shared AirplaneRegistry of directories, the packaged airplanes by default."""
+    directories = directories or (DATA_PATH,)
+    if directories not in _REGISTRIES:
+        _REGISTRIES[directories] = AirplaneRegistry(*directories)
+    return _REGISTRIES[directories]
 
 
 def get_airplane_data(id, datapath=DATA_PATH):
-    data = load_airplane_data(id, datapath)
-    return dict2obj(data)
+    """Return the validated data of an airplane id, see Airplane and AirplaneRegistry."""
+    return get_registry(datapath).get(id)
+
+
+def get_engine_deck(id, datapath=ENGINE_PATH):
+    """Load the engine deck tables, as a dict, of an engine id."""
+    return load_airplane_data(id, datapath)
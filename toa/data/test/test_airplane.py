@@ -0,0 +1,62 @@
+import dataclasses
+import pickle
+import unittest
+
+from toa.data import Airplane
+from toa.data import get_airplane_data
+from toa.data.reader import DATA_PATH
+from toa.data.reader import load_airplane_data
+
+
+class TestAirplane(unittest.TestCase):
+
+    def test_load(self):
+        for name in ('b734', 'b744'):
+            airplane = get_airplane_data(name)
+            self.assertIsInstance(airplane, Airplane)
+            self.assertEqual(pickle.loads(pickle.dumps(airplane)), airplane)
+            with self.assertRaises(dataclasses.FrozenInstanceError):
+                airplane.wing.area = 1.0
+
+        airplane = get_airplane_data('b734')
+        self.assertIsInstance(airplane.engine.num_motors, int)
+        self.assertAlmostEqual(airplane.wing.aspect_ratio, airplane.wing.span ** 2 / airplane.wing.area)
+        self.assertAlmostEqual(airplane.landing_gear.wheelbase, 1.5 + 12.77)
+        self.assertAlmostEqual(airplane.landing_gear.height_offset, 0.0)
+        self.assertIsNone(get_airplane_data('b744').slat)
+
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            get_airplane_data('a380')
+
+    def test_validation(self):
+        data = load_airplane_data('b734', DATA_PATH)
+        data['wing']['spans'] = data['wing'].pop('span')
+        with self.assertRaisesRegex(ValueError, 'wing.span'):
+            Airplane.from_dict(data)
+
+        data = load_airplane_data('b734', DATA_PATH)
+        data['landing_gear']['main']['x'] = 'aft'
+        with self.assertRaisesRegex(ValueError, 'landing_gear.main.x'):
+            Airplane.from_dict(data)
+
+        for section, key, value in (('engine', 'name', 3), ('wing', 'area', True), ('engine', 'num_motors', 2.0)):
+            data = load_airplane_data('b734', DATA_PATH)
+            data[section][key] = value
+            with self.assertRaisesRegex(ValueError, f'{section}.{key}'):
+                Airplane.from_dict(data)
+
+    def test_optional_engine_data(self):
+        data = load_airplane_data('b734', DATA_PATH)
+        del data['engine']['flat_rating'], data['engine']['deck']
+        data['wing']['span'] = 29
+
+        airplane = Airplane.from_dict(data)
+        self.assertIsNone(airplane.engine.flat_rating)
+        self.assertIsNone(airplane.engine.deck)
+        self.assertIsInstance(airplane.wing.span, float)
+        self.assertNotIn('__dict__', dir(airplane))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from toa.data import AirplaneRegistry
+from toa.data import reader
+from toa.data.reader import DATA_PATH
+
+
+class TestAirplaneRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.fleet = self.tmp.name
+        with open(os.path.join(self.fleet, 'b734-pr-abc.yaml'), 'w') as file:
+            file.write("base: b734\naircraft: Boeing 737-400 PR-ABC\nlimits:\n  MTOW: 65000\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_fleet_variant(self):
+        registry = AirplaneRegistry(DATA_PATH, self.fleet, sidecar=False)
+        self.assertIn('B734-PR-ABC', registry)
+        self.assertEqual(registry.names(), ['b734', 'b734-pr-abc', 'b744'])
+
+        variant = registry.get('b734-pr-abc')
+        self.assertEqual(variant.limits.MTOW, 65000)
+        self.assertEqual(variant.wing, registry.get('b734').wing)
+        self.assertIs(registry.get('b734-pr-abc'), variant)
+        with self.assertRaises(FileNotFoundError):
+            registry.get('a380')
+
+    def test_override_directory(self):
+        registry = AirplaneRegistry(DATA_PATH, self.fleet, sidecar=False)
+        self.assertEqual(registry.get('b734').fuselage.length, 33.4)
+        self.assertEqual(registry.get('b734-pr-abc').fuselage.length, 33.4)
+
+        with tempfile.TemporaryDirectory() as override:
+            with open(os.path.join(DATA_PATH, 'b734.yaml')) as source, \
+                    open(os.path.join(override, 'b734.yaml'), 'w') as file:
+                file.write(source.read().replace('length: 33.40', 'length: 36.40'))
+            registry.add_directory(override)
+
+            # Both the overridden id and the variant based on it come from the new directory
+            self.assertEqual(registry.get('b734').fuselage.length, 36.4)
+            self.assertEqual(registry.get('b734-pr-abc').fuselage.length, 36.4)
+
+    def test_sidecar(self):
+        variant = AirplaneRegistry(DATA_PATH, self.fleet).get('b734-pr-abc')
+        self.assertTrue(os.path.exists(os.path.join(self.fleet, reader.SIDECAR_DIR, 'b734-pr-abc.yaml.pickle')))
+
+        with mock.patch.object(reader, '_read_yaml', wraps=reader._read_yaml) as read_yaml:
+            self.assertEqual(AirplaneRegistry(DATA_PATH, self.fleet).get('b734-pr-abc'), variant)
+            read_yaml.assert_not_called()
+
+            # A modified data file invalidates its sidecar
+            path = os.path.join(self.fleet, 'b734-pr-abc.yaml')
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+            AirplaneRegistry(DATA_PATH, self.fleet).get('b734-pr-abc')
+            self.assertTrue(read_yaml.called)
+
+
+if __name__ == '__main__':
+    unittest.main()
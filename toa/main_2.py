@@ -1,5 +1,4 @@
 
-import matplotlib.pyplot as plt
 from toa.data import get_airplane_data
 from toa.runway import Runway
 from toa.traj.aeo_poli import run_takeoff
@@ -24,16 +24,23 @@ class AerodynamicsGroup(om.Group):
         self.options.declare('landing_gear', default=True,
                              desc='Accounts landing gear drag')
         self.options.declare('AllWheelsOnGround', default=True)
+        self.options.declare('coloring_report', types=bool, default=True,
+                             desc='Prints the partial coloring summary and sparsity')
+        self.options.declare('high_lift', types=bool, default=True,
+                             desc='Computes CL0, CLa, CLmax and alpha_max from flap_angle, they are inputs otherwise')
 
     def setup(self):
         nn = self.options['num_nodes']
         airplane = self.options['airplane']
         landing_gear = self.options['landing_gear']
         all_wheels_on_ground = self.options['AllWheelsOnGround']
+        high_lift = self.options['high_lift']
+        high_lift_inputs = [] if high_lift else ['CL0', 'CLa']
 
-        self.add_subsystem(name='flap_slat',
-                           subsys=FlapSlatComp(airplane=airplane),
-                           promotes_inputs=['flap_angle'], promotes_outputs=['CLmax'])
+        if high_lift:
+            self.add_subsystem(name='flap_slat',
+                               subsys=FlapSlatComp(airplane=airplane),
+                               promotes_inputs=['flap_angle'], promotes_outputs=['CLmax'])
 
         self.add_subsystem(name='ground_effect', subsys=GroundEffectComp(num_nodes=nn, airplane=airplane))
 
@@ -41,7 +48,7 @@ class AerodynamicsGroup(om.Group):
             self.add_subsystem(name='cl_comp',
                                subsys=LiftCoeffAllWheelsOnGroundComp(num_nodes=nn,
                                                                      airplane=airplane),
-                               promotes_inputs=['alpha', 'de', 'dih'],
+                               promotes_inputs=['alpha', 'de', 'dih'] + high_lift_inputs,
                                promotes_outputs=['CL'])
             self.add_subsystem(name='cm_comp',
                                subsys=MomentCoeffAllWheelsOnGroundComp(num_nodes=nn,
@@ -51,33 +58,40 @@ class AerodynamicsGroup(om.Group):
         else:
             self.add_subsystem(name='cl_comp',
                                subsys=LiftCoeffComp(num_nodes=nn, airplane=airplane),
-                               promotes_inputs=['alpha', 'de', 'tas', 'q', 'dih'],
+                               promotes_inputs=['alpha', 'de', 'tas', 'q', 'dih'] + high_lift_inputs,
                                promotes_outputs=['CL'])
             self.add_subsystem(name='cm_comp',
                                subsys=MomentCoeffComp(num_nodes=nn, airplane=airplane),
                                promotes_inputs=['alpha', 'de', 'tas', 'q', 'dih'],
                                promotes_outputs=['Cm'])
 
-        self.connect('flap_slat.CL0', 'cl_comp.CL0')
-        self.connect('flap_slat.CLa', 'cl_comp.CLa')
+        if high_lift:
+            self.connect('flap_slat.CL0', 'cl_comp.CL0')
+            self.connect('flap_slat.CLa', 'cl_comp.CLa')
 
         self.add_subsystem(name="alpha_lim",
                            subsys=om.ExecComp('alphadiff=amax-alpha', alphadiff={'value': np.ones(nn), 'units': 'rad'},
                                               amax={'value': 0.0, 'units': 'rad'},
                                               alpha={'value': np.zeros(nn), 'units': 'rad'}),
-                           promotes_inputs=['alpha'])
-        self.connect('flap_slat.alpha_max', 'alpha_lim.amax')
+                           promotes_inputs=['alpha'] + ([] if high_lift else [('amax', 'alpha_max')]))
 
         self.add_subsystem(name='cl_ground_corr', subsys=LiftCoeffGroundCorrectionComp(num_nodes=nn),
-                           promotes_inputs=['CL'])
+                           promotes_inputs=['CL'] if high_lift else ['CL', 'CLa'])
 
         self.connect('ground_effect.CLag', 'cl_ground_corr.CLag')
         self.connect('ground_effect.dalpha_zero', 'cl_ground_corr.dalpha_zero')
-        self.connect('flap_slat.CLa', 'cl_ground_corr.CLa')
+
+        if high_lift:
+            self.connect('flap_slat.alpha_max', 'alpha_lim.amax')
+            self.connect('flap_slat.CLa', 'cl_ground_corr.CLa')
+        else:
+            self.set_input_defaults('CLa', val=airplane.coeffs.CLa, units='1/rad')
+            self.set_input_defaults('alpha_max', val=airplane.coeffs.alpha_max, units='deg')
 
         self.add_subsystem(name='cd_comp',
                            subsys=DragCoeffComp(num_nodes=nn, airplane=airplane,
-                                                landing_gear=landing_gear, partial_coloring=True),
+                                                landing_gear=landing_gear, partial_coloring=True,
+                                                coloring_report=self.options['coloring_report']),
                            promotes_inputs=['flap_angle', 'grav', 'mass'],
                            promotes_outputs=['CD'])
 
@@ -13,6 +13,8 @@ class DragCoeffComp(om.ExplicitComponent):
                              desc='Class containing all  data')
         self.options.declare('landing_gear', types=bool, default=True)
         self.options.declare('partial_coloring', types=bool, default=False)
+        self.options.declare('coloring_report', types=bool, default=True,
+                             desc='Prints the partial coloring summary and sparsity')
 
     def setup(self):
         nn = self.options['num_nodes']
@@ -29,8 +31,10 @@ class DragCoeffComp(om.ExplicitComponent):
         self.declare_partials(of='CD', wrt=['*'], method='fd')
 
         if self.options['partial_coloring']:
+            coloring_report = self.options['coloring_report']
             self.declare_coloring(wrt=['*'], method='fd', tol=1.0E-6, num_full_jacs=2,
-                                  show_summary=True, show_sparsity=True, min_improve_pct=10.)
+                                  show_summary=coloring_report, show_sparsity=coloring_report,
+                                  min_improve_pct=10.)
 
     def compute(self, inputs, outputs, **kwargs):
         fa = inputs['flap_angle']
@@ -56,7 +60,7 @@ class DragCoeffComp(om.ExplicitComponent):
         else:
             delta_e_flap = 0.0026 * fa / degree
 
-        ar = ap.wing.span ** 2 / ap.wing.area
+        ar = ap.wing.aspect_ratio
 
         k_total = 1 / (1 / ap.polar.k + np.pi * ar * delta_e_flap)
 
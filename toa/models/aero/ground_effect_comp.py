@@ -38,7 +38,7 @@ class GroundEffectComp(om.ExplicitComponent):
         # CLalpha
         ar_areff_initial = interp1d(ar_areff_x, ar_areff_y, kind='cubic', fill_value='extrapolate')(2 * h_b)
         ar_areff = np.where(ar_areff_initial > 2, 1, ar_areff_initial)
-        ar = airplane.wing.span ** 2 / airplane.wing.area
+        ar = airplane.wing.aspect_ratio
         areff = ar / ar_areff
         beta = 1
         kaff = airplane.coeffs.cla / (2 * np.pi)
@@ -0,0 +1,37 @@
+import numpy as np
+
+# ISA sea level conditions and troposphere lapse rate
+T0 = 288.15
+P0 = 101325.0
+LAPSE_RATE = 0.0065
+R_AIR = 287.05287
+GAMMA = 1.4
+GRAV = 9.80665
+# Exponent of the pressure ratio in the troposphere, p / P0 = (T / T0) ** N
+N = GRAV / (R_AIR * LAPSE_RATE)
+
+
+def atmosphere(elevation, isa_deviation=0.0, qnh=P0):
+    """Return the pressure (Pa), temperature (K), density (kg/m**3), speed of sound (m/s) and pressure altitude (m)
+    at an elevation in m, for a temperature deviation from the ISA in K and a QNH in Pa.
+
+    The QNH is the sea level pressure reducing the station pressure along the ISA, so the station pressure is the
+    ISA pressure at the elevation scaled by QNH / P0. The temperature is the ISA temperature at the pressure altitude
+    plus the deviation. Only the troposphere is modelled, which covers every airport.
+    """
+    pres = qnh * (1 - LAPSE_RATE * elevation / T0) ** N
+    temp_isa = T0 * (pres / P0) ** (1 / N)
+    temp = temp_isa + isa_deviation
+    return {
+        'pres': pres,
+        'temp': temp,
+        'rho': pres / (R_AIR * temp),
+        'sos': np.sqrt(GAMMA * R_AIR * temp),
+        'pressure_altitude': (T0 - temp_isa) / LAPSE_RATE,
+        }
+
+
+def isa_deviation(oat, elevation=0.0, qnh=P0):
+    """Return the deviation from the ISA in K of an outside air temperature in degC."""
+    temp_isa = atmosphere(elevation, qnh=qnh)['temp']
+    return oat + 273.15 - temp_isa
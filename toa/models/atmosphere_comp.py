@@ -0,0 +1,65 @@
+import numpy as np
+import openmdao.api as om
+
+from toa.models.atmosphere import GAMMA
+from toa.models.atmosphere import LAPSE_RATE
+from toa.models.atmosphere import N
+from toa.models.atmosphere import P0
+from toa.models.atmosphere import R_AIR
+from toa.models.atmosphere import T0
+from toa.models.atmosphere import atmosphere
+
+
+class AtmosphereComp(om.ExplicitComponent):
+    """Computes the atmosphere on the runway from its elevation, the ISA deviation and the QNH, see atmosphere."""
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int, default=1)
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        ar = np.arange(nn)
+
+        self.add_input(name='elevation', val=np.zeros(nn), desc='Runway elevation', units='m')
+        self.add_input(name='isa_deviation', val=np.zeros(nn), desc='Temperature deviation from the ISA', units='K')
+        self.add_input(name='qnh', val=P0 * np.ones(nn), desc='Sea level pressure along the ISA', units='Pa')
+
+        self.add_output(name='pres', val=P0 * np.ones(nn), desc='Atmospheric pressure', units='Pa')
+        self.add_output(name='temp', val=T0 * np.ones(nn), desc='Atmospheric temperature', units='K')
+        self.add_output(name='rho', val=np.ones(nn), desc='Atmospheric density', units='kg/m**3')
+        self.add_output(name='sos', val=np.ones(nn), desc='Atmospheric speed of sound', units='m/s')
+        self.add_output(name='pressure_altitude', val=np.zeros(nn), desc='Pressure altitude', units='m')
+
+        self.declare_partials(of=['pres', 'temp', 'rho', 'sos', 'pressure_altitude'], wrt=['elevation', 'qnh'],
+                              rows=ar, cols=ar)
+        self.declare_partials(of='temp', wrt='isa_deviation', rows=ar, cols=ar, val=1.0)
+        self.declare_partials(of=['rho', 'sos'], wrt='isa_deviation', rows=ar, cols=ar)
+
+    def compute(self, inputs, outputs, **kwargs):
+        for name, value in atmosphere(inputs['elevation'], inputs['isa_deviation'], inputs['qnh']).items():
+            outputs[name] = value
+
+    def compute_partials(self, inputs, partials, **kwargs):
+        elevation = inputs['elevation']
+        qnh = inputs['qnh']
+        atmos = atmosphere(elevation, inputs['isa_deviation'], qnh)
+        pres = atmos['pres']
+        temp = atmos['temp']
+        sos = atmos['sos']
+
+        theta = 1 - LAPSE_RATE * elevation / T0
+        dpres = {'elevation': -qnh * N * theta ** (N - 1) * LAPSE_RATE / T0, 'qnh': theta ** N}
+        # Derivatives with respect to the pressure
+        dtemp_dp = (atmos['temp'] - inputs['isa_deviation']) / (N * pres)
+        drho_dp = 1 / (R_AIR * temp) - pres / (R_AIR * temp ** 2) * dtemp_dp
+        dsos_dtemp = GAMMA * R_AIR / (2 * sos)
+
+        for wrt, dp in dpres.items():
+            partials['pres', wrt] = dp
+            partials['temp', wrt] = dtemp_dp * dp
+            partials['rho', wrt] = drho_dp * dp
+            partials['sos', wrt] = dsos_dtemp * dtemp_dp * dp
+            partials['pressure_altitude', wrt] = -dtemp_dp * dp / LAPSE_RATE
+
+        partials['rho', 'isa_deviation'] = -pres / (R_AIR * temp ** 2)
+        partials['sos', 'isa_deviation'] = dsos_dtemp
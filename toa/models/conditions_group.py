@@ -0,0 +1,38 @@
+import openmdao.api as om
+
+from toa.data import Airplane
+from toa.models.aero.flap_slat_comp import FlapSlatComp
+from toa.models.atmosphere import P0
+from toa.models.atmosphere_comp import AtmosphereComp
+
+# Outputs of TakeoffConditionsGroup feeding the phase ODEs built with shared_conditions
+ATMOSPHERE = ('rho', 'sos', 'p_amb')
+HIGH_LIFT = ('CL0', 'CLa', 'CLmax', 'alpha_max')
+
+
+class TakeoffConditionsGroup(om.Group):
+    """Computes the runway atmosphere, for an ISA deviation and a QNH, and the high lift data of the flap deflection.
+
+    Both only depend on static trajectory parameters, so they are computed once for the whole trajectory instead
+    of in every phase ODE.
+    """
+
+    def initialize(self):
+        self.options.declare('airplane', types=Airplane,
+                             desc='Class containing all airplane data')
+
+    def setup(self):
+        airplane = self.options['airplane']
+
+        settings = self.add_subsystem(name='settings', subsys=om.IndepVarComp(), promotes_outputs=['*'])
+        settings.add_output('elevation', val=0.0, units='m', desc='Runway elevation')
+        settings.add_output('isa_deviation', val=0.0, units='K', desc='Temperature deviation from the ISA')
+        settings.add_output('qnh', val=P0, units='Pa', desc='Sea level pressure along the ISA')
+        settings.add_output('flap_angle', val=0.0, units='deg', desc='Flap deflection')
+
+        self.add_subsystem(name='atmos', subsys=AtmosphereComp(num_nodes=1),
+                           promotes_inputs=['elevation', 'isa_deviation', 'qnh'],
+                           promotes_outputs=['rho', 'sos', ('pres', 'p_amb'), 'pressure_altitude'])
+
+        self.add_subsystem(name='flap_slat', subsys=FlapSlatComp(airplane=airplane),
+                           promotes_inputs=['flap_angle'], promotes_outputs=list(HIGH_LIFT))
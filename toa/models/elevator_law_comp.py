@@ -0,0 +1,115 @@
+import numpy as np
+import openmdao.api as om
+
+
+class ElevatorKnotsComp(om.ExplicitComponent):
+    """Computes the elevator deflection as a piecewise linear function of the phase time.
+
+    The knots are evenly spaced along the phase. They are read from a vector shared by all phases, starting at
+    offset, so consecutive phases sharing their boundary knot have a continuous deflection.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+        self.options.declare('num_knots', types=int, default=3, desc='Number of knots in the phase')
+        self.options.declare('offset', types=int, default=0, desc='Index of the first phase knot in de_knots')
+        self.options.declare('total_knots', types=int, default=None, allow_none=True,
+                             desc='Size of the shared knot vector, num_knots + offset by default')
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        nk = self.options['num_knots']
+        offset = self.options['offset']
+        total = self.options['total_knots'] or nk + offset
+        ar = np.arange(nn)
+
+        self.add_input(name='t_phase', shape=(nn,), desc='Elapsed time of the phase', units='s')
+        self.add_input(name='t_duration', val=1.0, desc='Duration of the phase', units='s')
+        self.add_input(name='de_knots', shape=(total,), desc='Elevator deflection at the knots', units='deg')
+
+        self.add_output(name='de', val=np.zeros(nn), desc='Elevator deflection', units='deg')
+
+        self.declare_partials(of='de', wrt='t_phase', rows=ar, cols=ar)
+        self.declare_partials(of='de', wrt='t_duration', rows=ar, cols=np.zeros(nn))
+        self.declare_partials(of='de', wrt='de_knots', rows=np.repeat(ar, nk),
+                              cols=np.tile(offset + np.arange(nk), nn))
+
+    def _interval(self, inputs):
+        nk = self.options['num_knots']
+        offset = self.options['offset']
+        knots = inputs['de_knots'][offset:offset + nk]
+        s = inputs['t_phase'] / inputs['t_duration'] * (nk - 1)
+        i = np.clip(np.floor(s.real).astype(int), 0, nk - 2)
+        return knots, s, i, s - i
+
+    def compute(self, inputs, outputs, **kwargs):
+        knots, s, i, w = self._interval(inputs)
+
+        outputs['de'] = knots[i] * (1 - w) + knots[i + 1] * w
+
+    def compute_partials(self, inputs, partials, **kwargs):
+        nn = self.options['num_nodes']
+        nk = self.options['num_knots']
+        knots, s, i, w = self._interval(inputs)
+        slope = knots[i + 1] - knots[i]
+
+        partials['de', 't_phase'] = slope * (nk - 1) / inputs['t_duration']
+        partials['de', 't_duration'] = -slope * s / inputs['t_duration']
+
+        dde_dknots = np.zeros((nn, nk))
+        dde_dknots[np.arange(nn), i] = 1 - w
+        dde_dknots[np.arange(nn), i + 1] = w
+        partials['de', 'de_knots'] = dde_dknots.ravel()
+
+
+class ElevatorRateLawComp(om.ExplicitComponent):
+    """Computes the elevator deflection of a pitch rate law, de = de_trim - de_gain * (q_cmd - q).
+
+    Nose up deflections are negative, so a pitch rate below the commanded one increases the nose up deflection.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+        self.options.declare('q_cmd', default=3.0, desc='Commanded pitch rate in deg/s')
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        ar = np.arange(nn)
+        zz = np.zeros(nn)
+
+        self.add_input(name='q', shape=(nn,), desc='Pitch rate', units='deg/s')
+        self.add_input(name='de_trim', val=0.0, desc='Elevator deflection at the commanded pitch rate',
+                       units='deg')
+        self.add_input(name='de_gain', val=1.0, desc='Elevator deflection per pitch rate error', units='s')
+
+        self.add_output(name='de', val=np.zeros(nn), desc='Elevator deflection', units='deg')
+
+        self.declare_partials(of='de', wrt='q', rows=ar, cols=ar)
+        self.declare_partials(of='de', wrt='de_trim', rows=ar, cols=zz, val=1.0)
+        self.declare_partials(of='de', wrt='de_gain', rows=ar, cols=zz)
+
+    def compute(self, inputs, outputs, **kwargs):
+        q_cmd = self.options['q_cmd']
+
+        outputs['de'] = inputs['de_trim'] - inputs['de_gain'] * (q_cmd - inputs['q'])
+
+    def compute_partials(self, inputs, partials, **kwargs):
+        q_cmd = self.options['q_cmd']
+
+        partials['de', 'q'] = inputs['de_gain']
+        partials['de', 'de_gain'] = inputs['q'] - q_cmd
+
+
+ELEVATOR_LAWS = {
+    'knots': ElevatorKnotsComp,
+    'rate': ElevatorRateLawComp,
+    }
+
+
+def elevator_law_comp(num_nodes, law):
+    """Return the component of an elevator law given as a dict with its name ('knots' or 'rate') and options."""
+    options = dict(law)
+    name = options.pop('law')
+    if name not in ELEVATOR_LAWS:
+        raise ValueError(f"Unknown elevator law '{name}', expected one of {sorted(ELEVATOR_LAWS)}")
+    return ELEVATOR_LAWS[name](num_nodes=num_nodes, **options)
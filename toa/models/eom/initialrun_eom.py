@@ -30,6 +30,7 @@ class InitialRunEOM(om.ExplicitComponent):
                        units='m/s')
         self.add_input(name='mass', val=ones, desc='Airplane mass', units='kg')
         self.add_input(name='rw_slope', val=0.0, desc='Runway slope', units='rad')
+        self.add_input(name='mu', val=0.025, desc='Rolling friction coefficient', units=None)
         self.add_input(name='grav', val=0.0, desc='Gravity acceleration',
                        units='m/s**2')
         self.add_input(name='alpha', val=ones, desc='Angle of attack', units='rad')
@@ -52,6 +53,7 @@ class InitialRunEOM(om.ExplicitComponent):
         self.declare_partials(of='v_dot', wrt='grav', rows=ar, cols=zz)
         self.declare_partials(of='v_dot', wrt='lift', rows=ar, cols=ar)
         self.declare_partials(of='v_dot', wrt='rw_slope', rows=ar, cols=zz)
+        self.declare_partials(of='v_dot', wrt='mu', rows=ar, cols=zz)
 
         self.declare_partials(of='x_dot', wrt='V', rows=ar, cols=ar, val=1.0)
 
@@ -61,6 +63,7 @@ class InitialRunEOM(om.ExplicitComponent):
         self.declare_partials(of='f_ng', wrt='mass', rows=ar, cols=ar)
         self.declare_partials(of='f_ng', wrt='grav', rows=ar, cols=zz)
         self.declare_partials(of='f_ng', wrt='rw_slope', rows=ar, cols=zz)
+        self.declare_partials(of='f_ng', wrt='mu', rows=ar, cols=zz)
 
         self.declare_partials(of='f_mg', wrt='thrust', rows=ar, cols=ar)
         self.declare_partials(of='f_mg', wrt='lift', rows=ar, cols=ar)
@@ -68,6 +71,7 @@ class InitialRunEOM(om.ExplicitComponent):
         self.declare_partials(of='f_mg', wrt='mass', rows=ar, cols=ar)
         self.declare_partials(of='f_mg', wrt='grav', rows=ar, cols=zz)
         self.declare_partials(of='f_mg', wrt='rw_slope', rows=ar, cols=zz)
+        self.declare_partials(of='f_mg', wrt='mu', rows=ar, cols=zz)
 
     def compute(self, inputs, outputs, **kwargs):
         thrust = inputs['thrust']
@@ -81,20 +85,22 @@ class InitialRunEOM(om.ExplicitComponent):
         alpha = inputs['alpha']
         airplane = self.options['airplane']
 
-        mu = 0.025
+        mu = inputs['mu']
 
-        xmg = airplane.landing_gear.main.x
-        xng = airplane.landing_gear.nose.x
-        zm = airplane.landing_gear.main.z
-        zn = airplane.landing_gear.nose.z
+        gear = airplane.landing_gear
+        xmg = gear.main.x
+        xng = gear.nose.x
+        zm = gear.main.z
+        zn = gear.nose.z
         zt = airplane.engine.zt
+        den = mu * gear.height_offset + gear.wheelbase
         weight = mass * grav
         cosslope = np.cos(rw_slope)
         sinslope = np.sin(rw_slope)
         cosalpha = np.cos(alpha)
 
-        f_ng = (- moment - thrust * zt + (xmg + mu * zm) * (weight * cosslope - lift)) / (mu * (zm - zn) + xmg + xng)
-        f_mg = (moment + thrust * zt + (xng - mu * zn) * (weight * cosslope - lift)) / (mu * (zm - zn) + xmg + xng)
+        f_ng = (- moment - thrust * zt + (xmg + mu * zm) * (weight * cosslope - lift)) / den
+        f_mg = (moment + thrust * zt + (xng - mu * zn) * (weight * cosslope - lift)) / den
 
         f_rr = mu * (f_mg + f_ng)
 
@@ -113,12 +119,14 @@ class InitialRunEOM(om.ExplicitComponent):
         rw_slope = inputs['rw_slope']
         grav = inputs['grav']
 
-        xmg = airplane.landing_gear.main.x
-        xng = airplane.landing_gear.nose.x
-        zm = airplane.landing_gear.main.z
-        zn = airplane.landing_gear.nose.z
+        gear = airplane.landing_gear
+        xmg = gear.main.x
+        xng = gear.nose.x
+        zm = gear.main.z
+        zn = gear.nose.z
         zt = airplane.engine.zt
-        mu = 0.025
+        mu = inputs['mu']
+        den = mu * gear.height_offset + gear.wheelbase
 
         cosalpha = np.cos(alpha)
         sinalpha = np.sin(alpha)
@@ -133,19 +141,27 @@ class InitialRunEOM(om.ExplicitComponent):
         partials['v_dot', 'lift'] = mu/mass
         partials['v_dot', 'rw_slope'] = grav*(mu*sinslope - cosslope)
 
-        partials['f_ng', 'thrust'] = -zt/(mu*zm - mu*zn + xmg + xng)
-        partials['f_ng', 'lift'] = -(mu*zm + xmg)/(mu*zm - mu*zn + xmg + xng)
-        partials['f_ng', 'moment'] = -1/(mu*zm - mu*zn + xmg + xng)
-        partials['f_ng', 'mass'] = grav*(mu*zm + xmg)*cosslope/(mu*zm - mu*zn + xmg + xng)
-        partials['f_ng', 'grav'] = mass*(mu*zm + xmg)*cosslope/(mu*zm - mu*zn + xmg + xng)
-        partials['f_ng', 'rw_slope'] = -grav*mass*(mu*zm + xmg)*sinslope/(mu*zm - mu*zn + xmg + xng)
-
-        partials['f_mg', 'thrust'] = zt/(mu*zm - mu*zn + xmg + xng)
-        partials['f_mg', 'lift'] = (mu*zn - xng)/(mu*zm - mu*zn + xmg + xng)
-        partials['f_mg', 'moment'] = 1/(mu*zm - mu*zn + xmg + xng)
-        partials['f_mg', 'mass'] = grav*(-mu*zn + xng)*cosslope/(mu*zm - mu*zn + xmg + xng)
-        partials['f_mg', 'grav'] = mass*(-mu*zn + xng)*cosslope/(mu*zm - mu*zn + xmg + xng)
-        partials['f_mg', 'rw_slope'] = grav*mass*(mu*zn - xng)*sinslope/(mu*zm - mu*zn + xmg + xng)
+        partials['f_ng', 'thrust'] = -zt/den
+        partials['f_ng', 'lift'] = -(mu*zm + xmg)/den
+        partials['f_ng', 'moment'] = -1/den
+        partials['f_ng', 'mass'] = grav*(mu*zm + xmg)*cosslope/den
+        partials['f_ng', 'grav'] = mass*(mu*zm + xmg)*cosslope/den
+        partials['f_ng', 'rw_slope'] = -grav*mass*(mu*zm + xmg)*sinslope/den
+
+        partials['f_mg', 'thrust'] = zt/den
+        partials['f_mg', 'lift'] = (mu*zn - xng)/den
+        partials['f_mg', 'moment'] = 1/den
+        partials['f_mg', 'mass'] = grav*(-mu*zn + xng)*cosslope/den
+        partials['f_mg', 'grav'] = mass*(-mu*zn + xng)*cosslope/den
+        partials['f_mg', 'rw_slope'] = grav*mass*(mu*zn - xng)*sinslope/den
+
+        moment = inputs['moment']
+        f_wheels = grav*mass*cosslope - lift
+        f_ng = (-moment - thrust*zt + (xmg + mu*zm)*f_wheels)/den
+        f_mg = (moment + thrust*zt + (xng - mu*zn)*f_wheels)/den
+        partials['v_dot', 'mu'] = -f_wheels/mass
+        partials['f_ng', 'mu'] = (zm*f_wheels - f_ng*gear.height_offset)/den
+        partials['f_mg', 'mu'] = (-zn*f_wheels - f_mg*gear.height_offset)/den
 
 if __name__ == '__main__':
     prob = om.Problem()
@@ -33,6 +33,7 @@ class RotationEOM(om.ExplicitComponent):
                        units='rad')
         self.add_input(name='q', val=ones, desc='Pitch rate', units='rad/s')
         self.add_input(name='rw_slope', val=0.0, desc='Runway slope', units='rad')
+        self.add_input(name='mu', val=0.025, desc='Rolling friction coefficient', units=None)
         self.add_input(name='grav', val=0.0, desc='Gravity acceleration',
                        units='m/s**2')
 
@@ -56,6 +57,7 @@ class RotationEOM(om.ExplicitComponent):
         self.declare_partials(of='v_dot', wrt='grav', rows=ar, cols=zz)
         self.declare_partials(of='v_dot', wrt='lift', rows=ar, cols=ar)
         self.declare_partials(of='v_dot', wrt='rw_slope', rows=ar, cols=zz)
+        self.declare_partials(of='v_dot', wrt='mu', rows=ar, cols=zz)
 
         self.declare_partials(of='x_dot', wrt='V', rows=ar, cols=ar, val=1.0)
         self.declare_partials(of='x_dot', wrt='alpha', rows=ar, cols=ar)
@@ -70,6 +72,7 @@ class RotationEOM(om.ExplicitComponent):
         self.declare_partials(of='q_dot', wrt='grav', rows=ar, cols=zz)
         self.declare_partials(of='q_dot', wrt='lift', rows=ar, cols=ar)
         self.declare_partials(of='q_dot', wrt='rw_slope', rows=ar, cols=zz)
+        self.declare_partials(of='q_dot', wrt='mu', rows=ar, cols=zz)
 
         self.declare_partials(of='theta_dot', wrt='q', rows=ar, cols=ar, val=1.0)
 
@@ -92,7 +95,7 @@ class RotationEOM(om.ExplicitComponent):
         rw_slope = inputs['rw_slope']
         airplane = self.options['airplane']
 
-        mu = 0.025
+        mu = inputs['mu']
         xmg = airplane.landing_gear.main.x
         zm = airplane.landing_gear.main.z
         zt = airplane.engine.zt
@@ -124,7 +127,7 @@ class RotationEOM(om.ExplicitComponent):
         grav = inputs['grav']
         q = inputs['q']
 
-        mu = 0.025
+        mu = inputs['mu']
         xmg = airplane.landing_gear.main.x
         zm = airplane.landing_gear.main.z
         zt = airplane.engine.zt
@@ -154,6 +157,10 @@ class RotationEOM(om.ExplicitComponent):
         partials['q_dot', 'lift'] = (mu*zm + xmg) / airplane.inertia.iy
         partials['q_dot', 'rw_slope'] = grav*mass*(mu*zm + xmg)*sinslope / airplane.inertia.iy
 
+        f_mg = grav * mass * cosslope - lift
+        partials['v_dot', 'mu'] = -f_mg / mass
+        partials['q_dot', 'mu'] = -f_mg * zm / airplane.inertia.iy
+
         partials['f_mg', 'mass'] = grav * cosslope
         partials['f_mg', 'grav'] = mass * cosslope
         partials['f_mg', 'rw_slope'] = -grav * mass * sinslope
@@ -0,0 +1,58 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from dymos.utils.testing_utils import assert_check_partials
+
+from toa.data import get_airplane_data
+from toa.models.eom.initialrun_eom import InitialRunEOM
+from toa.models.eom.rotation_eom import RotationEOM
+from toa.runway import Runway
+from toa.runway import get_runway_condition
+
+
+def _problem(eom_class, mu):
+    n = 4
+    p = om.Problem()
+    p.model.add_subsystem('eom', eom_class(num_nodes=n, airplane=get_airplane_data('b734')))
+    p.setup(force_alloc_complex=True)
+    p.set_val('eom.thrust', np.linspace(180e3, 170e3, n))
+    p.set_val('eom.lift', np.linspace(0.0, 500e3, n))
+    p.set_val('eom.drag', np.linspace(0.0, 20e3, n))
+    p.set_val('eom.moment', np.linspace(-1e5, 1e5, n))
+    p.set_val('eom.V', np.linspace(1.0, 70.0, n))
+    p.set_val('eom.mass', 60000.0)
+    p.set_val('eom.alpha', np.linspace(0.0, 0.1, n))
+    p.set_val('eom.rw_slope', 0.01)
+    p.set_val('eom.grav', 9.80665)
+    p.set_val('eom.mu', mu)
+    if eom_class is RotationEOM:
+        p.set_val('eom.q', np.linspace(0.0, 0.05, n))
+    p.run_model()
+    return p
+
+
+class TestFriction(unittest.TestCase):
+
+    def test_partials(self):
+        for eom_class in (InitialRunEOM, RotationEOM):
+            with self.subTest(eom=eom_class.__name__):
+                cpd = _problem(eom_class, mu=0.05).check_partials(method='cs', out_stream=None)
+                assert_check_partials(cpd, atol=1.0E-6, rtol=1.0E-6)
+
+    def test_friction_decelerates(self):
+        for eom_class in (InitialRunEOM, RotationEOM):
+            with self.subTest(eom=eom_class.__name__):
+                dry = _problem(eom_class, mu=get_runway_condition('dry').mu).get_val('eom.v_dot')
+                slush = _problem(eom_class, mu=get_runway_condition('slush').mu).get_val('eom.v_dot')
+                self.assertTrue(np.all(slush <= dry))
+
+    def test_runway_condition(self):
+        self.assertEqual(Runway(2000).condition.name, 'dry')
+        self.assertEqual(Runway(2000, condition='wet').condition.mu_brake, 0.2)
+        with self.assertRaises(ValueError):
+            Runway(2000, condition='mud')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,116 @@
+import numpy as np
+import openmdao.api as om
+from openmdao.components.interp_util.interp import InterpND
+
+from toa.data import Airplane
+from toa.data import get_engine_deck
+from toa.models.atmosphere import LAPSE_RATE
+from toa.models.atmosphere import N
+from toa.models.atmosphere import P0
+from toa.models.atmosphere import T0
+
+# Interpolants of the engine decks, shared by every component of the same engine, rating and method
+_INTERPOLANTS = {}
+
+
+def deck_interpolants(deck, rating='takeoff', method='slinear'):
+    """Return the thrust and fuel flow interpolants of a rating of an engine deck.
+
+    The deck tables are given per engine against Mach number, pressure altitude (m) and ISA deviation (K). Thrust
+    is in N and fuel flow in kg/s.
+    """
+    if deck is None:
+        raise ValueError("The airplane has no engine deck (engine.deck), use the polynomial engine model")
+    key = (deck, rating, method)
+    if key not in _INTERPOLANTS:
+        data = get_engine_deck(deck)
+        if data is None:
+            raise ValueError(f"There is no engine deck with the following id: {deck}")
+        if rating not in data['ratings']:
+            raise ValueError(f"Unknown rating '{rating}' of the {deck} deck, expected one of "
+                             f"{sorted(data['ratings'])}")
+        points = tuple(np.asarray(data[name], dtype=float) for name in ('mach', 'pressure_altitude', 'isa_deviation'))
+        tables = data['ratings'][rating]
+        _INTERPOLANTS[key] = tuple(
+                InterpND(method=method, points=points, values=np.asarray(tables[name], dtype=float), extrapolate=True)
+                for name in ('thrust', 'fuel_flow'))
+    return _INTERPOLANTS[key]
+
+
+class EngineDeckComp(om.ExplicitComponent):
+    """Computes thrust and fuel flow by interpolation of the engine deck of the airplane (engine.deck).
+
+    It has the inputs of ThrustComp, the pressure altitude of the deck follows from the ambient pressure.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+        self.options.declare('condition', default='AEO',
+                             desc='Takeoff condition (AEO/OEI)')
+        self.options.declare('throttle', default='takeoff',
+                             desc='Engine rating of the deck (takeoff, idle)')
+        self.options.declare('method', default='slinear',
+                             desc='Interpolation method of the deck, see openmdao InterpND')
+        self.options.declare('airplane', types=Airplane,
+                             desc='Class containing all airplane data')
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        ar = np.arange(nn)
+        zz = np.zeros(nn)
+
+        self.add_input(name='p_amb', val=P0, desc='Atmospheric pressure', units='Pa')
+        self.add_input(name='mach', val=np.zeros(nn), desc='Mach number', units=None)
+        self.add_input(name='isa_deviation', val=0.0, desc='Temperature deviation from the ISA', units='K')
+
+        self.add_output(name='thrust_ratio', val=np.zeros(nn),
+                        desc='Thrust ratio at current altitude and speed',
+                        units=None)
+        self.add_output(name='thrust', val=np.zeros(nn),
+                        desc='Thrust at current altitude and speed', units='N')
+        self.add_output(name='m_dot', val=np.zeros(nn),
+                        desc='rate of aircraft mass change - negative when fuel is being depleted',
+                        units='kg/s')
+
+        for of in ('thrust_ratio', 'thrust', 'm_dot'):
+            self.declare_partials(of=of, wrt='mach', rows=ar, cols=ar)
+            self.declare_partials(of=of, wrt=['p_amb', 'isa_deviation'], rows=ar, cols=zz)
+
+    def _num_motors(self):
+        ap = self.options['airplane']
+        if self.options['condition'] == 'AEO':
+            return ap.engine.num_motors
+        return ap.engine.num_motors - 1
+
+    def _interpolate(self, inputs):
+        nn = self.options['num_nodes']
+        interpolants = deck_interpolants(self.options['airplane'].engine.deck, rating=self.options['throttle'],
+                                         method=self.options['method'])
+        pres_ratio = inputs['p_amb'] / P0
+        x = np.empty((nn, 3), dtype=np.result_type(inputs['mach'], inputs['p_amb'], inputs['isa_deviation']))
+        x[:, 0] = inputs['mach']
+        x[:, 1] = T0 / LAPSE_RATE * (1 - pres_ratio ** (1 / N))
+        x[:, 2] = inputs['isa_deviation']
+        dh_dp = -T0 / (LAPSE_RATE * N * P0) * pres_ratio ** (1 / N - 1)
+        return [interp.interpolate(x, compute_derivative=True) for interp in interpolants], dh_dp
+
+    def compute(self, inputs, outputs, **kwargs):
+        ap = self.options['airplane']
+        num_motors = self._num_motors()
+        (thrust, _), (fuel_flow, _) = self._interpolate(inputs)[0]
+
+        outputs['thrust_ratio'] = thrust / ap.engine.max_thrust_sl
+        outputs['thrust'] = thrust * num_motors
+        outputs['m_dot'] = -fuel_flow * num_motors
+
+    def compute_partials(self, inputs, partials, **kwargs):
+        ap = self.options['airplane']
+        num_motors = self._num_motors()
+        ((_, dthrust), (_, dfuel_flow)), dh_dp = self._interpolate(inputs)
+
+        for of, derivs, factor in (('thrust_ratio', dthrust, 1 / ap.engine.max_thrust_sl),
+                                   ('thrust', dthrust, num_motors),
+                                   ('m_dot', dfuel_flow, -num_motors)):
+            partials[of, 'mach'] = factor * derivs[:, 0]
+            partials[of, 'p_amb'] = factor * derivs[:, 1] * dh_dp
+            partials[of, 'isa_deviation'] = factor * derivs[:, 2]
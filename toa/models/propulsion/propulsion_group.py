@@ -1,6 +1,7 @@
 import openmdao.api as om
 
 from toa.data import Airplane
+from toa.models.propulsion.engine_deck import EngineDeckComp
 from toa.models.propulsion.fuel_flow_comp import FuelFlowComp
 from toa.models.propulsion.mach_comp import MachComp
 from toa.models.propulsion.thrust_comp import ThrustComp
@@ -17,29 +18,41 @@ class PropulsionGroup(om.Group):
                              desc='Thrust rate (takeoff, idle)')
         self.options.declare('airplane', types=Airplane,
                              desc='Class containing all airplane data')
+        self.options.declare('engine_model', default='polynomial', values=['polynomial', 'deck'],
+                             desc='Thrust lapse and fuel flow polynomials, or interpolation of the engine deck')
 
     def setup(self):
         nn = self.options['num_nodes']
         airplane = self.options['airplane']
         condition = self.options['condition']
         throttle = self.options['throttle']
+        engine_model = self.options['engine_model']
 
         self.add_subsystem(name='mach_comp', subsys=MachComp(num_nodes=nn),
                            promotes_inputs=['tas', 'sos'])
 
-        self.add_subsystem(name='thrust_comp',
-                           subsys=ThrustComp(num_nodes=nn, airplane=airplane,
-                                             condition=condition,
-                                             throttle=throttle),
-                           promotes_inputs=['p_amb'],
-                           promotes_outputs=['thrust'])
-
-        self.connect('mach_comp.mach', 'thrust_comp.mach')
-
-        self.add_subsystem(name='fuel_flow',
-                           subsys=FuelFlowComp(num_nodes=nn, airplane=airplane,
-                                               condition=condition),
-                           promotes_inputs=['thrust', 'elevation'],
-                           promotes_outputs=['m_dot'])
-
-        self.connect('thrust_comp.thrust_ratio', 'fuel_flow.thrust_ratio')
+        if engine_model == 'deck':
+            self.add_subsystem(name='engine_deck',
+                               subsys=EngineDeckComp(num_nodes=nn, airplane=airplane, condition=condition,
+                                                     throttle=throttle),
+                               promotes_inputs=['p_amb', 'isa_deviation'],
+                               promotes_outputs=['thrust', 'm_dot'])
+
+            self.connect('mach_comp.mach', 'engine_deck.mach')
+        else:
+            self.add_subsystem(name='thrust_comp',
+                               subsys=ThrustComp(num_nodes=nn, airplane=airplane,
+                                                 condition=condition,
+                                                 throttle=throttle),
+                               promotes_inputs=['p_amb', 'isa_deviation'],
+                               promotes_outputs=['thrust'])
+
+            self.connect('mach_comp.mach', 'thrust_comp.mach')
+
+            self.add_subsystem(name='fuel_flow',
+                               subsys=FuelFlowComp(num_nodes=nn, airplane=airplane,
+                                                   condition=condition),
+                               promotes_inputs=['thrust', 'elevation'],
+                               promotes_outputs=['m_dot'])
+
+            self.connect('thrust_comp.thrust_ratio', 'fuel_flow.thrust_ratio')
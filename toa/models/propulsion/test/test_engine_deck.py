@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from dymos.utils.testing_utils import assert_check_partials
+from openmdao.utils.assert_utils import assert_near_equal
+
+from toa.data import get_airplane_data
+from toa.models.atmosphere import atmosphere
+from toa.models.propulsion.engine_deck import EngineDeckComp
+from toa.models.propulsion.engine_deck import deck_interpolants
+from toa.models.propulsion.propulsion_group import PropulsionGroup
+
+
+class TestEngineDeck(unittest.TestCase):
+
+    def run_propulsion(self, airplane, engine_model, pressure_altitude, isa_deviation):
+        p = om.Problem()
+        p.model.add_subsystem('prop', PropulsionGroup(num_nodes=5, airplane=airplane, engine_model=engine_model),
+                              promotes=['*'])
+        p.setup(force_alloc_complex=True)
+        p.set_val('tas', np.linspace(0, 90, 5))
+        p.set_val('sos', 338.0)
+        p.set_val('p_amb', atmosphere(pressure_altitude)['pres'])
+        p.set_val('isa_deviation', isa_deviation)
+        if engine_model == 'polynomial':
+            p.set_val('elevation', pressure_altitude)
+        p.run_model()
+        return p
+
+    def test_matches_polynomial_model(self):
+        # The decks in the data are tabulated from the polynomial models
+        for name in ('b734', 'b744'):
+            airplane = get_airplane_data(name)
+            for pressure_altitude, isa_deviation in ((0.0, 0.0), (1200.0, 22.0)):
+                deck = self.run_propulsion(airplane, 'deck', pressure_altitude, isa_deviation)
+                polynomial = self.run_propulsion(airplane, 'polynomial', pressure_altitude, isa_deviation)
+                assert_near_equal(deck.get_val('thrust'), polynomial.get_val('thrust'), tolerance=2e-3)
+                assert_near_equal(deck.get_val('m_dot'), polynomial.get_val('m_dot'), tolerance=2e-3)
+
+    def test_partials(self):
+        p = self.run_propulsion(get_airplane_data('b734'), 'deck', 1200.0, 22.0)
+        cpd = p.check_partials(compact_print=False, out_stream=None, method='cs', includes=['prop.engine_deck'])
+        assert_check_partials(cpd, atol=1.0E-6, rtol=1.0E-6)
+
+    def test_interpolants_shared(self):
+        airplane = get_airplane_data('b734')
+        self.assertIs(deck_interpolants(airplane.engine.deck), deck_interpolants(airplane.engine.deck))
+        self.assertIsNot(deck_interpolants(airplane.engine.deck), deck_interpolants(airplane.engine.deck, 'idle'))
+
+    def test_unknown_rating(self):
+        p = om.Problem()
+        p.model.add_subsystem('deck', EngineDeckComp(num_nodes=1, airplane=get_airplane_data('b734'),
+                                                     throttle='climb'))
+        p.setup()
+        with self.assertRaises(ValueError):
+            p.run_model()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from dymos.utils.testing_utils import assert_check_partials
+from openmdao.utils.assert_utils import assert_near_equal
+
+from toa.data import get_airplane_data
+from toa.models.propulsion.thrust_comp import ThrustComp
+
+
+class TestThrustFlatRating(unittest.TestCase):
+
+    def setUp(self):
+        self.airplane = get_airplane_data('b734')
+        self.p = om.Problem()
+        self.p.model.add_subsystem('thrust', ThrustComp(num_nodes=3, airplane=self.airplane))
+        self.p.setup(force_alloc_complex=True)
+        self.p.set_val('thrust.p_amb', 95000.0)
+        self.p.set_val('thrust.mach', [0.0, 0.1, 0.2])
+
+    def thrust(self, isa_deviation):
+        self.p.set_val('thrust.isa_deviation', isa_deviation)
+        self.p.run_model()
+        return self.p.get_val('thrust.thrust').copy()
+
+    def test_flat_rated(self):
+        assert_near_equal(self.thrust(self.airplane.engine.flat_rating), self.thrust(0.0), tolerance=1e-12)
+
+    def test_lapse_above_flat_rating(self):
+        ratio = self.thrust(self.airplane.engine.flat_rating + 10.0) / self.thrust(0.0)
+        assert_near_equal(ratio, np.full(3, 1 - 10.0 * 0.008), tolerance=1e-12)
+
+    def test_partials(self):
+        for isa_deviation in (0.0, 25.0):
+            self.thrust(isa_deviation)
+            cpd = self.p.check_partials(compact_print=False, out_stream=None, method='cs')
+            assert_check_partials(cpd, atol=1.0E-6, rtol=1.0E-8)
+
+
+if __name__ == '__main__':
+    unittest.main()
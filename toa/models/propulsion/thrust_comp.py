@@ -1,4 +1,3 @@
-import jax
 import numpy as np
 import openmdao.api as om
 
@@ -7,7 +6,11 @@ from toa.data import get_airplane_data
 
 
 class ThrustComp(om.ExplicitComponent):
-    """Computes thrust ratio considering effects of altitude and speed."""
+    """Computes thrust ratio considering effects of altitude, speed and temperature.
+
+    The takeoff thrust is flat rated up to the engine flat rating ISA deviation, the ISA without one, and decreases
+    by temperature_lapse per K above it.
+    """
 
     def initialize(self):
         self.options.declare('num_nodes', types=int)
@@ -17,6 +20,8 @@ class ThrustComp(om.ExplicitComponent):
                              desc='Thrust rate (takeoff, idle)')
         self.options.declare('airplane', types=Airplane,
                              desc='Class containing all airplane data')
+        self.options.declare('temperature_lapse', default=0.008,
+                             desc='Thrust loss per K of ISA deviation above the flat rating')
 
     def setup(self):
         nn = self.options['num_nodes']
@@ -26,6 +31,7 @@ class ThrustComp(om.ExplicitComponent):
         # Inputs
         self.add_input(name='p_amb', val=0.0, desc='Atmospheric pressure', units='Pa')
         self.add_input(name='mach', val=np.zeros(nn), desc='Mach number', units=None)
+        self.add_input(name='isa_deviation', val=0.0, desc='Temperature deviation from the ISA', units='K')
 
         # Outputs
         self.add_output(name='thrust_ratio', val=np.zeros(nn),
@@ -36,9 +42,19 @@ class ThrustComp(om.ExplicitComponent):
 
         self.declare_partials(of='thrust_ratio', wrt='p_amb', rows=ar, cols=zz)
         self.declare_partials(of='thrust_ratio', wrt='mach', rows=ar, cols=ar)
+        self.declare_partials(of='thrust_ratio', wrt='isa_deviation', rows=ar, cols=zz)
 
         self.declare_partials(of='thrust', wrt='p_amb', rows=ar, cols=zz)
         self.declare_partials(of='thrust', wrt='mach', rows=ar, cols=ar)
+        self.declare_partials(of='thrust', wrt='isa_deviation', rows=ar, cols=zz)
+
+    def _temperature_factor(self, inputs):
+        """Return the flat rating thrust factor and its derivative with respect to the ISA deviation."""
+        lapse = self.options['temperature_lapse']
+        flat_rating = self.options['airplane'].engine.flat_rating
+        excess = inputs['isa_deviation'] - (0.0 if flat_rating is None else flat_rating)
+        above = excess.real > 0.0
+        return 1.0 - lapse * np.where(above, excess, 0.0), np.where(above, -lapse, 0.0)
 
     def compute(self, inputs, outputs, **kwargs):
         p_amb = inputs['p_amb']
@@ -64,7 +80,9 @@ class ThrustComp(om.ExplicitComponent):
         k1 = 0.377 * (1 + bpr) / np.sqrt((1 + 0.82 * bpr) * G0)
         k2 = 0.23 + 0.19 * np.sqrt(bpr)
 
-        T_T0 = (A - k1 * Z * mach + k2 * X * mach ** 2) * multiplier
+        temp_factor, _ = self._temperature_factor(inputs)
+
+        T_T0 = (A - k1 * Z * mach + k2 * X * mach ** 2) * multiplier * temp_factor
 
         outputs['thrust_ratio'] = T_T0
         outputs['thrust'] = T_T0 * ap.engine.max_thrust_sl * num_motors
@@ -90,17 +108,25 @@ class ThrustComp(om.ExplicitComponent):
         k1 = 0.377 * (1 + bpr) / np.sqrt((1 + 0.82 * bpr) * G0)
         k2 = 0.23 + 0.19 * np.sqrt(bpr)
 
-        partials['thrust_ratio', 'p_amb'] = -multiplier * (mach * (
+        press_ratio = p_amb / p_amb_sl
+        A = - 0.4327 * press_ratio ** 2 + 1.3855 * press_ratio + 0.0472
+        Z = 0.9106 * press_ratio ** 3 - 1.7736 * press_ratio ** 2 + 1.8697 * press_ratio
+        X = 0.1377 * press_ratio ** 3 - 0.4374 * press_ratio ** 2 + 1.3003 * press_ratio
+        temp_factor, dtemp_factor = self._temperature_factor(inputs)
+
+        partials['thrust_ratio', 'p_amb'] = -temp_factor * multiplier * (mach * (
                 k1 * (2.7318 * p_amb ** 2 - 3.5472 * p_amb * p_amb_sl + 1.8697 * p_amb_sl ** 2) - k2 * mach * (
                 0.4131 * p_amb ** 2 - 0.8748 * p_amb * p_amb_sl + 1.3003 * p_amb_sl ** 2))
                                                            + 0.8654 * p_amb * p_amb_sl
                                                            - 1.3855 * p_amb_sl ** 2) / p_amb_sl ** 3
-        partials['thrust_ratio', 'mach'] = -multiplier * p_amb * (
+        partials['thrust_ratio', 'mach'] = -temp_factor * multiplier * p_amb * (
                 k1 * (0.9106 * p_amb ** 2 - 1.7736 * p_amb * p_amb_sl + 1.8697 * p_amb_sl ** 2) - 2 * k2 * mach * (
                 0.1377 * p_amb ** 2 - 0.4374 * p_amb * p_amb_sl + 1.3003 * p_amb_sl ** 2)) / p_amb_sl ** 3
 
         partials['thrust', 'p_amb'] = max_thrust_sl * num_motors * partials['thrust_ratio', 'p_amb']
         partials['thrust', 'mach'] = max_thrust_sl * num_motors * partials['thrust_ratio', 'mach']
+        partials['thrust_ratio', 'isa_deviation'] = (A - k1 * Z * mach + k2 * X * mach ** 2) * multiplier * dtemp_factor
+        partials['thrust', 'isa_deviation'] = max_thrust_sl * num_motors * partials['thrust_ratio', 'isa_deviation']
 
 
 if __name__ == '__main__':
@@ -0,0 +1,60 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from dymos.models.atmosphere import USatm1976Comp
+from dymos.utils.testing_utils import assert_check_partials
+from openmdao.utils.assert_utils import assert_near_equal
+
+from toa.models.atmosphere import isa_deviation
+from toa.models.atmosphere_comp import AtmosphereComp
+
+
+class TestAtmosphereComp(unittest.TestCase):
+
+    def setUp(self):
+        self.elevation = np.array([0.0, 500.0, 1500.0, 2500.0])
+        self.p = om.Problem()
+        self.p.model.add_subsystem('atmos', AtmosphereComp(num_nodes=4))
+        self.p.setup(force_alloc_complex=True)
+        self.p.set_val('atmos.elevation', self.elevation)
+
+    def test_isa(self):
+        self.p.run_model()
+
+        ref = om.Problem()
+        ref.model.add_subsystem('atmos', USatm1976Comp(num_nodes=4))
+        ref.setup()
+        ref.set_val('atmos.h', self.elevation, units='m')
+        ref.run_model()
+
+        for name, units in (('pres', 'Pa'), ('temp', 'K'), ('rho', 'kg/m**3'), ('sos', 'm/s')):
+            assert_near_equal(self.p.get_val(f'atmos.{name}', units=units), ref.get_val(f'atmos.{name}', units=units),
+                              tolerance=1e-3)
+        assert_near_equal(self.p.get_val('atmos.pressure_altitude'), self.elevation, tolerance=1e-9)
+
+    def test_hot_day_low_qnh(self):
+        self.p.set_val('atmos.isa_deviation', 20.0)
+        self.p.set_val('atmos.qnh', 1000.0, units='hPa')
+        self.p.run_model()
+
+        # About 27 ft of pressure altitude per hPa below the standard pressure
+        assert_near_equal(self.p.get_val('atmos.pressure_altitude', units='ft')[0], 13.25 * 27.3, tolerance=0.02)
+        assert_near_equal(self.p.get_val('atmos.temp', units='K') - 20.0,
+                          288.15 - 0.0065 * self.p.get_val('atmos.pressure_altitude', units='m'), tolerance=1e-9)
+        self.assertTrue(np.all(self.p.get_val('atmos.rho', units='kg/m**3') < [1.225, 1.167, 1.058, 0.957]))
+
+    def test_isa_deviation(self):
+        assert_near_equal(isa_deviation(45.0), 30.0, tolerance=1e-12)
+        assert_near_equal(isa_deviation(15.0, elevation=1000.0), 6.5, tolerance=1e-9)
+
+    def test_partials(self):
+        self.p.set_val('atmos.isa_deviation', [0.0, 10.0, 20.0, 30.0])
+        self.p.set_val('atmos.qnh', [1013.25, 1000.0, 1020.0, 990.0], units='hPa')
+        self.p.run_model()
+        cpd = self.p.check_partials(compact_print=False, out_stream=None, method='cs')
+        assert_check_partials(cpd, atol=1.0E-8, rtol=1.0E-8)
+
+
+if __name__ == '__main__':
+    unittest.main()
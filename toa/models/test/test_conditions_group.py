@@ -0,0 +1,44 @@
+import unittest
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+
+from toa.data import get_airplane_data
+from toa.models.aero.flap_slat_comp import FlapSlatComp
+from toa.models.conditions_group import HIGH_LIFT
+from toa.models.conditions_group import TakeoffConditionsGroup
+
+
+class TestTakeoffConditionsGroup(unittest.TestCase):
+
+    def setUp(self):
+        self.airplane = get_airplane_data('b734')
+        self.p = om.Problem()
+        self.p.model.add_subsystem('conditions', TakeoffConditionsGroup(airplane=self.airplane))
+        self.p.setup()
+        self.p.set_val('conditions.flap_angle', 5.0)
+
+    def test_sea_level_atmosphere(self):
+        self.p.set_val('conditions.elevation', 0.0)
+        self.p.run_model()
+
+        assert_near_equal(self.p.get_val('conditions.rho', units='kg/m**3'), [1.225], tolerance=1e-3)
+        assert_near_equal(self.p.get_val('conditions.sos', units='m/s'), [340.3], tolerance=1e-3)
+        assert_near_equal(self.p.get_val('conditions.p_amb', units='Pa'), [101325.0], tolerance=1e-3)
+
+    def test_high_lift_matches_flap_slat_comp(self):
+        self.p.run_model()
+
+        ref = om.Problem()
+        ref.model.add_subsystem('flap_slat', FlapSlatComp(airplane=self.airplane))
+        ref.setup()
+        ref.set_val('flap_slat.flap_angle', 5.0)
+        ref.run_model()
+
+        for name in HIGH_LIFT:
+            assert_near_equal(self.p.get_val(f'conditions.{name}'), ref.get_val(f'flap_slat.{name}'),
+                              tolerance=1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
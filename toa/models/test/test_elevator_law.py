@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from dymos.utils.testing_utils import assert_check_partials
+from openmdao.utils.assert_utils import assert_near_equal
+
+from toa.models.elevator_law_comp import elevator_law_comp
+
+
+class TestElevatorKnotsComp(unittest.TestCase):
+
+    def setUp(self):
+        n = 7
+        self.p = om.Problem()
+        # Second phase of a trajectory with 3 knots per phase, using knots 2 to 4 of the shared vector
+        self.p.model.add_subsystem('elevator', elevator_law_comp(n, {'law': 'knots', 'num_knots': 3, 'offset': 2,
+                                                                     'total_knots': 7}))
+        self.p.setup(force_alloc_complex=True)
+        self.p.set_val('elevator.t_phase', np.linspace(0.0, 4.0, n) + 0.1)
+        self.p.set_val('elevator.t_duration', 4.2)
+        self.p.set_val('elevator.de_knots', [9.0, 9.0, 0.0, -10.0, -14.0, 9.0, 9.0])
+        self.p.run_model()
+
+    def test_value(self):
+        t = np.linspace(0.0, 4.0, 7) + 0.1
+        assert_near_equal(self.p.get_val('elevator.de'), np.interp(t, [0.0, 2.1, 4.2], [0.0, -10.0, -14.0]),
+                          tolerance=1e-12)
+
+    def test_partials(self):
+        cpd = self.p.check_partials(compact_print=False, out_stream=None, method='cs')
+        assert_check_partials(cpd, atol=1.0E-8, rtol=1.0E-8)
+
+
+class TestElevatorRateLawComp(unittest.TestCase):
+
+    def setUp(self):
+        n = 5
+        self.p = om.Problem()
+        self.p.model.add_subsystem('elevator', elevator_law_comp(n, {'law': 'rate', 'q_cmd': 3.0}))
+        self.p.setup(force_alloc_complex=True)
+        self.p.set_val('elevator.q', np.linspace(0.0, 4.0, n))
+        self.p.set_val('elevator.de_trim', -2.0)
+        self.p.set_val('elevator.de_gain', 1.5)
+        self.p.run_model()
+
+    def test_value(self):
+        assert_near_equal(self.p.get_val('elevator.de'), -2.0 - 1.5 * (3.0 - np.linspace(0.0, 4.0, 5)),
+                          tolerance=1e-12)
+
+    def test_partials(self):
+        cpd = self.p.check_partials(compact_print=False, out_stream=None, method='cs')
+        assert_check_partials(cpd, atol=1.0E-8, rtol=1.0E-8)
+
+    def test_unknown_law(self):
+        with self.assertRaises(ValueError):
+            elevator_law_comp(5, {'law': 'bang_bang'})
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -1,11 +1,12 @@
 import openmdao.api as om
 import numpy as np
-from dymos.models.atmosphere import USatm1976Comp
 
 from toa.data import Airplane
 from toa.models.aero.aerodynamics import AerodynamicsGroup
+from toa.models.atmosphere_comp import AtmosphereComp
 from toa.models.alpha_comp import AlphaComp
 from toa.models.eom.rotation_eom import RotationEOM
+from toa.models.elevator_law_comp import elevator_law_comp
 from toa.models.main_landing_gear_pos import MainLandingGearPosComp
 from toa.models.propulsion.propulsion_group import PropulsionGroup
 from toa.models.true_airspeed_comp import TrueAirspeedCompGroundRoll
@@ -19,39 +20,64 @@ class RotationODE(om.Group):
                              desc='Class containing all airplane data')
         self.options.declare('condition', default='AEO',
                              desc='Takeoff condition (AEO/OEI)')
+        self.options.declare('coloring_report', types=bool, default=True,
+                             desc='Prints the partial coloring summary and sparsity')
+        self.options.declare('elevator_law', types=dict, default=None, allow_none=True,
+                             desc='Elevator law computing aero.de, see elevator_law_comp, de is an input if None')
+        self.options.declare('shared_conditions', types=bool, default=False,
+                             desc='Atmosphere and high lift data are inputs computed once for the trajectory, '
+                                  'see TakeoffConditionsGroup')
+        self.options.declare('engine_model', default='polynomial', values=['polynomial', 'deck'],
+                             desc='Propulsion model, see PropulsionGroup')
 
     def setup(self):
         nn = self.options['num_nodes']
         airplane = self.options['airplane']
         condition = self.options['condition']
+        coloring_report = self.options['coloring_report']
+        elevator_law = self.options['elevator_law']
+        shared_conditions = self.options['shared_conditions']
+        engine_model = self.options['engine_model']
 
         assumptions = self.add_subsystem(name='assumptions', subsys=om.IndepVarComp())
         assumptions.add_output('grav', val=9.80665, units='m/s**2',
                                desc='Gravity acceleration')
 
-        self.add_subsystem(name='atmos', subsys=USatm1976Comp(num_nodes=1),
-                           promotes_inputs=[('h', 'elevation')])
+        if not shared_conditions:
+            self.add_subsystem(name='atmos', subsys=AtmosphereComp(num_nodes=1),
+                               promotes_inputs=['elevation', 'isa_deviation', 'qnh'])
 
         self.add_subsystem(name='tas_comp',
                            subsys=TrueAirspeedCompGroundRoll(num_nodes=nn),
                            promotes_inputs=['V', 'Vw'])
 
+        aero_conditions = ['rho', 'CL0', 'CLa', 'alpha_max'] if shared_conditions else []
         self.add_subsystem(name='aero', subsys=AerodynamicsGroup(num_nodes=nn,
                                                                  airplane=airplane,
-                                                                 AllWheelsOnGround=False),
-                           promotes_inputs=['q', 'mass'])
+                                                                 coloring_report=coloring_report,
+                                                                 AllWheelsOnGround=False,
+                                                                 high_lift=not shared_conditions),
+                           promotes_inputs=['q', 'mass'] + aero_conditions)
 
         self.connect('assumptions.grav', 'aero.grav')
-        self.connect('atmos.rho', 'aero.rho')
         self.connect('tas_comp.tas', 'aero.tas')
 
+        if elevator_law is not None:
+            self.add_subsystem(name='elevator', subsys=elevator_law_comp(nn, elevator_law), promotes_inputs=['*'])
+            self.connect('elevator.de', 'aero.de')
+
+        prop_conditions = ['sos', 'p_amb'] if shared_conditions else []
+        # The engine deck gets the pressure altitude from p_amb
+        prop_altitude = ['elevation'] if engine_model == 'polynomial' else []
         self.add_subsystem(name='prop',
                            subsys=PropulsionGroup(num_nodes=nn, airplane=airplane,
-                                                  condition=condition),
-                           promotes_inputs=['elevation'])
+                                                  condition=condition, engine_model=engine_model),
+                           promotes_inputs=['isa_deviation'] + prop_altitude + prop_conditions)
 
-        self.connect('atmos.sos', 'prop.sos')
-        self.connect('atmos.pres', 'prop.p_amb')
+        if not shared_conditions:
+            self.connect('atmos.rho', 'aero.rho')
+            self.connect('atmos.sos', 'prop.sos')
+            self.connect('atmos.pres', 'prop.p_amb')
         self.connect('tas_comp.tas', 'prop.tas')
 
         self.add_subsystem(name='rotation_eom',
@@ -67,4 +93,5 @@ class RotationODE(om.Group):
         self.add_subsystem(name='mlg_pos',
                            subsys=MainLandingGearPosComp(num_nodes=nn, airplane=airplane))
 
-        self.set_input_defaults('elevation', val=0.0, units='m')
+        if prop_altitude or not shared_conditions:
+            self.set_input_defaults('elevation', val=0.0, units='m')
@@ -1,13 +1,57 @@
+import csv
+
+import numpy as np
+
+# Screen height of the takeoff distance, 35 ft in m
+SCREEN_HEIGHT = 35 * 0.3048
+
+
+class RunwayCondition:
+    """Friction coefficients of a runway surface state, rolling (mu) and braking (mu_brake)."""
+
+    def __init__(self, name: str, mu: float, mu_brake: float):
+        self.name = name
+        self.mu = mu
+        self.mu_brake = mu_brake
+
+    def __repr__(self):
+        return f'RunwayCondition({self.name!r}, mu={self.mu}, mu_brake={self.mu_brake})'
+
+
+# Representative friction coefficients of the runway surface states. The rolling coefficient of contaminated
+# runways also accounts for the contaminant displacement drag.
+RUNWAY_CONDITIONS = {condition.name: condition for condition in [
+    RunwayCondition('dry', mu=0.025, mu_brake=0.40),
+    RunwayCondition('wet', mu=0.025, mu_brake=0.20),
+    RunwayCondition('compact_snow', mu=0.03, mu_brake=0.20),
+    RunwayCondition('dry_snow', mu=0.05, mu_brake=0.15),
+    RunwayCondition('slush', mu=0.08, mu_brake=0.10),
+    RunwayCondition('standing_water', mu=0.08, mu_brake=0.10),
+    RunwayCondition('ice', mu=0.02, mu_brake=0.05),
+    ]}
+
+
+def get_runway_condition(condition):
+    """Return a RunwayCondition from an instance or a name in RUNWAY_CONDITIONS."""
+    if isinstance(condition, RunwayCondition):
+        return condition
+    if condition not in RUNWAY_CONDITIONS:
+        raise ValueError(f"Unknown runway condition '{condition}', expected one of {sorted(RUNWAY_CONDITIONS)}")
+    return RUNWAY_CONDITIONS[condition]
+
+
 class Runway:
 
     def __init__(self, length: float, clearway: float = 0.0, stopway: float = 0.0,
                  elevation: float = 0.0,
-                 slope: float = 0.0):
+                 slope: float = 0.0,
+                 condition='dry'):
         self._length = length
         self.clearway = clearway
         self.stopway = stopway
         self.elevation = elevation
         self.slope = slope
+        self.condition = get_runway_condition(condition)
 
     @property
     def tora(self):
@@ -36,6 +80,164 @@ class Runway:
         return self._length + self.stopway
 
 
+def _parse_obstacles(text):
+    """Parse obstacles written as distance:height pairs separated by semicolons, e.g. '500:15;1200:40'."""
+    obstacles = []
+    for item in (text or '').split(';'):
+        if item.strip():
+            distance, height = item.split(':')
+            obstacles.append((float(distance), float(height)))
+    return obstacles
+
+
+class RunwayTable:
+    """Columnar table of runway ends, for the analysis of many runways at once.
+
+    Every column is a NumPy array with one value per runway end: TORA, clearway and stopway in m, elevation in m,
+    slope in rad and surface condition, by name. The declared distances are computed like Runway does, the clearway
+    is clamped between zero and half the TORA. Obstacles are stored in compressed rows, the distances beyond the end
+    of the TODA and heights above the runway of the obstacles of end i are obstacle_distance[s] and
+    obstacle_height[s], for s = slice(obstacle_offsets[i], obstacle_offsets[i + 1]).
+    """
+
+    COLUMNS = ('tora', 'clearway', 'stopway', 'elevation', 'slope')
+
+    def __init__(self, tora, clearway=0.0, stopway=0.0, elevation=0.0, slope=0.0, condition='dry', obstacles=None,
+                 name=None):
+        tora = np.atleast_1d(np.asarray(tora, dtype=float))
+        n = tora.size
+        self.tora = tora
+        self.clearway = np.clip(np.broadcast_to(np.asarray(clearway, dtype=float), (n,)), 0.0, 0.5 * tora)
+        self.stopway = np.broadcast_to(np.asarray(stopway, dtype=float), (n,)).copy()
+        self.elevation = np.broadcast_to(np.asarray(elevation, dtype=float), (n,)).copy()
+        self.slope = np.broadcast_to(np.asarray(slope, dtype=float), (n,)).copy()
+
+        conditions = [condition] * n if isinstance(condition, (str, RunwayCondition)) else list(condition)
+        conditions = [get_runway_condition(item) for item in conditions]
+        self._conditions = {item.name: item for item in conditions}
+        self.condition = np.array([item.name for item in conditions], dtype=str)
+        self.mu = np.array([item.mu for item in conditions], dtype=float)
+
+        obstacles = [[]] * n if obstacles is None else [list(item) for item in obstacles]
+        self.obstacle_offsets = np.concatenate([[0], np.cumsum([len(item) for item in obstacles])]).astype(int)
+        flat = np.array([pair for item in obstacles for pair in item], dtype=float).reshape(-1, 2)
+        self.obstacle_distance = flat[:, 0]
+        self.obstacle_height = flat[:, 1]
+        self.name = np.array([''] * n if name is None else name, dtype=str)
+
+    @classmethod
+    def from_declared(cls, tora, toda, asda, **kwargs):
+        """Build a table from the declared distances in m, see RunwayTable for the other columns."""
+        tora = np.asarray(tora, dtype=float)
+        return cls(tora, clearway=np.asarray(toda, dtype=float) - tora, stopway=np.asarray(asda, dtype=float) - tora,
+                   **kwargs)
+
+    @classmethod
+    def from_runways(cls, runways):
+        runways = list(runways)
+        return cls([runway.tora for runway in runways], clearway=[runway.clearway for runway in runways],
+                   stopway=[runway.stopway for runway in runways], elevation=[runway.elevation for runway in runways],
+                   slope=[runway.slope for runway in runways], condition=[runway.condition for runway in runways])
+
+    @classmethod
+    def from_csv(cls, filepath):
+        """Load a table from a CSV file with a header row.
+
+        The columns are tora (or length), toda and asda, or clearway and stopway, elevation, slope, condition,
+        obstacles (see _parse_obstacles) and name. Only tora is required, a missing TODA or ASDA is the TORA, without
+        clearway or stopway, like for Runway.
+        """
+        with open(filepath, newline='') as file:
+            rows = list(csv.DictReader(file))
+        columns = {key.strip().lower(): [row[key] for row in rows] for key in (rows[0] if rows else ())}
+        if 'tora' not in columns:
+            columns['tora'] = columns.pop('length', [''] * len(rows))
+
+        def floats(key, default=0.0):
+            values = columns.get(key)
+            if values is None:
+                return np.full(len(rows), default)
+            return np.array([(value or '').strip() or default for value in values], dtype=float)
+
+        kwargs = {
+            'elevation': floats('elevation'),
+            'slope': floats('slope'),
+            'condition': [value or 'dry' for value in columns.get('condition', ['dry'] * len(rows))],
+            'obstacles': [_parse_obstacles(value) for value in columns.get('obstacles', [''] * len(rows))],
+            'name': columns.get('name'),
+            }
+        tora = floats('tora', np.nan)
+        if 'toda' in columns or 'asda' in columns:
+            toda = floats('toda', np.nan)
+            asda = floats('asda', np.nan)
+            table = cls.from_declared(tora, np.where(np.isnan(toda), tora, toda), np.where(np.isnan(asda), tora, asda),
+                                      **kwargs)
+        else:
+            table = cls(tora, clearway=floats('clearway'), stopway=floats('stopway'), **kwargs)
+
+        for column in cls.COLUMNS:
+            missing = np.flatnonzero(np.isnan(getattr(table, column)))
+            if missing.size:
+                raise ValueError(f"Missing or invalid {column} of the runway ends {missing.tolist()} in {filepath}")
+        return table
+
+    def __len__(self):
+        return self.tora.size
+
+    @property
+    def toda(self):
+        return self.tora + self.clearway
+
+    @property
+    def asda(self):
+        return self.tora + self.stopway
+
+    def obstacle_gradient(self, screen_height=SCREEN_HEIGHT):
+        """Return the climb gradient from the screen height at the end of the TODA that clears every obstacle of
+        each runway end, zero without obstacles."""
+        gradient = np.zeros(len(self))
+        if self.obstacle_distance.size:
+            required = (self.obstacle_height - screen_height) / self.obstacle_distance
+            ends = np.repeat(np.arange(len(self)), np.diff(self.obstacle_offsets))
+            np.maximum.at(gradient, ends, required)
+        return gradient
+
+    def obstacles(self, i):
+        s = slice(self.obstacle_offsets[i], self.obstacle_offsets[i + 1])
+        return list(zip(self.obstacle_distance[s].tolist(), self.obstacle_height[s].tolist()))
+
+    def runway(self, i):
+        """Return the Runway of the runway end i."""
+        return Runway(float(self.tora[i]), float(self.clearway[i]), float(self.stopway[i]), float(self.elevation[i]),
+                      float(self.slope[i]), condition=self._conditions[self.condition[i]])
+
+    def select(self, index):
+        """Return the table of the runway ends of an index array or boolean mask."""
+        index = np.arange(len(self))[index]
+        return RunwayTable(self.tora[index], self.clearway[index], self.stopway[index], self.elevation[index],
+                           self.slope[index], condition=[self._conditions[name] for name in self.condition[index]],
+                           obstacles=[self.obstacles(i) for i in index], name=self.name[index])
+
+    def unique(self):
+        """Return the distinct runway configurations, as a table, and the index of the configuration of each end.
+
+        Runway ends with the same declared distances, elevation, slope and condition have the same takeoff solve,
+        so only the distinct ones need to be solved. The obstacles and names are those of the first end of each
+        configuration.
+        """
+        _, condition_code = np.unique(self.condition, return_inverse=True)
+        keys = np.column_stack([getattr(self, column) for column in self.COLUMNS] + [condition_code])
+        _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        # Configurations in order of first appearance
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size)
+        return self.select(first[order]), rank[inverse.ravel()]
+
+    def __repr__(self):
+        return f'RunwayTable({len(self)} runway ends)'
+
+
 if __name__ == '__main__':
     r1 = Runway(3000, 1000, 1000)
     print(r1.tora, r1.toda, r1.asda, r1.clearway, r1.stopway)
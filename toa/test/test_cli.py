@@ -0,0 +1,55 @@
+import io
+import json
+import unittest
+from unittest import mock
+
+from toa.cli import ResultWriter
+from toa.cli import read_cases
+from toa.cli import run_cases
+from toa.traj.batch import TakeoffCase
+from toa.traj.result import TakeoffResult
+from toa.traj.telemetry import SolveTelemetry
+
+CASES = """airplane,tora,elevation,flap,wind,temperature
+b734,2500,,5,-2.5,
+b734,2500,700,5,0,35
+a380,3000,,,,
+"""
+
+
+def _solve(case, **kwargs):
+    return TakeoffResult(60000.0 + case.isa_deviation, 140.0, 150.0, 160.0, 0.0, case.runway.toda,
+                         telemetry=SolveTelemetry())
+
+
+class TestCli(unittest.TestCase):
+
+    def test_read_cases(self):
+        cases = list(read_cases(io.StringIO(CASES), 'csv'))
+
+        self.assertEqual(len(cases), 3)
+        self.assertEqual(cases[0]['flap'], 5.0)
+        self.assertEqual(cases[0]['elevation'], 0.0)
+        self.assertIsNone(cases[0]['temperature'])
+        self.assertEqual(cases[1]['temperature'], 35.0)
+        self.assertEqual(cases[2]['condition'], 'dry')
+
+        with self.assertRaises(ValueError):
+            list(read_cases(io.StringIO('{"airplane": "b734", "length": 2500}\n'), 'jsonl'))
+
+    def test_run_cases(self):
+        output = io.StringIO()
+        with mock.patch.object(TakeoffCase, 'solve', autospec=True, side_effect=_solve):
+            failed = run_cases(read_cases(io.StringIO(CASES), 'csv'), ResultWriter(output, 'jsonl'))
+
+        lines = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(failed, 1)
+        self.assertEqual([line['index'] for line in lines], [0, 1, 2])
+        self.assertEqual(lines[0]['rtow'], 60000.0)
+        self.assertAlmostEqual(lines[1]['rtow'] - 60000.0, 35 + 273.15 - (288.15 - 0.0065 * 700), places=6)
+        self.assertIsNone(lines[0]['error'])
+        self.assertIn('FileNotFoundError', lines[2]['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,23 @@
+import subprocess
+import sys
+import unittest
+
+# Modules of the table, cache and batch front ends, they must not import the optimization stack
+LIGHT_MODULES = ('toa.runway', 'toa.data', 'toa.models.atmosphere', 'toa.traj.result', 'toa.traj.batch',
+                 'toa.traj.airport', 'toa.traj.variants', 'toa.cli')
+
+HEAVY_MODULES = ('scipy', 'openmdao', 'dymos', 'jax', 'matplotlib')
+
+
+class TestImports(unittest.TestCase):
+
+    def test_light_modules(self):
+        script = (f"import sys\nimport {', '.join(LIGHT_MODULES)}\n"
+                  f"print(' '.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))")
+        output = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True).stdout
+
+        self.assertEqual(output.split(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from toa.runway import Runway
+from toa.runway import RunwayTable
+
+
+class TestRunwayTable(unittest.TestCase):
+
+    def test_declared_distances(self):
+        table = RunwayTable([3000, 3000, 2000], clearway=[1000, 1600, -10], stopway=[1000, 0, 0])
+        for i, runway in enumerate([Runway(3000, 1000, 1000), Runway(3000, 1600, 0), Runway(2000, -10, 0)]):
+            self.assertEqual(table.toda[i], runway.toda)
+            self.assertEqual(table.asda[i], runway.asda)
+            self.assertEqual(table.runway(i).toda, runway.toda)
+
+    def test_unique(self):
+        table = RunwayTable([2000, 3000, 2000, 2000], condition=['wet', 'dry', 'wet', 'dry'],
+                            obstacles=[[(500, 40)], [], [], [(400, 30), (800, 30)]])
+        unique, inverse = table.unique()
+
+        self.assertEqual(len(unique), 3)
+        np.testing.assert_array_equal(inverse, [0, 1, 0, 2])
+        np.testing.assert_array_equal(unique.tora[inverse], table.tora)
+        np.testing.assert_array_equal(unique.condition[inverse], table.condition)
+        self.assertEqual(table.obstacles(3), [(400.0, 30.0), (800.0, 30.0)])
+        np.testing.assert_allclose(table.obstacle_gradient(), [(40 - 35 * 0.3048) / 500, 0, 0,
+                                                               (30 - 35 * 0.3048) / 400])
+
+    def test_from_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, 'runways.csv')
+            with open(filepath, 'w') as file:
+                file.write("name,tora,toda,asda,elevation,slope,condition,obstacles\n"
+                           "SBGR 09L,3700,3700,3700,750,0.001,dry,\n"
+                           "SBGR 27R,3700,4000,3760,750,-0.001,wet,600:20;1500:55\n")
+            table = RunwayTable.from_csv(filepath)
+
+        np.testing.assert_array_equal(table.toda, [3700, 4000])
+        np.testing.assert_array_equal(table.asda, [3700, 3760])
+        np.testing.assert_array_equal(table.mu, [0.025, 0.025])
+        self.assertEqual(table.name.tolist(), ['SBGR 09L', 'SBGR 27R'])
+        self.assertEqual(table.obstacles(1), [(600.0, 20.0), (1500.0, 55.0)])
+        self.assertEqual(table.runway(1).condition.name, 'wet')
+
+    def test_from_csv_missing_distances(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, 'runways.csv')
+            with open(filepath, 'w') as file:
+                file.write("tora,toda\n3000,\n2500,2700\n")
+            table = RunwayTable.from_csv(filepath)
+            self.assertEqual(len(table.unique()[0]), 2)
+
+            with open(filepath, 'w') as file:
+                file.write("tora,toda\n3000,3000\n,2700\n")
+            with self.assertRaisesRegex(ValueError, r'tora of the runway ends \[1\]'):
+                RunwayTable.from_csv(filepath)
+
+        np.testing.assert_array_equal(table.toda, [3000, 2700])
+        np.testing.assert_array_equal(table.asda, [3000, 2500])
+
+
+if __name__ == '__main__':
+    unittest.main()
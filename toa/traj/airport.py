@@ -0,0 +1,100 @@
+import numpy as np
+
+from toa.models.atmosphere import P0
+from toa.traj.batch import TakeoffCase
+from toa.traj.batch import _cached_result
+from toa.traj.batch import run_batch
+from toa.traj.profile import PRODUCTION
+from toa.traj.variants import PHASES
+
+# Takeoff conditions of an analysis and their default values
+CONDITIONS = {
+    'flap_angle': 0.0,
+    'wind_speed': 0.0,
+    'isa_deviation': 0.0,
+    'qnh': P0,
+    }
+
+
+def _condition(condition):
+    unknown = sorted(set(condition) - set(CONDITIONS))
+    if unknown:
+        raise ValueError(f"Unknown takeoff conditions {unknown}, expected some of {sorted(CONDITIONS)}")
+    return dict(CONDITIONS, **condition)
+
+
+class AirportResult:
+    """RTOW in kg of every airplane, runway end and condition of an AirportAnalysis, nan where not solved.
+
+    results holds the TakeoffResult of each distinct case and index maps rtow to them, result i, j, k is
+    results[index[i, j, k]].
+    """
+
+    def __init__(self, airplanes, runways, conditions, results, index, summary):
+        self.airplanes = airplanes
+        self.runways = runways
+        self.conditions = conditions
+        self.results = results
+        self.index = index
+        self.summary = summary
+        rtow = np.array([np.nan if result is None else result.rtow for result in results])
+        self.rtow = rtow[index]
+
+    def rows(self):
+        """Yield a dict per airplane, runway end and condition, with its RTOW."""
+        for i, airplane in enumerate(self.airplanes):
+            for j in range(len(self.runways)):
+                for k, condition in enumerate(self.conditions):
+                    yield {'airplane': airplane, 'runway': str(self.runways.name[j]), **condition,
+                           'rtow': float(self.rtow[i, j, k])}
+
+
+class AirportAnalysis:
+    """RTOW analysis of airplanes × runway ends × takeoff conditions, recomputing only the changed cases.
+
+    airplanes maps names to Airplane, runways is a RunwayTable and conditions a list of dicts of the CONDITIONS to
+    set, all defaults by default. Runway ends with the same configuration are solved once (see RunwayTable.unique).
+    With cache_dir, the result of every case is stored there by its key, a fingerprint of all its inputs (see
+    TakeoffCase.key), so a rerun after a change, e.g. the TODA of a runway or the data of an airplane, only solves
+    the cases whose inputs changed and loads the others. Only the results of successful solves, converged within
+    max_violation, are loaded, the failed cases are solved again by every run.
+    """
+
+    def __init__(self, airplanes, runways, conditions=({},), cache_dir=None, elevator=None, phases=PHASES,
+                 engine_model='polynomial', max_violation=1e-4):
+        self.airplanes = dict(airplanes)
+        self.runways = runways
+        self.conditions = [_condition(condition) for condition in conditions]
+        self.cache_dir = cache_dir
+        self.elevator = elevator
+        self.phases = phases
+        self.engine_model = engine_model
+        self.max_violation = max_violation
+
+    def cases(self):
+        """Return the distinct cases, ordered by airplane, runway configuration and condition, and the index array
+        of the case of every airplane, runway end and condition."""
+        unique, inverse = self.runways.unique()
+        cases = [TakeoffCase(airplane, unique.runway(j), name=f'{name}/{unique.name[j]}', elevator=self.elevator,
+                             phases=self.phases, engine_model=self.engine_model, **condition)
+                 for name, airplane in self.airplanes.items()
+                 for j in range(len(unique))
+                 for condition in self.conditions]
+        shape = (len(self.airplanes), len(unique), len(self.conditions))
+        index = np.arange(len(cases)).reshape(shape)[:, inverse, :]
+        return cases, index
+
+    def pending(self, screen=False):
+        """Return the distinct cases without a cached successful result, those a run would solve."""
+        cases, _ = self.cases()
+        if self.cache_dir is None:
+            return cases
+        return [case for case in cases if _cached_result(self.cache_dir, case, case.estimate() if screen else None,
+                                                         self.max_violation) is None]
+
+    def run(self, profile=PRODUCTION, coloring_dir=None, screen=False, recover=False, budget=None):
+        """Solve the cases without a cached result and return the AirportResult, see run_batch for the options."""
+        cases, index = self.cases()
+        results, summary = run_batch(cases, profile=profile, coloring_dir=coloring_dir, screen=screen, recover=recover,
+                                     budget=budget, hotstart_dir=self.cache_dir, max_violation=self.max_violation)
+        return AirportResult(list(self.airplanes), self.runways, self.conditions, results, index, summary)
@@ -0,0 +1,125 @@
+import json
+import os
+
+from toa.models.atmosphere import P0
+from toa.traj.profile import PRODUCTION
+from toa.traj.recovery import solve_with_recovery
+from toa.traj.result import TakeoffResult
+from toa.traj.telemetry import aggregate_telemetry
+from toa.traj.variants import PHASES
+from toa.traj.variants import solve_key
+
+
+class TakeoffCase:
+    """Inputs of a single takeoff solve, mesh is the number of segments of the phases that differ from MESH."""
+
+    def __init__(self, airplane, runway, flap_angle=0.0, wind_speed=0.0, name=None, elevator=None, phases=PHASES,
+                 isa_deviation=0.0, qnh=P0, engine_model='polynomial', mesh=None):
+        self.airplane = airplane
+        self.runway = runway
+        self.flap_angle = flap_angle
+        self.wind_speed = wind_speed
+        self.name = name
+        self.elevator = elevator
+        self.phases = phases
+        self.isa_deviation = isa_deviation
+        self.qnh = qnh
+        self.engine_model = engine_model
+        self.mesh = mesh
+
+    def estimate(self):
+        """Return the closed form TakeoffEstimate of the case, see toa.analysis.estimator."""
+        from toa.analysis.estimator import TakeoffEstimate
+
+        return TakeoffEstimate.from_case(self)
+
+    def key(self, estimate=None, mesh=None, optimizer=None):
+        """Return the solve_key of the case, which names its stored optimizer history and result."""
+        mesh = self.mesh if mesh is None else mesh
+        return solve_key(self.airplane, self.runway, flap_angle=self.flap_angle, wind_speed=self.wind_speed,
+                         elevator=self.elevator, phases=self.phases, mesh=mesh, isa_deviation=self.isa_deviation,
+                         qnh=self.qnh, engine_model=self.engine_model, estimate=estimate, optimizer=optimizer)
+
+    def solve(self, profile=PRODUCTION, timer=None, warm_start=None, coloring_dir=None, estimate=None, mesh=None,
+              optimizer=None, hotstart_dir=None):
+        # OpenMDAO and dymos are only imported when a case is solved, loading cached results does not need them
+        from toa.traj.builder import solve_takeoff
+
+        mesh = self.mesh if mesh is None else mesh
+        return solve_takeoff(self.airplane, self.runway, flap_angle=self.flap_angle, wind_speed=self.wind_speed,
+                             elevator=self.elevator, phases=self.phases, mesh=mesh, profile=profile, timer=timer,
+                             warm_start=warm_start, coloring_dir=coloring_dir, isa_deviation=self.isa_deviation,
+                             qnh=self.qnh, engine_model=self.engine_model, estimate=estimate, optimizer=optimizer,
+                             hotstart_dir=hotstart_dir)
+
+
+def _result_file(hotstart_dir, case, estimate):
+    return os.path.join(hotstart_dir, f'{case.key(estimate=estimate)}.json')
+
+
+def _cached_result(hotstart_dir, case, estimate, max_violation=1e-4):
+    """Return the stored result of a case, None without one or when it did not succeed (see TakeoffResult)."""
+    result_file = _result_file(hotstart_dir, case, estimate)
+    if not os.path.exists(result_file):
+        return None
+    with open(result_file) as file:
+        result = TakeoffResult.from_dict(json.load(file))
+    return result if result.succeeded(max_violation) else None
+
+
+def run_batch(cases, profile=PRODUCTION, slow_factor=3.0, coloring_dir=None, screen=False, recover=False, budget=None,
+              hotstart_dir=None, max_violation=1e-4):
+    """Solve the cases in sequence.
+
+    Cases with the same problem structure share the total coloring cached in coloring_dir. With screen, each case
+    is first estimated in closed form (see TakeoffCase.estimate): cases that cannot take off even at half the MTOW
+    are skipped, with a None result, and the others are solved with the estimated RTOW and trajectory as initial
+    guess. With recover, failed solves are retried within budget seconds per case, see solve_with_recovery, and the
+    attempts of the retried cases are reported by case index. With hotstart_dir, the optimizer history of every case
+    and the result of every successful one, converged within max_violation, are stored there by case key (see
+    TakeoffCase.key): a rerun of an interrupted batch loads the results of the completed cases, reported as
+    resumed, without solving them and solves the interrupted and failed cases again, hot started from their stored
+    history. Returns the list of results and the aggregated telemetry of the solved cases, see aggregate_telemetry,
+    whose indices refer to the cases.
+    """
+    results = []
+    skipped = []
+    retried = {}
+    resumed = []
+    for i, case in enumerate(cases):
+        estimate = case.estimate() if screen else None
+        result_file = None if hotstart_dir is None else _result_file(hotstart_dir, case, estimate)
+        if estimate is not None and not estimate.feasible:
+            results.append(None)
+            skipped.append(i)
+            continue
+        cached = None if hotstart_dir is None else _cached_result(hotstart_dir, case, estimate, max_violation)
+        if cached is not None:
+            results.append(cached)
+            resumed.append(i)
+            continue
+
+        if recover:
+            result, attempts = solve_with_recovery(case, budget=budget, max_violation=max_violation, profile=profile,
+                                                   coloring_dir=coloring_dir, estimate=estimate,
+                                                   hotstart_dir=hotstart_dir)
+            if len(attempts) > 1:
+                retried[i] = [attempt.as_dict() for attempt in attempts]
+        else:
+            result = case.solve(profile=profile, coloring_dir=coloring_dir, estimate=estimate,
+                                hotstart_dir=hotstart_dir)
+        results.append(result)
+        if result_file is not None and result is not None and result.succeeded(max_violation):
+            with open(result_file, 'w') as file:
+                json.dump(result.as_dict(), file)
+
+    solved = [i for i, result in enumerate(results) if result is not None]
+    summary = aggregate_telemetry([results[i].telemetry for i in solved], slow_factor=slow_factor)
+    summary['cases'] = len(results)
+    summary['slow'] = [solved[i] for i in summary['slow']]
+    summary['not_converged'] = [solved[i] for i in summary['not_converged']]
+    summary['skipped'] = skipped
+    summary['failed'] = [i for i, result in enumerate(results) if result is None and i not in skipped]
+    summary['attempts'] = retried
+    summary['resumed'] = resumed
+    return results, summary
@@ -0,0 +1,489 @@
+import os
+
+import numpy as np
+import openmdao.api as om
+import dymos as dm
+
+from toa.models.atmosphere import P0
+from toa.models.conditions_group import ATMOSPHERE
+from toa.models.conditions_group import HIGH_LIFT
+from toa.models.conditions_group import TakeoffConditionsGroup
+from toa.ode.initialrun_ode import InitialRunODE
+from toa.ode.rotation_ode import RotationODE
+from toa.ode.transition_ode import TransitionODE
+from toa.runway import get_runway_condition
+from toa.traj.elevator import get_elevator
+from toa.traj.optimizers import get_optimizer
+from toa.traj.profile import DEVELOPMENT
+from toa.traj.profile import PRODUCTION
+from toa.traj.profile import get_profile
+from toa.traj.result import TakeoffResult
+from toa.traj.simulation import LazySimulation
+from toa.traj.telemetry import TelemetryRecorder
+from toa.traj.variants import MESH
+from toa.traj.variants import PHASES
+from toa.traj.variants import _check_mode
+from toa.traj.variants import _check_phases
+from toa.traj.variants import solve_key
+from toa.traj.variants import variant_key
+
+
+def build_takeoff_problem(airplane, runway, flap_angle=0.0, wind_speed=0.0, elevator=None, phases=PHASES,
+                          mesh=None, profile=PRODUCTION, warm_start=None, coloring_dir=None, isa_deviation=0.0,
+                          qnh=P0, engine_model='polynomial', estimate=None, mode='rtow', optimizer=None,
+                          hotstart_dir=None):
+    """Build, set up and initialize a takeoff problem.
+
+    Parameters
+    ----------
+    elevator : ElevatorParameterization or str
+        Parameterization of the elevator deflection or its name in toa.traj.elevator.ELEVATOR_MODES, full control
+        by default.
+    phases : tuple
+        Phases of the trajectory, all of them or only the initial run and rotation. Without the transition the
+        initial mass is maximized with the lift-off within the runway.
+    mesh : dict
+        Number of segments of the phases that differ from MESH.
+    warm_start : WarmStart
+        Solution used as initial guess instead of the default one.
+    coloring_dir : str
+        Directory where the total coloring is cached, one coloring per problem structure (see variant_key).
+    isa_deviation : float
+        Temperature deviation from the ISA in K, see isa_deviation in toa.models.atmosphere to get it from an
+        outside air temperature.
+    qnh : float
+        Sea level pressure along the ISA in Pa, the runway pressure altitude follows from it.
+    engine_model : str
+        'polynomial' thrust lapse and fuel flow models or 'deck' to interpolate the engine deck of the airplane.
+    estimate : TakeoffEstimate
+        Closed form estimate of the RTOW, without a warm start it seeds the initial guess. It does not bound the
+        initial mass, which keeps the bounds of the baseline problem. Ignored when not feasible.
+    mode : str
+        'rtow' to maximize the takeoff mass within the runway or 'distance' to minimize the distance to 35 ft of
+        the takeoff mass set as the initial mass state, regardless of the runway length.
+    optimizer : Optimizer or str
+        Driver backend or its name in OPTIMIZERS, pyoptsparse SLSQP when installed and scipy SLSQP otherwise.
+    hotstart_dir : str
+        Directory where the optimizer history of the solve is stored, one history per solve_key. A solve of the
+        same key resumes from the stored history, see Optimizer.hot_start. Ignored with a warm start.
+    """
+    profile = get_profile(profile)
+    elevator = get_elevator(elevator)
+    phases = _check_phases(phases)
+    if estimate is not None and not estimate.feasible:
+        estimate = None
+    mode = _check_mode(mode, phases)
+    mesh = dict(MESH, **(mesh or {}))
+    with_transition = 'transition' in phases
+
+    def ode_kwargs(name):
+        return {'airplane': airplane, 'coloring_report': profile.coloring_report,
+                'elevator_law': elevator.ode_law(phases.index(name), phases), 'shared_conditions': True,
+                'engine_model': engine_model}
+
+    p = profile.create_problem()
+
+    optimizer = get_optimizer(optimizer)
+    p.driver = optimizer.create_driver(profile)
+
+    if coloring_dir is not None:
+        p.options['coloring_dir'] = os.path.join(coloring_dir, variant_key(elevator, phases, mesh, engine_model, mode))
+        p.driver.declare_coloring()
+        if os.path.exists(os.path.join(p.options['coloring_dir'], 'total_coloring.pkl')):
+            p.driver.use_fixed_coloring()
+
+    p.model.linear_solver = om.DirectSolver()
+
+    # Atmosphere and high lift data only depend on static parameters, they are computed once for all phases
+    p.model.add_subsystem('conditions', TakeoffConditionsGroup(airplane=airplane))
+
+    traj = p.model.add_subsystem('traj', dm.Trajectory())
+
+    # --------------------------------------------- Initial Run --------------------------------------------------------
+    initial_run = dm.Phase(ode_class=InitialRunODE,
+                           transcription=dm.GaussLobatto(num_segments=mesh['initial_run'], compressed=False),
+                           ode_init_kwargs=ode_kwargs('initial_run'))
+
+    traj.add_phase('initial_run', initial_run)
+
+    initial_run.set_time_options(fix_initial=True, units='s', duration_bounds=(10, 100))
+
+    # Initial run states
+    initial_run.add_state(name='V', units='m/s', rate_source='initial_run_eom.v_dot', targets=['V'], fix_initial=True,
+                          fix_final=False, lower=0, ref=100, defect_ref=100)
+    initial_run.add_state(name='x', units='m', rate_source='initial_run_eom.x_dot',
+                          targets=['mlg_pos.x'], fix_initial=True, fix_final=False,
+                          lower=airplane.landing_gear.main.x, ref=1000, defect_ref=1000)
+    initial_run.add_state(name='mass', units='kg', rate_source='prop.m_dot',
+                          targets=['mass'], fix_initial=mode == 'distance', fix_final=False,
+                          lower=0.0, upper=airplane.limits.MTOW if mode == 'rtow' else None,
+                          ref=10000, defect_ref=10000)
+
+    # Initial run parameters
+    initial_run.add_parameter(name='theta', val=0.0, units='deg', desc='Pitch Angle',
+                              targets=['aero.alpha', 'initial_run_eom.alpha',
+                                       'mlg_pos.theta'], opt=False, include_timeseries=True)
+    initial_run.add_parameter(name='h', val=0.0, units='m',
+                              desc='Vertical CG position',
+                              targets=['mlg_pos.h', 'aero.ground_effect.h'], opt=False, include_timeseries=True)
+
+    # path constraint
+    initial_run.add_path_constraint(name='initial_run_eom.f_mg', lower=0, units='N')
+    initial_run.add_path_constraint(name='initial_run_eom.f_ng', lower=0, units='N')
+
+    initial_run.add_boundary_constraint(name='initial_run_eom.f_ng', loc='final', units='N', lower=0.0, upper=0.2,
+                                        shape=(1,))
+
+    elevator.add_to(initial_run, 'initial_run')
+
+    if not with_transition:
+        initial_run.add_objective('mass', loc='initial', scaler=-1)
+
+    initial_run.add_timeseries_output('initial_run_eom.f_mg', units='kN')
+    initial_run.add_timeseries_output('initial_run_eom.f_ng', units='kN')
+    initial_run.add_timeseries_output('initial_run_eom.v_dot')
+    initial_run.add_timeseries_output('aero.CL')
+    initial_run.add_timeseries_output('aero.cl_ground_corr.CLg')
+    initial_run.add_timeseries_output('aero.CD')
+    initial_run.add_timeseries_output('aero.Cm')
+    initial_run.add_timeseries_output('prop.thrust')
+    initial_run.add_timeseries_output('mlg_pos.x_mlg')
+    initial_run.add_timeseries_output('mlg_pos.h_mlg', units='ft')
+    initial_run.add_timeseries_output('tas_comp.tas')
+
+    # --------------------------------------------- Rotation -----------------------------------------------------------
+    rotation = dm.Phase(ode_class=RotationODE,
+                        transcription=dm.GaussLobatto(num_segments=mesh['rotation'], compressed=False),
+                        ode_init_kwargs=ode_kwargs('rotation'))
+    traj.add_phase(name='rotation', phase=rotation)
+
+    rotation.set_time_options(fix_initial=False, units='s', duration_bounds=(1, 20))
+
+    # Rotation states
+    rotation.add_state(name='V', units='m/s', rate_source='rotation_eom.v_dot',
+                       targets=['V'], fix_initial=False, fix_final=False, lower=0, ref=100, defect_ref=100)
+    rotation.add_state(name='x', units='m', rate_source='rotation_eom.x_dot',
+                       targets=['mlg_pos.x'], fix_initial=False, fix_final=False, lower=0, ref=1000,
+                       defect_ref=1000)
+    rotation.add_state(name='h', units='m', rate_source='rotation_eom.h_dot',
+                       targets=['mlg_pos.h', 'aero.ground_effect.h'], lower=airplane.landing_gear.main.z,
+                       fix_initial=True, fix_final=False, ref=10,
+                       defect_ref=10)
+    rotation.add_state(name='mass', units='kg', rate_source='prop.m_dot', targets=['mass'],
+                       fix_initial=False, fix_final=False, lower=0.0, ref=10000, defect_ref=10000)
+    rotation.add_state(name='theta', units='deg', rate_source='rotation_eom.theta_dot',
+                       targets=['aero.alpha', 'rotation_eom.alpha', 'mlg_pos.theta'],
+                       fix_initial=True, fix_final=False, lower=0.0, ref=10, defect_ref=10)
+    rotation.add_state(name='q', units='deg/s', rate_source='rotation_eom.q_dot',
+                       targets=['q'], fix_initial=True, fix_final=False, lower=0.0, ref=10, defect_ref=10)
+
+    # Rotation controls
+    elevator.add_to(rotation, 'rotation')
+
+    # Rotation path constraints
+    rotation.add_path_constraint(name='rotation_eom.f_mg', lower=0, units='N')
+
+    # Rotation boundary constraint
+    rotation.add_boundary_constraint(name='rotation_eom.f_mg', loc='final', units='N', lower=0.0, upper=0.2, shape=(1,))
+    rotation.add_boundary_constraint(name='V', loc='final', units='m/s', upper=93, shape=(1,))
+    if not with_transition:
+        rotation.add_boundary_constraint(name='x', loc='final', units='m', upper=runway.tora, shape=(1,))
+
+    rotation.add_timeseries_output('rotation_eom.f_mg', units='kN')
+    rotation.add_timeseries_output('rotation_eom.h_dot', units='ft/min')
+    rotation.add_timeseries_output('rotation_eom.v_dot')
+    rotation.add_timeseries_output('aero.CL')
+    rotation.add_timeseries_output('aero.cl_ground_corr.CLg')
+    rotation.add_timeseries_output('aero.CD')
+    rotation.add_timeseries_output('aero.Cm')
+    rotation.add_timeseries_output('aero.D')
+    rotation.add_timeseries_output('prop.thrust')
+    rotation.add_timeseries_output('mlg_pos.x_mlg')
+    rotation.add_timeseries_output('mlg_pos.h_mlg', units='ft')
+    rotation.add_timeseries_output('tas_comp.tas')
+
+    # --------------------------------------------- Transition ---------------------------------------------------------
+    if with_transition:
+        transition = dm.Phase(ode_class=TransitionODE,
+                              transcription=dm.GaussLobatto(num_segments=mesh['transition'], compressed=False),
+                              ode_init_kwargs=ode_kwargs('transition'))
+        traj.add_phase(name='transition', phase=transition)
+
+        transition.set_time_options(fix_initial=False, units='s')
+
+        # states
+        transition.add_state(name='V', units='m/s', rate_source='transition_eom.v_dot',
+                             targets=['V'], fix_initial=False, fix_final=False, lower=0, ref=100, defect_ref=100)
+        transition.add_state(name='x', units='m', rate_source='transition_eom.x_dot',
+                             targets=['mlg_pos.x', 'obj_cmp.x'], fix_initial=False, fix_final=False, lower=0,
+                             ref=1000, defect_ref=1000)
+        transition.add_state(name='h', units='m', rate_source='transition_eom.h_dot',
+                             targets=['mlg_pos.h', 'aero.ground_effect.h'], lower=0.0, fix_initial=False,
+                             fix_final=False, ref=10, defect_ref=10)
+        transition.add_state(name='mass', units='kg', rate_source='prop.m_dot', targets=['mass'],
+                             fix_initial=False, fix_final=False, lower=0.0, ref=10000, defect_ref=10000)
+        transition.add_state(name='theta', units='deg', rate_source='transition_eom.theta_dot',
+                             targets=['theta'],
+                             fix_initial=False, fix_final=False, lower=0.0, ref=10, defect_ref=10)
+        transition.add_state(name='gam', units='deg', rate_source='transition_eom.gam_dot',
+                             targets=['gam'],
+                             fix_initial=True, fix_final=False, lower=0.0, ref=10, defect_ref=10)
+        transition.add_state(name='q', units='deg/s', rate_source='transition_eom.q_dot',
+                             targets=['q'], fix_initial=False, fix_final=False, lower=0.0, ref=10, defect_ref=10)
+
+        # controls
+        elevator.add_to(transition, 'transition')
+
+        # path constraints
+        transition.add_path_constraint(name='aero.alpha_lim.alphadiff', lower=0.0, units='rad')
+
+        # Boundary Constraint
+        if mode == 'rtow':
+            transition.add_boundary_constraint(name='mlg_pos.x_mlg', loc='final', units='m', upper=runway.toda,
+                                               shape=(1,))
+        transition.add_boundary_constraint(name='mlg_pos.h_mlg', loc='final', units='ft', equals=35.0, shape=(1,))
+        transition.add_boundary_constraint(name='v_vs_comp.V_Vstall', loc='final', units=None, lower=1.13,
+                                           shape=(1,))
+
+        if mode == 'rtow':
+            transition.add_objective('obj_cmp.obj', loc='final')
+        else:
+            transition.add_objective('mlg_pos.x_mlg', loc='final', ref=1000.0)
+
+        transition.add_timeseries_output('transition_eom.h_dot', units='ft/min')
+        transition.add_timeseries_output('transition_eom.v_dot')
+        transition.add_timeseries_output('transition_eom.x_dot')
+        transition.add_timeseries_output('alpha_comp.alpha')
+        transition.add_timeseries_output('prop.thrust')
+        transition.add_timeseries_output('mlg_pos.x_mlg')
+        transition.add_timeseries_output('mlg_pos.h_mlg', units='ft')
+        transition.add_timeseries_output('tas_comp.tas')
+        transition.add_timeseries_output('v_vs_comp.V_Vstall')
+
+    # ---------------------------------------- Trajectory Parameters ---------------------------------------------------
+    def targets(target, phase_names=phases):
+        return {name: [target.format(phase=name)] for name in phase_names}
+
+    traj.add_parameter(name='dih', val=0.0, units='deg', lower=-5.0, upper=5.0,
+                       desc='Horizontal stabilizer angle',
+                       targets=targets('aero.dih'),
+                       opt=True, dynamic=False)
+    traj.add_parameter(name='Vw', val=0.0, units='m/s',
+                       desc='Wind speed along the runway, defined as positive for a headwind',
+                       targets=targets('Vw'),
+                       opt=False)
+    traj.add_parameter(name='flap_angle', val=0.0, units='deg', desc='Flap defletion',
+                       targets=targets('aero.flap_angle'),
+                       opt=False, dynamic=False)
+    if engine_model == 'polynomial':
+        traj.add_parameter(name='pressure_altitude', val=0.0, units='m', desc='Runway pressure altitude',
+                           targets=targets('elevation'),
+                           opt=False, dynamic=False)
+        p.model.connect('conditions.pressure_altitude', 'traj.parameters:pressure_altitude')
+    traj.add_parameter(name='isa_deviation', val=0.0, units='K', desc='Temperature deviation from the ISA',
+                       targets=targets('isa_deviation'),
+                       opt=False, dynamic=False)
+    traj.add_parameter(name='rw_slope', val=0.0, units='rad', desc='Runway slope',
+                       targets=targets('{phase}_eom.rw_slope', PHASES[:2]),
+                       opt=False, dynamic=False)
+    traj.add_parameter(name='mu', val=0.025, units=None, desc='Rolling friction coefficient',
+                       targets=targets('{phase}_eom.mu', PHASES[:2]),
+                       opt=False, dynamic=False)
+    elevator.add_parameters(traj, phases)
+
+    # Outputs of the conditions group, CLmax is only used by the transition
+    units = {'rho': 'kg/m**3', 'sos': 'm/s', 'p_amb': 'Pa', 'CLa': '1/rad', 'alpha_max': 'deg'}
+    for name in ATMOSPHERE + HIGH_LIFT:
+        if name == 'CLmax' and not with_transition:
+            continue
+        traj.add_parameter(name=name, units=units.get(name),
+                           targets=targets(name, ['transition'] if name == 'CLmax' else phases),
+                           opt=False, dynamic=False)
+        p.model.connect(f'conditions.{name}', f'traj.parameters:{name}')
+    p.model.connect('conditions.isa_deviation', 'traj.parameters:isa_deviation')
+    p.model.connect('conditions.flap_angle', 'traj.parameters:flap_angle')
+
+    # ------------------------------------------------ Link Phases -----------------------------------------------------
+    de = ['de'] if elevator.linked else []
+    traj.link_phases(phases=['initial_run', 'rotation'], vars=['time', 'V', 'x', 'mass'] + de)
+    if with_transition:
+        traj.link_phases(phases=['rotation', 'transition'], vars=['time', 'V', 'x', 'mass', 'h', 'theta', 'q'] + de)
+
+    p.setup(check=profile.check)
+    profile.configure_problem(p)
+
+    p.set_val('conditions.elevation', runway.elevation)
+    p.set_val('traj.parameters:rw_slope', runway.slope)
+    set_runway_condition(p, runway.condition)
+    set_atmosphere(p, isa_deviation=isa_deviation, qnh=qnh)
+    p.set_val('conditions.flap_angle', flap_angle)
+    p.set_val('traj.parameters:dih', 0.0)
+    p['traj.parameters:Vw'] = wind_speed
+
+    p['traj.initial_run.parameters:h'] = airplane.landing_gear.main.z
+
+    elevator.set_initial_guess(p, traj)
+
+    if warm_start is not None:
+        warm_start.apply(p)
+    else:
+        set_initial_guess(p, airplane, runway, estimate=estimate)
+
+    if hotstart_dir is not None and warm_start is None:
+        os.makedirs(hotstart_dir, exist_ok=True)
+        key = solve_key(airplane, runway, flap_angle=flap_angle, wind_speed=wind_speed, elevator=elevator,
+                        phases=phases, mesh=mesh, isa_deviation=isa_deviation, qnh=qnh, engine_model=engine_model,
+                        estimate=estimate, mode=mode, optimizer=optimizer)
+        optimizer.hot_start(p, os.path.join(hotstart_dir, key))
+
+    return p
+
+
+def set_runway_condition(p, condition):
+    """Set the friction of a runway condition, or of its name in RUNWAY_CONDITIONS, on a built problem.
+
+    The friction is a trajectory parameter, so runway conditions can be swept without rebuilding the problem.
+    """
+    p.set_val('traj.parameters:mu', get_runway_condition(condition).mu)
+
+
+def set_atmosphere(p, isa_deviation=0.0, qnh=P0):
+    """Set the ISA deviation in K and the QNH in Pa on a built problem, without rebuilding it."""
+    p.set_val('conditions.isa_deviation', isa_deviation)
+    p.set_val('conditions.qnh', qnh)
+
+
+def set_initial_guess(p, airplane, runway, estimate=None):
+    """Set the initial guess of the phase times and states, the default one or the trajectory of a TakeoffEstimate."""
+    phases = p.model.traj._phases
+    initial_run = phases['initial_run']
+    rotation = phases['rotation']
+
+    xmg = airplane.landing_gear.main.x
+    if estimate is None:
+        mass = airplane.limits.MTOW
+        t_ground, t_rotation, t_air = 60, 3, 10
+        x = [xmg, 0.7 * runway.tora, 0.8 * runway.tora, runway.toda]
+        V = [0, 60, 70, 80]
+    else:
+        guess = estimate.trajectory
+        mass = estimate.rtow
+        t_ground, t_rotation, t_air = guess['t_ground'], guess['t_rotation'], guess['t_air']
+        x = [xmg, xmg + guess['ground_run'], xmg + guess['liftoff'], xmg + guess['distance']]
+        V = [0, guess['VR_ground'], guess['Vlof_ground'], guess['Vlof_ground'] + 10]
+
+    p.set_val('traj.initial_run.t_initial', 0)
+    p.set_val('traj.initial_run.t_duration', t_ground)
+    p.set_val('traj.rotation.t_initial', t_ground)
+    p.set_val('traj.rotation.t_duration', t_rotation)
+
+    p['traj.initial_run.states:x'] = initial_run.interpolate(ys=x[0:2], nodes='state_input')
+    p['traj.initial_run.states:V'] = initial_run.interpolate(ys=V[0:2], nodes='state_input')
+    p['traj.initial_run.states:mass'] = initial_run.interpolate(ys=[mass, mass - 100], nodes='state_input')
+
+    p['traj.rotation.states:x'] = rotation.interpolate(ys=x[1:3], nodes='state_input')
+    p['traj.rotation.states:V'] = rotation.interpolate(ys=V[1:3], nodes='state_input')
+    p['traj.rotation.states:mass'] = rotation.interpolate(ys=[mass - 100, mass - 200], nodes='state_input')
+    p['traj.rotation.states:h'] = airplane.landing_gear.main.z
+    p['traj.rotation.states:q'] = rotation.interpolate(ys=[0.0, 10.0], nodes='state_input')
+    p['traj.rotation.states:theta'] = rotation.interpolate(ys=[0.0, 10.0], nodes='state_input')
+
+    if 'transition' not in phases:
+        return
+
+    transition = phases['transition']
+    p.set_val('traj.transition.t_initial', t_ground + t_rotation)
+    p.set_val('traj.transition.t_duration', t_air)
+
+    p['traj.transition.states:x'] = transition.interpolate(ys=x[2:4], nodes='state_input')
+    p['traj.transition.states:V'] = transition.interpolate(ys=V[2:4], nodes='state_input')
+    p['traj.transition.states:mass'] = transition.interpolate(ys=[mass - 200, mass - 300], nodes='state_input')
+    p['traj.transition.states:h'] = transition.interpolate(ys=[airplane.landing_gear.main.z, 35 * 0.3048],
+                                                           nodes='state_input')
+    p['traj.transition.states:q'] = transition.interpolate(ys=[10.0, 5.0], nodes='state_input')
+    p['traj.transition.states:theta'] = transition.interpolate(ys=[10.0, 12.0], nodes='state_input')
+    p['traj.transition.states:gam'] = transition.interpolate(ys=[0.0, 5.0], nodes='state_input')
+
+
+def solve_problem(p, timer=None, simulate=False, parallel_simulation=False):
+    """Run the driver of a built takeoff problem and return the results as a TakeoffResult.
+
+    The explicit simulation of the optimized trajectory is only run when the result simulation is first accessed,
+    or right away when simulate is True. A ComponentTimer passed as timer accumulates the ODE component timings of
+    the optimization.
+    """
+    if timer is not None:
+        timer.attach(p)
+
+    recorder = TelemetryRecorder(p)
+    try:
+        recorder.run_driver(lambda: dm.run_problem(p))
+    finally:
+        if timer is not None:
+            timer.detach()
+
+    sim = LazySimulation(p.model.traj, parallel=parallel_simulation, recorder=recorder)
+    if simulate:
+        sim.run()
+
+    return TakeoffResult.from_problem(p, simulation=sim, telemetry=recorder.telemetry)
+
+
+def solve_takeoff(airplane, runway, flap_angle=0.0, wind_speed=0.0, elevator=None, phases=PHASES, mesh=None,
+                  profile=PRODUCTION, warm_start=None, coloring_dir=None, timer=None, simulate=False,
+                  parallel_simulation=False, isa_deviation=0.0, qnh=P0, engine_model='polynomial', estimate=None,
+                  optimizer=None, hotstart_dir=None):
+    """Build and solve a takeoff problem, see build_takeoff_problem and solve_problem."""
+    p = build_takeoff_problem(airplane, runway, flap_angle=flap_angle, wind_speed=wind_speed, elevator=elevator,
+                              phases=phases, mesh=mesh, profile=profile, warm_start=warm_start,
+                              coloring_dir=coloring_dir, isa_deviation=isa_deviation, qnh=qnh,
+                              engine_model=engine_model, estimate=estimate, optimizer=optimizer,
+                              hotstart_dir=hotstart_dir)
+    return solve_problem(p, timer=timer, simulate=simulate, parallel_simulation=parallel_simulation)
+
+
+def set_takeoff_mass(p, mass):
+    """Shift the mass states of every phase of a built problem so the initial mass is mass in kg.
+
+    The current states are kept otherwise, so a solution of another mass is the initial guess of the new one.
+    """
+    delta = mass - p.get_val('traj.initial_run.states:mass', units='kg')[0, 0]
+    for name in p.model.traj._phases:
+        p.set_val(f'traj.{name}.states:mass', p.get_val(f'traj.{name}.states:mass', units='kg') + delta, units='kg')
+
+
+def solve_required_distance(airplane, runway, masses, flap_angle=0.0, wind_speed=0.0, elevator=None, mesh=None,
+                            profile=PRODUCTION, coloring_dir=None, timer=None, simulate=False, isa_deviation=0.0,
+                            qnh=P0, engine_model='polynomial', estimate=None):
+    """Minimum distance to 35 ft of each takeoff mass in kg, the required TODA, as a list of TakeoffResult.
+
+    A single problem is built in the distance mode (see build_takeoff_problem) and the masses are solved in the
+    given order, each one from the solution of the previous one, so sorted masses make the best warm starts. The
+    results share the problem, which holds the solution of the last mass, their values and telemetry belong to each
+    mass. The simulation of each mass is run before the next one is solved with simulate, otherwise only the last
+    result has a (lazy) simulation.
+    """
+    p = build_takeoff_problem(airplane, runway, flap_angle=flap_angle, wind_speed=wind_speed, elevator=elevator,
+                              mesh=mesh, profile=profile, coloring_dir=coloring_dir, isa_deviation=isa_deviation,
+                              qnh=qnh, engine_model=engine_model, estimate=estimate, mode='distance')
+    results = []
+    for mass in np.atleast_1d(masses):
+        if results and not simulate:
+            # The lazy simulation of the previous mass would simulate the states of the next one
+            results[-1].simulation = None
+        set_takeoff_mass(p, float(mass))
+        results.append(solve_problem(p, timer=timer, simulate=simulate))
+    return results
+
+
+def run_takeoff(airplane, runway, flap_angle=0.0, wind_speed=0.0, elevator=None, phases=PHASES, profile=DEVELOPMENT,
+                timer=None):
+    """Solve the takeoff, print the results and return the problem and its (lazy) simulation."""
+    result = solve_takeoff(airplane, runway, flap_angle=flap_angle, wind_speed=wind_speed, elevator=elevator,
+                           phases=phases, profile=profile, timer=timer)
+
+    print(result.summary())
+    if timer is not None:
+        print(timer.report())
+
+    return result.problem, result.simulation
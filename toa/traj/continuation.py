@@ -0,0 +1,125 @@
+import copy
+
+from toa.runway import Runway
+from toa.traj.profile import PRODUCTION
+from toa.traj.warm_start import WarmStart
+
+# Parameters a continuation can march, with the runway ones applied to a copy of the case runway
+RUNWAY_PARAMETERS = ('length', 'elevation', 'slope')
+CASE_PARAMETERS = ('wind_speed', 'isa_deviation', 'flap_angle')
+PARAMETERS = RUNWAY_PARAMETERS + CASE_PARAMETERS
+
+
+def parameter_value(case, parameter):
+    """Return the value of a continuation parameter in a TakeoffCase, the runway length is its TORA."""
+    if parameter == 'length':
+        return case.runway.tora
+    if parameter in RUNWAY_PARAMETERS:
+        return getattr(case.runway, parameter)
+    return getattr(case, parameter)
+
+
+def with_parameter(case, parameter, value):
+    """Return a copy of a TakeoffCase with a continuation parameter set to value."""
+    if parameter not in PARAMETERS:
+        raise ValueError(f"Unknown continuation parameter '{parameter}', expected one of {PARAMETERS}")
+    case = copy.copy(case)
+    if parameter in RUNWAY_PARAMETERS:
+        runway = case.runway
+        data = {'length': runway.tora, 'elevation': runway.elevation, 'slope': runway.slope, parameter: value}
+        case.runway = Runway(data['length'], runway.clearway, runway.stopway, data['elevation'], data['slope'],
+                             condition=runway.condition)
+    else:
+        setattr(case, parameter, value)
+    return case
+
+
+class ContinuationPoint:
+    """Converged solve of a continuation, a chart point at value of the marched parameter."""
+
+    def __init__(self, value, case, result):
+        self.value = value
+        self.case = case
+        self.result = result
+
+    def __repr__(self):
+        return f'ContinuationPoint(value={self.value}, rtow={self.result.rtow})'
+
+
+class Continuation:
+    """Marches a parameter of a takeoff case from its value in the case, an easy case, to a target.
+
+    Each step is solved from the previous converged solution. A solve fails when the driver reports a failure, when
+    its largest constraint violation exceeds max_violation or when it raises. The step is multiplied by shrink after
+    a failed solve and by grow after a solve converging within quick_iterations, bounded by max_step. The march
+    stops when the target is reached or when the step falls below min_step. Iterating yields a ContinuationPoint per
+    converged solve, so every intermediate solution is available as soon as it is solved; the failed values are
+    kept in failures and the errors raised by their solves in errors, by value.
+    """
+
+    def __init__(self, case, parameter, target, step=None, min_step=None, max_step=None, grow=1.5, shrink=0.5,
+                 quick_iterations=20, max_violation=1e-4, profile=PRODUCTION, coloring_dir=None):
+        self.case = case
+        self.parameter = parameter
+        self.start = parameter_value(case, parameter)
+        self.target = target
+        span = abs(target - self.start)
+        self.step = span / 4 if step is None else abs(step)
+        self.min_step = span / 64 if min_step is None else min_step
+        self.max_step = span if max_step is None else max_step
+        self.grow = grow
+        self.shrink = shrink
+        self.quick_iterations = quick_iterations
+        self.max_violation = max_violation
+        self.profile = profile
+        self.coloring_dir = coloring_dir
+        self.points = []
+        self.failures = []
+        self.errors = {}
+
+    @property
+    def reached(self):
+        return bool(self.points) and self.points[-1].value == self.target
+
+    def _solve(self, value, warm_start):
+        case = with_parameter(self.case, self.parameter, value)
+        try:
+            result = case.solve(profile=self.profile, warm_start=warm_start, coloring_dir=self.coloring_dir)
+        except Exception as exc:
+            self.errors[value] = f'{type(exc).__name__}: {exc}'
+            result = None
+        telemetry = None if result is None else result.telemetry
+        if result is None or not result.converged or \
+                (telemetry is not None and telemetry.constraint_violation > self.max_violation):
+            self.failures.append(value)
+            return None
+        point = ContinuationPoint(value, case, result)
+        self.points.append(point)
+        return point
+
+    def __iter__(self):
+        point = self._solve(self.start, None)
+        if point is None:
+            return
+        yield point
+
+        step = self.step
+        direction = 1.0 if self.target >= self.start else -1.0
+        while point.value != self.target and step >= self.min_step:
+            remaining = abs(self.target - point.value)
+            value = self.target if step >= remaining else point.value + direction * step
+            candidate = self._solve(value, WarmStart.from_problem(point.result.problem))
+            if candidate is None:
+                step *= self.shrink
+                continue
+            point = candidate
+            yield point
+            telemetry = point.result.telemetry
+            if telemetry is not None and telemetry.iterations <= self.quick_iterations:
+                step = min(step * self.grow, self.max_step)
+
+    def run(self):
+        """March to the target and return the converged points."""
+        for _ in self:
+            pass
+        return self.points
@@ -0,0 +1,213 @@
+import numpy as np
+
+
+class ElevatorParameterization:
+    """Base class of the ways the elevator deflection (de) is defined in the takeoff phases.
+
+    Subclasses either add de to each phase as a control (add_to) or compute it inside the ODE from a few trajectory
+    parameters (ode_law and add_parameters). timeseries is the phase timeseries name of de and linked tells if de
+    has to be linked between phases.
+    """
+
+    timeseries = 'controls:de'
+    linked = True
+
+    def ode_law(self, index, phases):
+        """Return the elevator_law option of the ODE of the phase at index in phases, None if de is an input."""
+        return None
+
+    def add_to(self, phase, name):
+        pass
+
+    def add_parameters(self, traj, phases):
+        pass
+
+    def set_initial_guess(self, p, traj):
+        pass
+
+
+class FullControl(ElevatorParameterization):
+    """Elevator deflection as a dymos control, optimized at every control node."""
+
+    def __init__(self, lower=-20.0, upper=20.0, ref=10.0):
+        self.lower = lower
+        self.upper = upper
+        self.ref = ref
+
+    def add_to(self, phase, name):
+        phase.add_control(name='de', units='deg', lower=self.lower, upper=self.upper, targets=['aero.de'],
+                          rate_continuity=True, ref=self.ref)
+
+    def set_initial_guess(self, p, traj):
+        rotation = traj._phases['rotation']
+        p['traj.rotation.controls:de'] = rotation.interpolate(ys=[0.0, self.lower], nodes='control_input')
+
+    def __repr__(self):
+        return f'FullControl(lower={self.lower}, upper={self.upper}, ref={self.ref})'
+
+
+class PolynomialControl(ElevatorParameterization):
+    """Elevator deflection as a polynomial of the phase time, only its order + 1 coefficients are optimized."""
+
+    timeseries = 'polynomial_controls:de'
+
+    def __init__(self, order=2, lower=-20.0, upper=20.0):
+        self.order = order
+        self.lower = lower
+        self.upper = upper
+
+    def add_to(self, phase, name):
+        phase.add_polynomial_control(name='de', val=0.0, units='deg', lower=self.lower, upper=self.upper,
+                                     targets=['aero.de'], order=self.order)
+
+    def __repr__(self):
+        return f'PolynomialControl(order={self.order}, lower={self.lower}, upper={self.upper})'
+
+
+class FixedSchedule(ElevatorParameterization):
+    """Prescribed elevator deflection, not optimized.
+
+    The schedule maps each phase to a constant deflection or to the (initial, final) deflections of a linear
+    variation along the phase, in deg. The phases are not linked on de since the schedule is fixed.
+    """
+
+    linked = False
+
+    SCHEDULE = {
+        'initial_run': 0.0,
+        'rotation': (0.0, -20.0),
+        'transition': -20.0,
+        }
+
+    def __init__(self, schedule=None):
+        self.schedule = dict(self.SCHEDULE)
+        if schedule is not None:
+            self.schedule.update(schedule)
+
+    def _values(self, name):
+        value = self.schedule[name]
+        if isinstance(value, (tuple, list)):
+            return list(value)
+        return [value, value]
+
+    def add_to(self, phase, name):
+        phase.add_control(name='de', units='deg', val=self._values(name)[0], targets=['aero.de'], opt=False)
+
+    def set_initial_guess(self, p, traj):
+        for name, phase in traj._phases.items():
+            p[f'traj.{name}.controls:de'] = phase.interpolate(ys=self._values(name), nodes='control_input')
+
+    def __repr__(self):
+        return f'FixedSchedule({self.schedule})'
+
+
+class _ElevatorLaw(ElevatorParameterization):
+    """Elevator deflection computed in the ODE by an elevator law, bounded by path constraints."""
+
+    timeseries = 'de'
+    linked = False
+
+    def __init__(self, lower=-20.0, upper=20.0):
+        self.lower = lower
+        self.upper = upper
+
+    def add_to(self, phase, name):
+        phase.add_path_constraint(name='elevator.de', lower=self.lower, upper=self.upper, units='deg')
+        phase.add_timeseries_output('elevator.de')
+
+
+class PiecewiseLinearControl(_ElevatorLaw):
+    """Elevator deflection linear between a few knots evenly spaced along each phase.
+
+    Consecutive phases share their boundary knot, so de is continuous and the whole trajectory is defined by
+    len(phases) * (knots - 1) + 1 values.
+    """
+
+    def __init__(self, knots=3, lower=-20.0, upper=20.0):
+        super().__init__(lower=lower, upper=upper)
+        if knots < 2:
+            raise ValueError(f'A piecewise linear control needs at least 2 knots per phase, got {knots}')
+        self.knots = knots
+
+    def total_knots(self, phases):
+        return len(phases) * (self.knots - 1) + 1
+
+    def ode_law(self, index, phases):
+        return {'law': 'knots', 'num_knots': self.knots, 'offset': index * (self.knots - 1),
+                'total_knots': self.total_knots(phases)}
+
+    def add_to(self, phase, name):
+        super().add_to(phase, name)
+        phase.set_time_options(time_phase_targets=['t_phase'], t_duration_targets=['t_duration'])
+
+    def add_parameters(self, traj, phases):
+        traj.add_parameter(name='de_knots', shape=(self.total_knots(phases),), units='deg', lower=self.lower,
+                           upper=self.upper, desc='Elevator deflection at the knots',
+                           targets={name: ['de_knots'] for name in phases},
+                           opt=True, dynamic=False)
+
+    def set_initial_guess(self, p, traj):
+        phases = list(traj._phases)
+        guess = np.zeros(self.total_knots(phases))
+        # Pull the elevator along the rotation and hold it during the transition
+        start = phases.index('rotation') * (self.knots - 1)
+        guess[start:start + self.knots] = np.linspace(0.0, self.lower, self.knots)
+        guess[start + self.knots:] = self.lower
+        p['traj.parameters:de_knots'] = guess
+
+    def __repr__(self):
+        return f'PiecewiseLinearControl(knots={self.knots}, lower={self.lower}, upper={self.upper})'
+
+
+class RotationRateLaw(_ElevatorLaw):
+    """Elevator deflection of a pitch rate law tracking a fixed rotation rate, see ElevatorRateLawComp.
+
+    Only the trim deflection and the gain of the law are optimized, for the whole trajectory.
+    """
+
+    def __init__(self, q_cmd=3.0, max_gain=10.0, lower=-20.0, upper=20.0):
+        super().__init__(lower=lower, upper=upper)
+        self.q_cmd = q_cmd
+        self.max_gain = max_gain
+
+    def ode_law(self, index, phases):
+        return {'law': 'rate', 'q_cmd': self.q_cmd}
+
+    def add_parameters(self, traj, phases):
+        traj.add_parameter(name='de_trim', val=0.0, units='deg', lower=self.lower, upper=self.upper,
+                           desc='Elevator deflection at the commanded pitch rate',
+                           targets={name: ['de_trim'] for name in phases},
+                           opt=True, dynamic=False)
+        traj.add_parameter(name='de_gain', val=1.0, units='s', lower=0.0, upper=self.max_gain,
+                           desc='Elevator deflection per pitch rate error',
+                           targets={name: ['de_gain'] for name in phases},
+                           opt=True, dynamic=False)
+
+    def set_initial_guess(self, p, traj):
+        p['traj.parameters:de_trim'] = 0.0
+        p['traj.parameters:de_gain'] = 2.0
+
+    def __repr__(self):
+        return f'RotationRateLaw(q_cmd={self.q_cmd}, max_gain={self.max_gain}, lower={self.lower}, ' \
+               f'upper={self.upper})'
+
+
+# Elevator parameterizations by name, as accepted by the solve functions
+ELEVATOR_MODES = {
+    'full': FullControl,
+    'polynomial': PolynomialControl,
+    'piecewise_linear': PiecewiseLinearControl,
+    'rotation_rate': RotationRateLaw,
+    'fixed': FixedSchedule,
+    }
+
+
+def get_elevator(elevator=None, **kwargs):
+    """Return an elevator parameterization from an instance, a name of ELEVATOR_MODES or None (full control)."""
+    if elevator is None:
+        elevator = 'full'
+    if isinstance(elevator, ElevatorParameterization):
+        return elevator
+    if elevator not in ELEVATOR_MODES:
+        raise ValueError(f"Unknown elevator mode '{elevator}', expected one of {sorted(ELEVATOR_MODES)}")
+    return ELEVATOR_MODES[elevator](**kwargs)
@@ -0,0 +1,29 @@
+import hashlib
+import json
+
+import numpy as np
+
+
+def canonical(value):
+    """Return a JSON serializable form of value, objects are replaced by their type name and attributes."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {str(key): canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [canonical(item) for item in value]
+    attributes = getattr(value, '__dict__', None)
+    if attributes is None:
+        slots = [slot for cls in type(value).__mro__ for slot in getattr(cls, '__slots__', ())]
+        if not slots:
+            return repr(value)
+        attributes = {slot: getattr(value, slot) for slot in slots if hasattr(value, slot)}
+    return {'__type__': type(value).__qualname__, **canonical(attributes)}
+
+
+def fingerprint(*values):
+    """Return a hex digest identifying values, equal for values with equal contents."""
+    data = json.dumps(canonical(values), sort_keys=True)
+    return hashlib.sha1(data.encode()).hexdigest()
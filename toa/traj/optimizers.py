@@ -0,0 +1,164 @@
+import importlib.util
+import os
+import shutil
+
+
+def pyoptsparse_available():
+    return importlib.util.find_spec('pyoptsparse') is not None
+
+
+class Optimizer:
+    """Driver backend of the takeoff problems, with default settings tuned for the takeoff trajectory.
+
+    settings updates the defaults, they are the driver options of ScipyOptimizeDriver or the optimizer settings
+    (opt_settings) of pyOptSparseDriver.
+    """
+
+    name = None
+    pyoptsparse = True
+    SETTINGS = {}
+
+    def __init__(self, **settings):
+        self.settings = dict(self.SETTINGS, **settings)
+
+    @property
+    def available(self):
+        return not self.pyoptsparse or pyoptsparse_available()
+
+    def create_driver(self, profile):
+        raise NotImplementedError
+
+    def hot_start(self, p, history):
+        """Store the optimizer history of a set up problem in history, a path without extension, and resume from
+        the history stored by a previous solve of the same problem.
+
+        The pyoptsparse backends replay the stored evaluations, the scipy one only warm starts from the last stored
+        design point.
+        """
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.settings})'
+
+
+class ScipySLSQP(Optimizer):
+    """SLSQP of scipy, always available but with dense derivatives."""
+
+    name = 'scipy_slsqp'
+    pyoptsparse = False
+    SETTINGS = {'maxiter': 500, 'tol': 1e-6}
+
+    def create_driver(self, profile):
+        import openmdao.api as om
+
+        driver = om.ScipyOptimizeDriver(optimizer='SLSQP', disp=profile.print_results)
+        for option, value in self.settings.items():
+            driver.options[option] = value
+        return driver
+
+    def hot_start(self, p, history):
+        """Record the driver iterations and warm start from the last recorded one, scipy has no hot start.
+
+        The stored evaluations are not replayed, the resumed solve restarts the optimizer from the last design point
+        of the previous solve. The previous history is kept in a copy as long as the new one has no iteration, so an
+        interrupted solve does not lose it.
+        """
+        import openmdao.api as om
+
+        filename = os.path.abspath(f'{history}.sql')
+        hot_file = os.path.abspath(f'{history}.hot.sql')
+        if _last_driver_case(filename) is not None:
+            shutil.copyfile(filename, hot_file)
+        case = _last_driver_case(hot_file)
+        if case is not None:
+            p.load_case(case)
+        p.driver.add_recorder(om.SqliteRecorder(filename))
+
+
+def _last_driver_case(filename):
+    """Return the last driver case recorded in a case recorder file, None without one."""
+    if not os.path.exists(filename):
+        return None
+    import openmdao.api as om
+
+    reader = om.CaseReader(filename)
+    cases = reader.list_cases('driver', recurse=False, out_stream=None)
+    return reader.get_case(cases[-1]) if cases else None
+
+
+class _PyOptSparseOptimizer(Optimizer):
+    optimizer = None
+
+    def create_driver(self, profile):
+        if not self.available:
+            raise ImportError(f"The {self.name} optimizer needs pyoptsparse, which is not installed")
+        import openmdao.api as om
+
+        driver = om.pyOptSparseDriver()
+        driver.options['optimizer'] = self.optimizer
+        driver.opt_settings.update(self.settings)
+        profile.configure_driver(driver)
+        return driver
+
+    def hot_start(self, p, history):
+        """Store the pyoptsparse history and replay the function evaluations of the previous one, up to the first
+        design point that differs from the stored ones."""
+        filename = os.path.abspath(f'{history}.hst')
+        if os.path.exists(filename):
+            # pyoptsparse overwrites the history file, it replays a copy
+            hot_file = os.path.abspath(f'{history}.hot.hst')
+            shutil.copyfile(filename, hot_file)
+            p.driver.options['hotstart_file'] = hot_file
+        p.driver.options['hist_file'] = filename
+
+
+class PyOptSparseSLSQP(_PyOptSparseOptimizer):
+    """SLSQP of pyoptsparse."""
+
+    name = 'slsqp'
+    optimizer = 'SLSQP'
+    SETTINGS = {'MAXIT': 500, 'ACC': 1e-6}
+
+
+class PyOptSparseIPOPT(_PyOptSparseOptimizer):
+    """Interior point IPOPT of pyoptsparse, with sparse total jacobians from the total coloring of the problem.
+
+    It scales better than SLSQP with the mesh size, the Hessian is approximated by limited memory BFGS.
+    """
+
+    name = 'ipopt'
+    optimizer = 'IPOPT'
+    SETTINGS = {
+        'max_iter': 500,
+        'tol': 1e-6,
+        'acceptable_tol': 1e-4,
+        'mu_strategy': 'adaptive',
+        'bound_mult_init_method': 'mu-based',
+        'nlp_scaling_method': 'gradient-based',
+        'hessian_approximation': 'limited-memory',
+        'linear_solver': 'mumps',
+        }
+
+    def create_driver(self, profile):
+        driver = super().create_driver(profile)
+        driver.opt_settings.setdefault('print_level', 5 if profile.print_results else 0)
+        driver.declare_coloring()
+        return driver
+
+
+OPTIMIZERS = {optimizer.name: optimizer for optimizer in (ScipySLSQP, PyOptSparseSLSQP, PyOptSparseIPOPT)}
+
+
+def get_optimizer(optimizer=None, **settings):
+    """Return an optimizer from an instance, a name of OPTIMIZERS (case insensitive) or None.
+
+    None is SLSQP of pyoptsparse when it is installed and SLSQP of scipy otherwise.
+    """
+    if isinstance(optimizer, Optimizer):
+        return optimizer
+    if optimizer is None:
+        optimizer = 'slsqp' if pyoptsparse_available() else 'scipy_slsqp'
+    name = optimizer.lower()
+    if name not in OPTIMIZERS:
+        raise ValueError(f"Unknown optimizer '{optimizer}', expected one of {sorted(OPTIMIZERS)}")
+    return OPTIMIZERS[name](**settings)
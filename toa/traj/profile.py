@@ -0,0 +1,53 @@
+import inspect
+
+
+class SolverProfile:
+    """Setup, reporting and console settings used to build and solve a takeoff problem."""
+
+    def __init__(self, name, check=False, reports=False, coloring_report=False,
+                 solver_print=False, print_results=False):
+        self.name = name
+        self.check = check
+        self.reports = reports
+        self.coloring_report = coloring_report
+        self.solver_print = solver_print
+        self.print_results = print_results
+
+    def create_problem(self):
+        """Return an empty problem, with the OpenMDAO reports disabled when not wanted."""
+        import openmdao.api as om
+
+        kwargs = {}
+        if not self.reports and 'reports' in inspect.signature(om.Problem).parameters:
+            kwargs['reports'] = None
+        return om.Problem(model=om.Group(), **kwargs)
+
+    def configure_driver(self, driver):
+        driver.options['print_results'] = self.print_results
+        if not self.print_results and driver.options['optimizer'] == 'SLSQP':
+            driver.opt_settings['IPRINT'] = -1
+
+    def configure_problem(self, p):
+        """Apply the console settings to a problem that has been set up."""
+        if not self.solver_print:
+            p.set_solver_print(level=-1)
+
+    def __repr__(self):
+        return f"SolverProfile('{self.name}')"
+
+
+DEVELOPMENT = SolverProfile('development', check=True, reports=True, coloring_report=True,
+                            solver_print=True, print_results=True)
+PRODUCTION = SolverProfile('production')
+
+PROFILES = {profile.name: profile for profile in (DEVELOPMENT, PRODUCTION)}
+
+
+def get_profile(profile):
+    """Return the profile object for a profile or its name."""
+    if isinstance(profile, SolverProfile):
+        return profile
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown solver profile '{profile}', expected one of {sorted(PROFILES)}") from None
@@ -0,0 +1,146 @@
+import time
+
+from toa.traj.optimizers import Optimizer
+from toa.traj.optimizers import get_optimizer
+from toa.traj.profile import PRODUCTION
+from toa.traj.variants import MESH
+from toa.traj.warm_start import WarmStart
+
+
+class Attempt:
+    """A solve of a case by a recovery strategy, with its result or the error it raised.
+
+    optimizer is the optimizer argument of the solve, None for the default one.
+    """
+
+    def __init__(self, strategy, elapsed, result=None, error=None, max_violation=1e-4, optimizer=None):
+        self.strategy = strategy
+        self.elapsed = elapsed
+        self.result = result
+        self.error = error
+        self.max_violation = max_violation
+        self.optimizer = optimizer
+
+    @property
+    def succeeded(self):
+        return self.result is not None and self.result.succeeded(self.max_violation)
+
+    def as_dict(self):
+        data = {'strategy': self.strategy, 'elapsed': self.elapsed, 'succeeded': self.succeeded, 'error': self.error}
+        if self.result is not None and self.result.telemetry is not None:
+            telemetry = self.result.telemetry
+            data.update(iterations=telemetry.iterations, converged=telemetry.converged,
+                        constraint_violation=telemetry.constraint_violation)
+        return data
+
+    def __repr__(self):
+        return f'Attempt({self.as_dict()})'
+
+
+def _last_problem(attempts):
+    for attempt in reversed(attempts):
+        if attempt.result is not None and attempt.result.problem is not None:
+            return attempt.result.problem
+    return None
+
+
+def _warm_start(attempts):
+    p = _last_problem(attempts)
+    return None if p is None else WarmStart.from_problem(p)
+
+
+def default_strategy(case, attempts):
+    return {}
+
+
+def estimate_strategy(case, attempts):
+    """Physics based guess, the closed form estimate of the case (see TakeoffEstimate)."""
+    estimate = case.estimate()
+    if not estimate.feasible:
+        return None
+    return {'estimate': estimate}
+
+
+def perturbed_strategy(case, attempts, scale=0.02):
+    """Last solution, with its states and controls randomly perturbed, as initial guess."""
+    warm_start = _warm_start(attempts)
+    if warm_start is None:
+        return None
+    return {'warm_start': warm_start.perturbed(scale=scale, seed=len(attempts))}
+
+
+def fine_mesh_strategy(case, attempts):
+    """Twice the segments of every phase of the case mesh, from the last solution."""
+    mesh = dict(MESH, **(case.mesh or {}))
+    return {'mesh': {name: 2 * segments for name, segments in mesh.items()}, 'warm_start': _warm_start(attempts)}
+
+
+def _optimizer_name(optimizer):
+    if optimizer is None:
+        return get_optimizer().name
+    return optimizer.name if isinstance(optimizer, Optimizer) else optimizer.lower()
+
+
+def alternate_optimizer_strategy(case, attempts, optimizers=('ipopt', 'slsqp', 'scipy_slsqp')):
+    """The first available optimizer of optimizers not tried yet, from the last solution."""
+    tried = {_optimizer_name(None)} | {_optimizer_name(attempt.optimizer) for attempt in attempts}
+    for name in optimizers:
+        if name not in tried and get_optimizer(name).available:
+            return {'optimizer': name, 'warm_start': _warm_start(attempts)}
+    return None
+
+
+# Recovery strategies, tried in order until a solve succeeds. Each one returns the solve arguments of its attempt
+# from the case and the previous attempts, or None when it does not apply.
+STRATEGIES = (
+    ('default', default_strategy),
+    ('estimate', estimate_strategy),
+    ('perturbed', perturbed_strategy),
+    ('fine_mesh', fine_mesh_strategy),
+    ('alternate_optimizer', alternate_optimizer_strategy),
+    )
+
+
+def solve_with_recovery(case, budget=None, strategies=STRATEGIES, max_violation=1e-4, profile=PRODUCTION,
+                        coloring_dir=None, estimate=None, hotstart_dir=None):
+    """Solve a TakeoffCase, retrying with the recovery strategies while the solve fails.
+
+    A solve fails when the driver reports a failure, when its largest constraint violation exceeds max_violation or
+    when it raises. No attempt is started once budget seconds have been spent on the case, a running attempt is not
+    interrupted. A TakeoffEstimate passed as estimate is the initial guess of every attempt without a guess of its
+    own. The first attempt is hot started from hotstart_dir, see build_takeoff_problem, the others start from the
+    guess of their strategy. Returns the result of the first successful attempt, or of the last attempt with a
+    result, and the list of Attempt made.
+    """
+    start = time.perf_counter()
+    attempts = []
+    for name, strategy in strategies:
+        if budget is not None and attempts and time.perf_counter() - start >= budget:
+            break
+        kwargs = strategy(case, attempts)
+        if kwargs is None:
+            continue
+        if kwargs.get('warm_start') is None:
+            kwargs.pop('warm_start', None)
+        if estimate is not None:
+            kwargs.setdefault('estimate', estimate)
+        if hotstart_dir is not None and not attempts:
+            kwargs['hotstart_dir'] = hotstart_dir
+
+        attempt_start = time.perf_counter()
+        try:
+            result = case.solve(profile=profile, coloring_dir=coloring_dir, **kwargs)
+            error = None
+        except Exception as exc:
+            result = None
+            error = f'{type(exc).__name__}: {exc}'
+        attempts.append(Attempt(name, time.perf_counter() - attempt_start, result=result, error=error,
+                                max_violation=max_violation, optimizer=kwargs.get('optimizer')))
+        if attempts[-1].succeeded:
+            break
+
+    results = [attempt.result for attempt in attempts if attempt.result is not None]
+    succeeded = [attempt.result for attempt in attempts if attempt.succeeded]
+    if succeeded:
+        return succeeded[0], attempts
+    return (results[-1] if results else None), attempts
@@ -0,0 +1,76 @@
+from toa.traj.telemetry import SolveTelemetry
+
+
+class TakeoffResult:
+    """Main takeoff results extracted from a solved takeoff problem.
+
+    Masses are given in kg, speeds in kn, distances in m and angles in deg.
+    """
+
+    def __init__(self, rtow, vr, vlof, v3, dih, distance, problem=None, simulation=None, telemetry=None):
+        self.rtow = rtow
+        self.vr = vr
+        self.vlof = vlof
+        self.v3 = v3
+        self.dih = dih
+        self.distance = distance
+        self.problem = problem
+        self.simulation = simulation
+        self.telemetry = telemetry
+
+    @property
+    def converged(self):
+        return self.telemetry is None or self.telemetry.converged
+
+    def succeeded(self, max_violation=1e-4):
+        """Return whether the solve converged with its largest constraint violation within max_violation."""
+        return self.converged and (self.telemetry is None or self.telemetry.constraint_violation <= max_violation)
+
+    @classmethod
+    def from_problem(cls, p, simulation=None, telemetry=None):
+        """Extract the results, without a transition phase V3 is None and the distance is the lift-off one."""
+        last = 'transition' if 'transition' in p.model.traj._phases else 'rotation'
+        v3 = None
+        if last == 'transition':
+            v3 = float(p.get_val('traj.transition.timeseries.states:V', units='kn')[-1])
+        return cls(rtow=float(p.get_val('traj.initial_run.timeseries.states:mass', units='kg')[0]),
+                   vr=float(p.get_val('traj.initial_run.timeseries.states:V', units='kn')[-1]),
+                   vlof=float(p.get_val('traj.rotation.timeseries.states:V', units='kn')[-1]),
+                   v3=v3,
+                   dih=float(p.get_val('traj.parameters:dih', units='deg')[0]),
+                   distance=float(p.get_val(f'traj.{last}.timeseries.x_mlg', units='m')[-1]),
+                   problem=p,
+                   simulation=simulation,
+                   telemetry=telemetry)
+
+    def as_dict(self):
+        """Return the scalar results and telemetry, without the problem references."""
+        data = {
+            'rtow': self.rtow,
+            'vr': self.vr,
+            'vlof': self.vlof,
+            'v3': self.v3,
+            'dih': self.dih,
+            'distance': self.distance,
+            }
+        if self.telemetry is not None:
+            data['telemetry'] = self.telemetry.as_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """Return the result of an as_dict dict, without problem and simulation."""
+        data = dict(data)
+        telemetry = data.pop('telemetry', None)
+        return cls(**data, telemetry=None if telemetry is None else SolveTelemetry.from_dict(telemetry))
+
+    def summary(self):
+        lines = [
+            f"RTOW: {self.rtow} kg",
+            f"Rotation speed (VR): {self.vr} kn",
+            f"Vlof speed (Vlof): {self.vlof} kn",
+            ]
+        if self.v3 is not None:
+            lines.append(f"V3 speed (V3): {self.v3} kn")
+        lines.append(f"Horizontal stabilizer: {self.dih} deg")
+        return '\n'.join(lines)
@@ -0,0 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+class LazySimulation:
+    """Explicit simulation of a solved trajectory, run the first time it is accessed.
+
+    The handle can be used in place of the simulation problem, get_val runs the simulation when needed. With
+    parallel=True each phase is simulated on its own in a thread pool instead of simulating the whole trajectory;
+    the phases only depend on their own optimized initial states, so the results are the same.
+    """
+
+    def __init__(self, traj, parallel=False, max_workers=None, times_per_seg=10, recorder=None):
+        self.traj = traj
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self.times_per_seg = times_per_seg
+        self.recorder = recorder
+        self._problem = None
+
+    @property
+    def done(self):
+        return self._problem is not None
+
+    def run(self):
+        """Run the simulation, if not run yet, and return the simulation problem."""
+        if self._problem is None:
+            if self.recorder is not None:
+                self._problem = self.recorder.run_simulation(self._simulate)
+            else:
+                self._problem = self._simulate()
+        return self._problem
+
+    def _simulate(self):
+        if not self.parallel:
+            return self.traj.simulate(times_per_seg=self.times_per_seg)
+
+        phases = dict(self.traj._phases)
+        with ThreadPoolExecutor(max_workers=self.max_workers or len(phases)) as executor:
+            futures = {name: executor.submit(phase.simulate, times_per_seg=self.times_per_seg)
+                       for name, phase in phases.items()}
+            return PhaseSimulations(self.traj.name, {name: future.result() for name, future in futures.items()})
+
+    def get_val(self, name, *args, **kwargs):
+        return self.run().get_val(name, *args, **kwargs)
+
+    def __getitem__(self, name):
+        return self.run()[name]
+
+
+class PhaseSimulations:
+    """Per phase simulation problems accessed with the trajectory simulation paths (traj.<phase>.<var>)."""
+
+    def __init__(self, traj_name, problems):
+        self.traj_name = traj_name
+        self.problems = problems
+
+    def _split(self, name):
+        traj_name, phase, var = name.split('.', 2)
+        if traj_name != self.traj_name or phase not in self.problems:
+            raise KeyError(f"'{name}' is not a variable of the simulated phases {sorted(self.problems)}")
+        return self.problems[phase], f'{phase}.{var}'
+
+    def get_val(self, name, *args, **kwargs):
+        problem, name = self._split(name)
+        return problem.get_val(name, *args, **kwargs)
+
+    def __getitem__(self, name):
+        problem, name = self._split(name)
+        return problem[name]
@@ -0,0 +1,177 @@
+import functools
+import statistics
+import time
+
+import numpy as np
+
+
+class SolveTelemetry:
+    """Optimizer effort and time split of a single takeoff solve.
+
+    Times are wall times in seconds. The derivative time includes the linear solves, the optimizer time is the
+    driver time spent outside the model and derivative evaluations.
+    """
+
+    FIELDS = ('iterations', 'model_evaluations', 'derivative_evaluations', 'driver_time', 'model_time',
+              'derivative_time', 'linear_time', 'optimizer_time', 'simulate_time', 'converged',
+              'constraint_violation')
+
+    def __init__(self):
+        self.iterations = 0
+        self.model_evaluations = 0
+        self.derivative_evaluations = 0
+        self.driver_time = 0.0
+        self.model_time = 0.0
+        self.derivative_time = 0.0
+        self.linear_time = 0.0
+        self.simulate_time = 0.0
+        self.converged = True
+        self.constraint_violation = 0.0
+
+    @property
+    def optimizer_time(self):
+        return max(self.driver_time - self.model_time - self.derivative_time, 0.0)
+
+    @property
+    def total_time(self):
+        return self.driver_time + self.simulate_time
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Return the telemetry of an as_dict dict, the derived times are recomputed."""
+        telemetry = cls()
+        for field, value in data.items():
+            if field not in ('optimizer_time', 'total_time'):
+                setattr(telemetry, field, value)
+        return telemetry
+
+    def __repr__(self):
+        return f"SolveTelemetry({self.as_dict()})"
+
+
+class TelemetryRecorder:
+    """Collects the telemetry of the driver run of a set up problem.
+
+    The model, derivative and linear solver methods are only wrapped during run_driver, so the recorders of
+    successive solves of a problem count their own solve only.
+    """
+
+    def __init__(self, p):
+        self.p = p
+        self.telemetry = SolveTelemetry()
+
+    def _count_model(self, elapsed):
+        self.telemetry.model_evaluations += 1
+        self.telemetry.model_time += elapsed
+
+    def _count_derivatives(self, elapsed):
+        self.telemetry.derivative_evaluations += 1
+        self.telemetry.derivative_time += elapsed
+
+    def _count_linear(self, elapsed):
+        self.telemetry.linear_time += elapsed
+
+    def run_driver(self, run):
+        """Call run(), which runs the driver, and record its time and final state."""
+        p = self.p
+        wrapped = [_wrap_method(p.model, 'run_solve_nonlinear', self._count_model),
+                   _wrap_method(p.driver, '_compute_totals', self._count_derivatives)]
+        if p.model.linear_solver is not None:
+            wrapped.append(_wrap_method(p.model.linear_solver, '_linearize', self._count_linear))
+            wrapped.append(_wrap_method(p.model.linear_solver, 'solve', self._count_linear))
+
+        start = time.perf_counter()
+        try:
+            return run()
+        finally:
+            self.telemetry.driver_time += time.perf_counter() - start
+            for restore in reversed(wrapped):
+                restore()
+            self.telemetry.iterations = _major_iterations(p.driver, self.telemetry)
+            self.telemetry.converged = not getattr(p.driver, 'fail', False)
+            self.telemetry.constraint_violation = max_constraint_violation(p.driver)
+
+    def run_simulation(self, run):
+        start = time.perf_counter()
+        try:
+            return run()
+        finally:
+            self.telemetry.simulate_time += time.perf_counter() - start
+
+
+def _wrap_method(obj, name, callback):
+    """Wrap a method of obj to pass its wall time to callback, and return the function restoring it."""
+    original = vars(obj).get(name)
+    func = getattr(obj, name)
+
+    @functools.wraps(func)
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            callback(time.perf_counter() - start)
+
+    setattr(obj, name, timed)
+
+    def restore():
+        if original is None:
+            delattr(obj, name)
+        else:
+            setattr(obj, name, original)
+
+    return restore
+
+
+def _major_iterations(driver, telemetry):
+    # ScipyOptimizeDriver keeps the scipy result, SLSQP evaluates the gradient once per major iteration
+    result = getattr(driver, 'result', None)
+    nit = getattr(result, 'nit', None)
+    if nit is not None:
+        return int(nit)
+    return telemetry.derivative_evaluations
+
+
+def max_constraint_violation(driver):
+    """Return the largest (scaled) constraint violation at the current driver point."""
+    violation = 0.0
+    for name, value in driver.get_constraint_values().items():
+        meta = driver._cons[name]
+        value = np.asarray(value)
+        if meta['equals'] is not None:
+            error = np.abs(value - meta['equals'])
+        else:
+            lower = meta['lower'] if meta['lower'] is not None else -np.inf
+            upper = meta['upper'] if meta['upper'] is not None else np.inf
+            error = np.maximum(value - upper, lower - value)
+        violation = max(violation, float(np.max(error, initial=0.0)))
+    return violation
+
+
+def aggregate_telemetry(telemetries, slow_factor=3.0):
+    """Aggregate the telemetry of a batch of solves.
+
+    A solve is flagged as slow when its total time exceeds slow_factor times the median total time of the batch.
+    Returns a dictionary with the batch totals and means and the indices of the flagged solves.
+    """
+    telemetries = list(telemetries)
+    summary = {'cases': len(telemetries)}
+    if not telemetries:
+        summary.update(converged=0, slow=[], not_converged=[])
+        return summary
+
+    for field in ('iterations', 'model_evaluations', 'derivative_evaluations', 'driver_time', 'model_time',
+                  'derivative_time', 'linear_time', 'optimizer_time', 'simulate_time', 'total_time'):
+        values = [getattr(telemetry, field) for telemetry in telemetries]
+        summary[f'{field}_total'] = sum(values)
+        summary[f'{field}_mean'] = sum(values) / len(values)
+        summary[f'{field}_max'] = max(values)
+
+    median_time = statistics.median(telemetry.total_time for telemetry in telemetries)
+    summary['converged'] = sum(telemetry.converged for telemetry in telemetries)
+    summary['slow'] = [i for i, telemetry in enumerate(telemetries) if telemetry.total_time > slow_factor * median_time]
+    summary['not_converged'] = [i for i, telemetry in enumerate(telemetries) if not telemetry.converged]
+    return summary
@@ -0,0 +1,78 @@
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from toa.data import get_airplane_data
+from toa.runway import RunwayTable
+from toa.traj.airport import AirportAnalysis
+from toa.traj.batch import TakeoffCase
+from toa.traj.result import TakeoffResult
+from toa.traj.telemetry import SolveTelemetry
+
+
+def _solve(case, **kwargs):
+    rtow = case.airplane.limits.MTOW * case.runway.toda / 4000 - 100 * case.wind_speed
+    return TakeoffResult(rtow, 140.0, 150.0, 160.0, 0.0, case.runway.toda, telemetry=SolveTelemetry())
+
+
+class TestAirportAnalysis(unittest.TestCase):
+
+    def test_incremental(self):
+        airplanes = {name: get_airplane_data(name) for name in ('b734', 'b744')}
+        conditions = [{'wind_speed': 0.0}, {'wind_speed': -5.0}]
+        runways = RunwayTable([3000, 3000, 2500], clearway=[0, 0, 300], name=['09', '27', '15'])
+
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.object(TakeoffCase, 'solve', autospec=True, side_effect=_solve) as solve:
+            analysis = AirportAnalysis(airplanes, runways, conditions, cache_dir=cache_dir)
+            result = analysis.run()
+
+            # The runway ends 09 and 27 have the same configuration
+            self.assertEqual(solve.call_count, 2 * 2 * 2)
+            self.assertEqual(result.rtow.shape, (2, 3, 2))
+            np.testing.assert_array_equal(result.rtow[:, 0], result.rtow[:, 1])
+            self.assertAlmostEqual(result.rtow[0, 2, 1], 68039 * 2800 / 4000 + 500)
+
+            # A NOTAM shortens the clearway of 15
+            runways = RunwayTable([3000, 3000, 2500], clearway=[0, 0, 100], name=['09', '27', '15'])
+            analysis = AirportAnalysis(airplanes, runways, conditions, cache_dir=cache_dir)
+            self.assertEqual(len(analysis.pending()), 2 * 2)
+            solve.reset_mock()
+            result = analysis.run()
+
+            self.assertEqual(solve.call_count, 2 * 2)
+            self.assertEqual(len(result.summary['resumed']), 2 * 2)
+            self.assertAlmostEqual(result.rtow[0, 2, 0], 68039 * 2600 / 4000)
+            self.assertEqual(len(list(result.rows())), 12)
+
+    def test_failed_cases_are_solved_again(self):
+        airplanes = {'b734': get_airplane_data('b734')}
+        conditions = [{'wind_speed': 0.0}, {'wind_speed': -5.0}]
+
+        def solve(case, **kwargs):
+            result = _solve(case)
+            # The tailwind case does not converge
+            result.telemetry.converged = case.wind_speed >= 0.0
+            return result
+
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.object(TakeoffCase, 'solve', autospec=True, side_effect=solve) as solve_case:
+            analysis = AirportAnalysis(airplanes, RunwayTable([3000]), conditions, cache_dir=cache_dir)
+            analysis.run()
+            pending = analysis.pending()
+            solve_case.reset_mock()
+            result = analysis.run()
+
+        self.assertEqual([case.wind_speed for case in pending], [-5.0])
+        self.assertEqual(solve_case.call_count, 1)
+        self.assertEqual(result.summary['resumed'], [0])
+
+    def test_unknown_condition(self):
+        with self.assertRaises(ValueError):
+            AirportAnalysis({}, RunwayTable([3000]), [{'temperature': 30.0}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from toa.data import get_airplane_data
+from toa.runway import Runway
+from toa.traj.batch import TakeoffCase
+from toa.traj.batch import run_batch
+from toa.traj.result import TakeoffResult
+from toa.traj.telemetry import SolveTelemetry
+
+
+class TestRunBatch(unittest.TestCase):
+
+    def test_screen_skips_infeasible_cases(self):
+        airplane = get_airplane_data('b734')
+        case = TakeoffCase(airplane, Runway(400), flap_angle=5.0)
+
+        with mock.patch.object(TakeoffCase, 'solve') as solve:
+            results, summary = run_batch([case], screen=True)
+
+        solve.assert_not_called()
+        self.assertEqual(results, [None])
+        self.assertEqual(summary['skipped'], [0])
+        self.assertEqual(summary['cases'], 1)
+
+    def test_estimate(self):
+        airplane = get_airplane_data('b734')
+        estimate = TakeoffCase(airplane, Runway(1800), flap_angle=5.0).estimate()
+
+        self.assertTrue(estimate.feasible)
+        self.assertLess(estimate.rtow, airplane.limits.MTOW)
+        self.assertLess(estimate.trajectory['liftoff'], estimate.trajectory['distance'])
+
+    def test_resume_completed_cases(self):
+        airplane = get_airplane_data('b734')
+        cases = [TakeoffCase(airplane, Runway(1800), wind_speed=wind_speed) for wind_speed in (0.0, 5.0)]
+        result = TakeoffResult(60000.0, 140.0, 150.0, 160.0, 0.0, 1800.0, telemetry=SolveTelemetry())
+
+        with tempfile.TemporaryDirectory() as hotstart_dir:
+            with mock.patch.object(TakeoffCase, 'solve', return_value=result) as solve:
+                run_batch(cases[:1], hotstart_dir=hotstart_dir)
+                results, summary = run_batch(cases, hotstart_dir=hotstart_dir)
+
+            self.assertEqual(solve.call_count, 2)
+            self.assertEqual(solve.call_args.kwargs['hotstart_dir'], hotstart_dir)
+            self.assertEqual(summary['resumed'], [0])
+            self.assertEqual(results[0].as_dict(), result.as_dict())
+            self.assertEqual(len(os.listdir(hotstart_dir)), 2)
+            self.assertNotEqual(cases[0].key(), cases[1].key())
+
+    def test_failed_results_are_not_resumed(self):
+        case = TakeoffCase(get_airplane_data('b734'), Runway(1800))
+        telemetry = SolveTelemetry()
+        telemetry.constraint_violation = 1e-2
+        result = TakeoffResult(60000.0, 140.0, 150.0, 160.0, 0.0, 1800.0, telemetry=telemetry)
+
+        with tempfile.TemporaryDirectory() as hotstart_dir:
+            with mock.patch.object(TakeoffCase, 'solve', return_value=result) as solve:
+                run_batch([case], hotstart_dir=hotstart_dir)
+                _, summary = run_batch([case], hotstart_dir=hotstart_dir)
+            self.assertEqual(solve.call_count, 2)
+            self.assertEqual(summary['resumed'], [])
+            self.assertEqual(os.listdir(hotstart_dir), [])
+
+            # A stored result is only resumed when it succeeds within the max_violation of the rerun
+            with open(os.path.join(hotstart_dir, f'{case.key()}.json'), 'w') as file:
+                json.dump(result.as_dict(), file)
+            with mock.patch.object(TakeoffCase, 'solve', return_value=result) as solve:
+                _, loose = run_batch([case], hotstart_dir=hotstart_dir, max_violation=1e-1)
+                _, strict = run_batch([case], hotstart_dir=hotstart_dir)
+            self.assertEqual((loose['resumed'], strict['resumed']), ([0], []))
+            self.assertEqual(solve.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
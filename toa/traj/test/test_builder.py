@@ -0,0 +1,187 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from toa.traj import builder
+from toa.traj.builder import PHASES
+from toa.traj.builder import _check_mode
+from toa.traj.builder import _check_phases
+from toa.traj.builder import set_takeoff_mass
+from toa.traj.builder import variant_key
+from toa.traj.elevator import FixedSchedule
+from toa.traj.elevator import FullControl
+from toa.traj.elevator import PiecewiseLinearControl
+from toa.traj.elevator import PolynomialControl
+from toa.traj.elevator import get_elevator
+from toa.traj.result import TakeoffResult
+from toa.traj.warm_start import WarmStart
+
+
+class _Phase:
+
+    def __init__(self, fix_initial, states, controls, fixed_states=()):
+        self.time_options = {'fix_initial': fix_initial}
+        self.state_options = {name: {'fix_initial': name in fixed_states, 'fix_final': False} for name in states}
+        self.control_options = {name: {'opt': True} for name in controls}
+
+    def interpolate(self, xs=None, ys=None, nodes=None):
+        # Evaluate the stored history on three nodes spanning the phase
+        return np.interp(np.linspace(xs[0], xs[-1], 3), xs, np.ravel(ys))
+
+
+class _Problem:
+
+    def __init__(self, phases):
+        self.model = type('Model', (), {})()
+        self.model.traj = type('Trajectory', (), {'_phases': phases, 'parameter_options': {'dih': {}}})()
+        self.values = {}
+
+    def set_val(self, name, value, units=None):
+        self.values[name] = value
+
+    def get_val(self, name, units=None):
+        return self.values[name]
+
+
+class TestBuilder(unittest.TestCase):
+
+    def test_phase_selection(self):
+        self.assertEqual(_check_phases(list(PHASES)), PHASES)
+        self.assertEqual(_check_phases(PHASES[:2]), ('initial_run', 'rotation'))
+        with self.assertRaises(ValueError):
+            _check_phases(('rotation', 'transition'))
+
+    def test_mode(self):
+        self.assertEqual(_check_mode('distance', PHASES), 'distance')
+        with self.assertRaises(ValueError):
+            _check_mode('distance', PHASES[:2])
+        with self.assertRaises(ValueError):
+            _check_mode('toda', PHASES)
+
+    def test_set_takeoff_mass(self):
+        p = _Problem({name: None for name in PHASES})
+        for i, name in enumerate(PHASES):
+            p.values[f'traj.{name}.states:mass'] = np.array([[68000.0 - 100 * i], [67900.0 - 100 * i]])
+
+        set_takeoff_mass(p, 60000.0)
+
+        np.testing.assert_allclose(p.values['traj.initial_run.states:mass'].ravel(), [60000.0, 59900.0])
+        np.testing.assert_allclose(p.values['traj.transition.states:mass'].ravel(), [59800.0, 59700.0])
+
+    def test_required_distance_simulations(self):
+        p = _Problem({name: None for name in PHASES})
+        for name in PHASES:
+            p.values[f'traj.{name}.states:mass'] = np.array([[60000.0]])
+
+        def solve(p, timer=None, simulate=False):
+            return TakeoffResult(p.values['traj.initial_run.states:mass'][0, 0], 140.0, 150.0, 160.0, 0.0, 1800.0,
+                                 problem=p, simulation=object())
+
+        for simulate in (False, True):
+            with mock.patch.object(builder, 'build_takeoff_problem', return_value=p), \
+                    mock.patch.object(builder, 'solve_problem', side_effect=solve):
+                results = builder.solve_required_distance(None, None, [60000.0, 62000.0, 64000.0], simulate=simulate)
+
+            self.assertEqual([result.rtow for result in results], [60000.0, 62000.0, 64000.0])
+            self.assertEqual([result.simulation is not None for result in results], [simulate, simulate, True])
+
+    def test_variant_key(self):
+        full = variant_key(FullControl())
+        self.assertEqual(full, variant_key(FullControl()))
+        self.assertNotEqual(full, variant_key(PolynomialControl()))
+        self.assertNotEqual(full, variant_key(FullControl(), mesh={'initial_run': 30}))
+        self.assertNotEqual(full, variant_key(FullControl(), phases=PHASES[:2]))
+        self.assertNotEqual(full, variant_key(FullControl(), engine_model='deck'))
+        self.assertNotEqual(full, variant_key(FullControl(), mode='distance'))
+        self.assertNotIn(' ', full)
+
+    def test_fixed_schedule(self):
+        schedule = FixedSchedule({'transition': (-20.0, -15.0)})
+        self.assertFalse(schedule.linked)
+        self.assertEqual(schedule._values('initial_run'), [0.0, 0.0])
+        self.assertEqual(schedule._values('rotation'), [0.0, -20.0])
+        self.assertEqual(schedule._values('transition'), [-20.0, -15.0])
+
+    def test_get_elevator(self):
+        self.assertIsInstance(get_elevator(None), FullControl)
+        self.assertEqual(get_elevator('piecewise_linear', knots=4).knots, 4)
+        elevator = PolynomialControl(order=3)
+        self.assertIs(get_elevator(elevator), elevator)
+        with self.assertRaises(ValueError):
+            get_elevator('bang_bang')
+
+    def test_piecewise_linear_knots(self):
+        elevator = PiecewiseLinearControl(knots=3)
+        self.assertEqual(elevator.total_knots(PHASES), 7)
+        # Consecutive phases share their boundary knot
+        self.assertEqual([elevator.ode_law(i, PHASES)['offset'] for i in range(3)], [0, 2, 4])
+        self.assertIsNone(FullControl().ode_law(0, PHASES))
+        self.assertEqual(variant_key('piecewise_linear'), variant_key(PiecewiseLinearControl()))
+
+
+class TestWarmStart(unittest.TestCase):
+
+    def test_apply(self):
+        warm_start = WarmStart({'rotation': {'time': np.array([60.0, 62.0, 64.0]),
+                                             'states': {'V': np.array([60.0, 65.0, 70.0]),
+                                                        'gam': np.array([0.0, 1.0, 2.0])},
+                                             'controls': {'de': np.array([0.0, -10.0, -20.0])}},
+                                'transition': {'time': np.array([64.0, 70.0]), 'states': {}, 'controls': {}}},
+                               {'dih': np.array([-1.5])})
+        p = _Problem({'rotation': _Phase(False, ['V'], ['de'])})
+
+        warm_start.apply(p)
+
+        self.assertEqual(p.values['traj.rotation.t_initial'], 60.0)
+        self.assertEqual(p.values['traj.rotation.t_duration'], 4.0)
+        np.testing.assert_allclose(p.values['traj.rotation.states:V'], [60.0, 65.0, 70.0])
+        np.testing.assert_allclose(p.values['traj.rotation.controls:de'], [0.0, -10.0, -20.0])
+        np.testing.assert_allclose(p.values['traj.parameters:dih'], [-1.5])
+        # Phases and states missing in the problem are skipped
+        self.assertNotIn('traj.rotation.states:gam', p.values)
+        self.assertNotIn('traj.transition.t_duration', p.values)
+
+    def test_perturbed(self):
+        warm_start = WarmStart({'rotation': {'time': np.array([60.0, 62.0, 64.0]),
+                                             'states': {'V': np.array([60.0, 65.0, 70.0])}, 'controls': {}}}, {})
+
+        perturbed = warm_start.perturbed(scale=0.01, seed=1)
+
+        np.testing.assert_array_equal(perturbed.phases['rotation']['time'], [60.0, 62.0, 64.0])
+        V = perturbed.phases['rotation']['states']['V']
+        self.assertFalse(np.array_equal(V, [60.0, 65.0, 70.0]))
+        np.testing.assert_allclose(V, [60.0, 65.0, 70.0], rtol=0.05)
+        np.testing.assert_array_equal(V, warm_start.perturbed(scale=0.01, seed=1).phases['rotation']['states']['V'])
+
+    def test_perturbed_keeps_fixed_states(self):
+        # Fixed states of the distance mode problem: the main gear position, speed and mass at brake release and
+        # the main gear height at the start of the rotation
+        fixed = {'initial_run': ('V', 'x', 'mass'), 'rotation': ('h',)}
+        initial = {'V': 0.0, 'x': 12.77, 'mass': 60000.0, 'h': 1.8}
+        times = {'initial_run': np.array([0.0, 15.0, 30.0]), 'rotation': np.array([30.0, 32.0, 34.0])}
+        phases = {name: _Phase(name == 'initial_run', ['V', 'x', 'mass', 'h'], ['de'], fixed_states=fixed[name])
+                  for name in fixed}
+        p = _Problem(phases)
+        p.model.traj.parameter_options = {}
+        for name, time in times.items():
+            prefix = f'traj.{name}.timeseries'
+            p.values[f'{prefix}.time'] = time[:, np.newaxis]
+            p.values[f'{prefix}.controls:de'] = np.full((3, 1), -5.0)
+            for state, value in initial.items():
+                p.values[f'{prefix}.states:{state}'] = (value + np.array([0.0, 10.0, 20.0]))[:, np.newaxis]
+
+        perturbed = _Problem(phases)
+        perturbed.model.traj.parameter_options = {}
+        WarmStart.from_problem(p).perturbed(scale=0.05, seed=3).apply(perturbed)
+
+        for name, states in fixed.items():
+            for state in states:
+                values = perturbed.values[f'traj.{name}.states:{state}']
+                self.assertEqual(values[0], initial[state], f'{name} {state}')
+                self.assertFalse(np.allclose(values[1:], initial[state] + np.array([10.0, 20.0])))
+        self.assertNotEqual(perturbed.values['traj.rotation.states:x'][0], initial['x'])
+
+
+if __name__ == '__main__':
+    unittest.main()
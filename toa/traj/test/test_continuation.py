@@ -0,0 +1,82 @@
+import unittest
+from unittest import mock
+
+from toa.data import get_airplane_data
+from toa.runway import Runway
+from toa.traj import continuation
+from toa.traj.batch import TakeoffCase
+from toa.traj.continuation import Continuation
+from toa.traj.continuation import with_parameter
+from toa.traj.result import TakeoffResult
+from toa.traj.telemetry import SolveTelemetry
+
+
+def _solve(case, warm_start=None, **kwargs):
+    """Converges down to 5 m/s of tailwind, in few iterations with a warm start."""
+    telemetry = SolveTelemetry()
+    telemetry.converged = case.wind_speed >= -5.0
+    telemetry.iterations = 10 if warm_start is not None else 50
+    return TakeoffResult(rtow=60000.0 + 100 * case.wind_speed, vr=0.0, vlof=0.0, v3=0.0, dih=0.0, distance=0.0,
+                         problem=case, telemetry=telemetry)
+
+
+class TestContinuation(unittest.TestCase):
+
+    def setUp(self):
+        self.case = TakeoffCase(get_airplane_data('b734'), Runway(2500, 100, 0, 0, 0.01, condition='wet'),
+                                wind_speed=10.0)
+
+    def test_with_parameter(self):
+        case = with_parameter(self.case, 'length', 1800)
+        self.assertEqual((case.runway.tora, case.runway.toda, case.runway.slope), (1800, 1900, 0.01))
+        self.assertEqual(case.runway.condition.name, 'wet')
+        self.assertEqual(self.case.runway.tora, 2500)
+        self.assertEqual(with_parameter(self.case, 'wind_speed', -3.0).wind_speed, -3.0)
+        with self.assertRaises(ValueError):
+            with_parameter(self.case, 'mass', 1.0)
+
+    def test_march(self):
+        with mock.patch.object(TakeoffCase, 'solve', _solve), \
+                mock.patch.object(continuation.WarmStart, 'from_problem', lambda p: p):
+            march = Continuation(self.case, 'wind_speed', target=-10.0, step=5.0, min_step=1.0)
+            values = [point.value for point in march]
+
+        # Steps grow after the quick warm started solves and shrink when passing -5 m/s fails
+        self.assertEqual(values[:3], [10.0, 5.0, -2.5])
+        self.assertTrue(all(a > b for a, b in zip(values, values[1:])))
+        self.assertGreaterEqual(values[-1], -5.0)
+        self.assertFalse(march.reached)
+        self.assertTrue(march.failures)
+        self.assertTrue(all(value < -5.0 for value in march.failures))
+
+    def test_failed_solves(self):
+        def solve(case, warm_start=None, **kwargs):
+            if case.wind_speed < 0.0:
+                raise RuntimeError('singular jacobian')
+            result = _solve(case, warm_start=warm_start)
+            result.telemetry.constraint_violation = 1e-2 if case.wind_speed < 5.0 else 0.0
+            return result
+
+        with mock.patch.object(TakeoffCase, 'solve', solve), \
+                mock.patch.object(continuation.WarmStart, 'from_problem', lambda p: p):
+            march = Continuation(self.case, 'wind_speed', target=-10.0, step=5.0, min_step=1.0)
+            points = march.run()
+
+        # The solve raising at -2.5 m/s and those violating the constraints below 5 m/s are failed steps
+        self.assertEqual([point.value for point in points], [10.0, 5.0])
+        self.assertEqual(list(march.errors), [-2.5])
+        self.assertIn('singular jacobian', march.errors[-2.5])
+        self.assertGreater(len(march.failures), 1)
+        self.assertTrue(all(value < 5.0 for value in march.failures))
+
+    def test_reaches_target(self):
+        with mock.patch.object(TakeoffCase, 'solve', _solve), \
+                mock.patch.object(continuation.WarmStart, 'from_problem', lambda p: p):
+            points = Continuation(self.case, 'wind_speed', target=0.0).run()
+
+        self.assertEqual(points[-1].value, 0.0)
+        self.assertEqual(points[-1].case.wind_speed, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
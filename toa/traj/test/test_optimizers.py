@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import openmdao.api as om
+
+from toa.traj import optimizers
+from toa.traj.optimizers import PyOptSparseIPOPT
+from toa.traj.optimizers import ScipySLSQP
+from toa.traj.optimizers import get_optimizer
+from toa.traj.profile import DEVELOPMENT
+from toa.traj.profile import PRODUCTION
+
+
+class TestOptimizers(unittest.TestCase):
+
+    def test_get_optimizer(self):
+        self.assertIsInstance(get_optimizer('IPOPT'), PyOptSparseIPOPT)
+        self.assertIsInstance(get_optimizer('scipy_slsqp'), ScipySLSQP)
+        optimizer = ScipySLSQP(maxiter=10)
+        self.assertIs(get_optimizer(optimizer), optimizer)
+        with self.assertRaises(ValueError):
+            get_optimizer('snopt')
+
+    def test_default_fallback(self):
+        with mock.patch.object(optimizers, 'pyoptsparse_available', return_value=False):
+            self.assertIsInstance(get_optimizer(), ScipySLSQP)
+            self.assertFalse(PyOptSparseIPOPT().available)
+            with self.assertRaises(ImportError):
+                PyOptSparseIPOPT().create_driver(PRODUCTION)
+        with mock.patch.object(optimizers, 'pyoptsparse_available', return_value=True):
+            self.assertEqual(get_optimizer().name, 'slsqp')
+
+    def test_scipy_driver(self):
+        driver = get_optimizer('scipy_slsqp', maxiter=50).create_driver(PRODUCTION)
+        self.assertIsInstance(driver, om.ScipyOptimizeDriver)
+        self.assertEqual(driver.options['optimizer'], 'SLSQP')
+        self.assertEqual(driver.options['maxiter'], 50)
+        self.assertEqual(driver.options['tol'], ScipySLSQP.SETTINGS['tol'])
+        self.assertFalse(driver.options['disp'])
+        self.assertTrue(ScipySLSQP().create_driver(DEVELOPMENT).options['disp'])
+
+    def test_scipy_hot_start(self):
+
+        def solve(history):
+            p = om.Problem()
+            p.model.add_subsystem('paraboloid', om.ExecComp('f = (x - 3)**2 + (y + 1)**2'), promotes=['*'])
+            p.model.add_design_var('x', lower=-10, upper=10)
+            p.model.add_design_var('y', lower=-10, upper=10)
+            p.model.add_objective('f')
+            optimizer = ScipySLSQP()
+            p.driver = optimizer.create_driver(PRODUCTION)
+            p.setup()
+            p.set_val('x', 8.0)
+            p.set_val('y', 5.0)
+            optimizer.hot_start(p, history)
+            p.run_driver()
+            return p
+
+        with tempfile.TemporaryDirectory() as directory:
+            history = os.path.join(directory, 'paraboloid')
+            first = solve(history)
+            second = solve(history)
+            # The history being recorded is a new file, the previous one is kept
+            self.assertTrue(os.path.exists(f'{history}.hot.sql'))
+            self.assertEqual(len(om.CaseReader(f'{history}.sql').list_cases('driver', out_stream=None)),
+                             second.driver.iter_count)
+
+        self.assertAlmostEqual(second.get_val('x')[0], 3.0, places=4)
+        self.assertLess(second.driver.iter_count, first.driver.iter_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
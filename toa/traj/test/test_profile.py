@@ -0,0 +1,31 @@
+import unittest
+
+from toa.traj.profile import DEVELOPMENT
+from toa.traj.profile import PRODUCTION
+from toa.traj.profile import get_profile
+
+
+class TestSolverProfile(unittest.TestCase):
+
+    def test_get_profile(self):
+        self.assertIs(get_profile('production'), PRODUCTION)
+        self.assertIs(get_profile(DEVELOPMENT), DEVELOPMENT)
+
+        with self.assertRaises(ValueError):
+            get_profile('fast')
+
+    def test_production_is_quiet(self):
+        self.assertFalse(PRODUCTION.check)
+        self.assertFalse(PRODUCTION.reports)
+        self.assertFalse(PRODUCTION.coloring_report)
+        self.assertFalse(PRODUCTION.solver_print)
+        self.assertFalse(PRODUCTION.print_results)
+
+    def test_create_problem(self):
+        p = PRODUCTION.create_problem()
+        p.setup()
+        p.final_setup()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+from unittest import mock
+
+from toa.data import get_airplane_data
+from toa.runway import Runway
+from toa.traj import optimizers
+from toa.traj import recovery
+from toa.traj.batch import TakeoffCase
+from toa.traj.batch import run_batch
+from toa.traj.recovery import solve_with_recovery
+from toa.traj.result import TakeoffResult
+from toa.traj.telemetry import SolveTelemetry
+
+
+class _Solver:
+    """Solve patched on TakeoffCase, failing with a constraint violation until the given argument is used."""
+
+    def __init__(self, succeeds_with):
+        self.succeeds_with = succeeds_with
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        if kwargs.get('optimizer') == 'missing':
+            raise ImportError('optimizer not available')
+        telemetry = SolveTelemetry()
+        telemetry.constraint_violation = 0.0 if self.succeeds_with in kwargs else 1.0
+        return TakeoffResult(60000.0, 0.0, 0.0, 0.0, 0.0, 0.0, problem=len(self.calls), telemetry=telemetry)
+
+
+class TestRecovery(unittest.TestCase):
+
+    def setUp(self):
+        self.case = TakeoffCase(get_airplane_data('b734'), Runway(2500), flap_angle=5.0)
+        self.patches = [mock.patch.object(recovery.WarmStart, 'from_problem', lambda p: recovery.WarmStart({}, {}))]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+
+    def test_retries_until_success(self):
+        solver = _Solver('mesh')
+        with mock.patch.object(TakeoffCase, 'solve', solver):
+            result, attempts = solve_with_recovery(self.case)
+
+        self.assertEqual([attempt.strategy for attempt in attempts], ['default', 'estimate', 'perturbed', 'fine_mesh'])
+        self.assertEqual([attempt.succeeded for attempt in attempts], [False, False, False, True])
+        self.assertIs(result, attempts[-1].result)
+        self.assertIn('estimate', solver.calls[1])
+        self.assertIn('warm_start', solver.calls[2])
+
+    def test_errors_and_budget(self):
+        strategies = (('default', recovery.default_strategy),
+                      ('missing', lambda case, attempts: {'optimizer': 'missing'}))
+        with mock.patch.object(TakeoffCase, 'solve', _Solver('never')):
+            result, attempts = solve_with_recovery(self.case, strategies=strategies)
+            self.assertEqual(attempts[-1].error, 'ImportError: optimizer not available')
+            self.assertEqual(result.telemetry.constraint_violation, 1.0)
+
+            _, attempts = solve_with_recovery(self.case, budget=0.0)
+            self.assertEqual(len(attempts), 1)
+
+    def test_fine_mesh(self):
+        self.assertEqual(recovery.fine_mesh_strategy(self.case, [])['mesh'],
+                         {name: 2 * segments for name, segments in recovery.MESH.items()})
+
+        self.case.mesh = {'initial_run': 40}
+        mesh = recovery.fine_mesh_strategy(self.case, [])['mesh']
+        self.assertEqual(mesh['initial_run'], 80)
+        self.assertEqual(mesh['rotation'], 2 * recovery.MESH['rotation'])
+
+    def test_alternate_optimizer(self):
+        attempts = [recovery.Attempt('default', 1.0)]
+        # Without pyoptsparse the default optimizer is scipy SLSQP, the only one available
+        with mock.patch.object(optimizers, 'pyoptsparse_available', return_value=False):
+            self.assertIsNone(recovery.alternate_optimizer_strategy(self.case, attempts))
+
+        with mock.patch.object(optimizers, 'pyoptsparse_available', return_value=True):
+            self.assertEqual(recovery.alternate_optimizer_strategy(self.case, attempts)['optimizer'], 'ipopt')
+            attempts.append(recovery.Attempt('alternate_optimizer', 1.0, optimizer='IPOPT'))
+            self.assertEqual(recovery.alternate_optimizer_strategy(self.case, attempts)['optimizer'], 'scipy_slsqp')
+
+    def test_batch(self):
+        with mock.patch.object(TakeoffCase, 'solve', _Solver('estimate')):
+            results, summary = run_batch([self.case], recover=True)
+
+        self.assertEqual([attempt['strategy'] for attempt in summary['attempts'][0]], ['default', 'estimate'])
+        self.assertEqual(summary['failed'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
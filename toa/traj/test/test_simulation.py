@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+
+from toa.traj.simulation import LazySimulation
+
+
+class _Problem:
+
+    def __init__(self, values):
+        self.values = values
+
+    def get_val(self, name, units=None):
+        return self.values[name]
+
+    def __getitem__(self, name):
+        return self.values[name]
+
+
+class _Phase:
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+
+    def simulate(self, times_per_seg=10):
+        self.calls += 1
+        return _Problem({f'{self.name}.timeseries.time': np.arange(times_per_seg)})
+
+
+class _Trajectory:
+    name = 'traj'
+
+    def __init__(self):
+        self._phases = {'initial_run': _Phase('initial_run'), 'rotation': _Phase('rotation')}
+        self.calls = 0
+
+    def simulate(self, times_per_seg=10):
+        self.calls += 1
+        return _Problem({f'traj.{name}.timeseries.time': np.arange(times_per_seg) for name in self._phases})
+
+
+class TestLazySimulation(unittest.TestCase):
+
+    def test_runs_once_on_access(self):
+        traj = _Trajectory()
+        sim = LazySimulation(traj)
+
+        self.assertFalse(sim.done)
+        self.assertEqual(traj.calls, 0)
+
+        sim.get_val('traj.rotation.timeseries.time')
+        sim['traj.initial_run.timeseries.time']
+
+        self.assertTrue(sim.done)
+        self.assertEqual(traj.calls, 1)
+
+    def test_parallel_phases(self):
+        traj = _Trajectory()
+        sim = LazySimulation(traj, parallel=True, times_per_seg=5)
+
+        np.testing.assert_equal(sim.get_val('traj.rotation.timeseries.time'), np.arange(5))
+        np.testing.assert_equal(sim.get_val('traj.initial_run.timeseries.time'), np.arange(5))
+        self.assertEqual(traj.calls, 0)
+        self.assertEqual([phase.calls for phase in traj._phases.values()], [1, 1])
+
+        with self.assertRaises(KeyError):
+            sim.get_val('traj.transition.timeseries.time')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
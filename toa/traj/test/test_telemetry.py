@@ -0,0 +1,81 @@
+import unittest
+
+import openmdao.api as om
+
+from toa.traj.telemetry import SolveTelemetry
+from toa.traj.telemetry import TelemetryRecorder
+from toa.traj.telemetry import aggregate_telemetry
+from toa.traj.telemetry import max_constraint_violation
+
+
+class TestTelemetry(unittest.TestCase):
+
+    def _paraboloid(self):
+        p = om.Problem()
+        p.model.add_subsystem('parab', om.ExecComp('f = (x - 3.0)**2 + x*y + (y + 4.0)**2 - 3.0'),
+                              promotes=['*'])
+        p.model.add_subsystem('con', om.ExecComp('c = x + y'), promotes=['*'])
+        p.model.linear_solver = om.DirectSolver()
+        p.model.add_design_var('x', lower=-50, upper=50)
+        p.model.add_design_var('y', lower=-50, upper=50)
+        p.model.add_objective('f')
+        p.model.add_constraint('c', upper=-20.0)
+        p.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', disp=False)
+        p.setup()
+        return p
+
+    def test_recorder(self):
+        p = self._paraboloid()
+        recorder = TelemetryRecorder(p)
+        recorder.run_driver(p.run_driver)
+        telemetry = recorder.telemetry
+
+        self.assertTrue(telemetry.converged)
+        self.assertGreater(telemetry.iterations, 0)
+        self.assertGreater(telemetry.model_evaluations, 0)
+        self.assertGreater(telemetry.derivative_evaluations, 0)
+        self.assertGreaterEqual(telemetry.driver_time, telemetry.model_time)
+        self.assertLessEqual(telemetry.linear_time, telemetry.derivative_time)
+        self.assertLess(telemetry.constraint_violation, 1e-6)
+
+    def test_successive_solves(self):
+        p = self._paraboloid()
+        first = TelemetryRecorder(p)
+        first.run_driver(p.run_driver)
+        evaluations = first.telemetry.model_evaluations
+
+        second = TelemetryRecorder(p)
+        second.run_driver(p.run_driver)
+
+        self.assertEqual(first.telemetry.model_evaluations, evaluations)
+        self.assertGreater(second.telemetry.model_evaluations, 0)
+        self.assertNotIn('run_solve_nonlinear', vars(p.model))
+
+    def test_constraint_violation(self):
+        p = self._paraboloid()
+        p.set_val('x', 0.0)
+        p.set_val('y', -10.0)
+        p.final_setup()
+        p.run_model()
+
+        self.assertAlmostEqual(max_constraint_violation(p.driver), 10.0)
+
+    def test_aggregate(self):
+        telemetries = [SolveTelemetry() for _ in range(4)]
+        for telemetry, driver_time in zip(telemetries, [1.0, 1.2, 0.9, 10.0]):
+            telemetry.driver_time = driver_time
+            telemetry.iterations = 10
+        telemetries[1].converged = False
+
+        summary = aggregate_telemetry(telemetries)
+
+        self.assertEqual(summary['cases'], 4)
+        self.assertEqual(summary['converged'], 3)
+        self.assertEqual(summary['slow'], [3])
+        self.assertEqual(summary['not_converged'], [1])
+        self.assertEqual(summary['iterations_total'], 40)
+        self.assertAlmostEqual(summary['driver_time_max'], 10.0)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,49 @@
+from toa.models.atmosphere import P0
+from toa.traj.elevator import get_elevator
+from toa.traj.fingerprint import fingerprint
+from toa.traj.optimizers import get_optimizer
+
+PHASES = ('initial_run', 'rotation', 'transition')
+
+# Solve modes, the maximum takeoff mass for the runway or the minimum distance to 35 ft for a fixed mass
+MODES = ('rtow', 'distance')
+
+# Number of segments of each phase
+MESH = {
+    'initial_run': 20,
+    'rotation': 10,
+    'transition': 10,
+    }
+
+
+def _check_phases(phases):
+    phases = tuple(phases)
+    if phases not in (PHASES[:2], PHASES):
+        raise ValueError(f"Unsupported phase selection {phases}, expected {PHASES[:2]} or {PHASES}")
+    return phases
+
+
+def _check_mode(mode, phases):
+    if mode not in MODES:
+        raise ValueError(f"Unknown solve mode '{mode}', expected one of {MODES}")
+    if mode == 'distance' and 'transition' not in phases:
+        raise ValueError("The distance mode minimizes the distance to 35 ft, it needs the transition phase")
+    return mode
+
+
+def variant_key(elevator, phases=PHASES, mesh=None, engine_model='polynomial', mode='rtow'):
+    """Return a name identifying the problem structure, used to share build artifacts between problems."""
+    elevator = get_elevator(elevator)
+    mesh = dict(MESH, **(mesh or {}))
+    segments = '-'.join(f'{mesh[name]}' for name in phases)
+    key = f'{"_".join(phases)}__{segments}__{elevator!r}__{engine_model}__{mode}'
+    return ''.join(char if char.isalnum() or char in '-_.' else '_' for char in key)
+
+
+def solve_key(airplane, runway, flap_angle=0.0, wind_speed=0.0, elevator=None, phases=PHASES, mesh=None,
+              isa_deviation=0.0, qnh=P0, engine_model='polynomial', estimate=None, mode='rtow', optimizer=None):
+    """Return a name identifying a solve, its variant_key, its optimizer and a fingerprint of its inputs."""
+    optimizer = get_optimizer(optimizer)
+    guess = None if estimate is None or not estimate.feasible else estimate.rtow
+    digest = fingerprint(airplane, runway, flap_angle, wind_speed, isa_deviation, qnh, guess, optimizer.settings)
+    return f'{variant_key(elevator, phases, mesh, engine_model, mode)}__{optimizer.name}__{digest[:16]}'
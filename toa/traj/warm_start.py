@@ -0,0 +1,86 @@
+import numpy as np
+
+
+class WarmStart:
+    """Solution of a takeoff problem used as the initial guess of another one.
+
+    The states and controls are stored as time histories, so the guess can be applied to a problem with a
+    different mesh or elevator parameterization. The states fixed at the start or the end of each phase are stored
+    in fix_initial and fix_final, their fixed values are part of the problem and not of the guess.
+    """
+
+    def __init__(self, phases, parameters):
+        self.phases = phases
+        self.parameters = parameters
+
+    @classmethod
+    def from_problem(cls, p):
+        traj = p.model.traj
+        phases = {}
+        for name, phase in traj._phases.items():
+            prefix = f'traj.{name}.timeseries'
+            # Segment boundaries show up twice in the timeseries
+            time, index = np.unique(p.get_val(f'{prefix}.time')[:, 0], return_index=True)
+            phases[name] = {
+                'time': time,
+                'states': {state: p.get_val(f'{prefix}.states:{state}')[index]
+                           for state in phase.state_options},
+                'controls': {control: p.get_val(f'{prefix}.controls:{control}')[index]
+                             for control in phase.control_options},
+                'fix_initial': tuple(state for state, options in phase.state_options.items()
+                                     if options['fix_initial']),
+                'fix_final': tuple(state for state, options in phase.state_options.items()
+                                   if options['fix_final']),
+                }
+        parameters = {name: p.get_val(f'traj.parameters:{name}').copy()
+                      for name, options in traj.parameter_options.items() if options['opt']}
+        return cls(phases, parameters)
+
+    def perturbed(self, scale=0.05, seed=None):
+        """Return a copy with every state and control value scaled by a random factor of standard deviation scale.
+
+        The times are kept, so the phases keep their durations, and so are the fixed initial and final values of
+        the states, so the perturbed guess is a guess of the same problem.
+        """
+        rng = np.random.default_rng(seed)
+        phases = {}
+        for name, data in self.phases.items():
+            states = {}
+            for state, values in data['states'].items():
+                perturbed = values * (1 + scale * rng.standard_normal(np.shape(values)))
+                if state in data.get('fix_initial', ()):
+                    perturbed[0] = values[0]
+                if state in data.get('fix_final', ()):
+                    perturbed[-1] = values[-1]
+                states[state] = perturbed
+            phases[name] = dict(data, states=states,
+                                controls={control: values * (1 + scale * rng.standard_normal(np.shape(values)))
+                                          for control, values in data['controls'].items()})
+        return WarmStart(phases, dict(self.parameters))
+
+    def apply(self, p):
+        """Set the stored solution as the initial guess of a set up problem."""
+        traj = p.model.traj
+        for name, phase in traj._phases.items():
+            if name not in self.phases:
+                continue
+            data = self.phases[name]
+            time = data['time']
+
+            if not phase.time_options['fix_initial']:
+                p.set_val(f'traj.{name}.t_initial', time[0])
+            p.set_val(f'traj.{name}.t_duration', time[-1] - time[0])
+
+            for state, values in data['states'].items():
+                if state in phase.state_options:
+                    p.set_val(f'traj.{name}.states:{state}',
+                              phase.interpolate(xs=time, ys=values, nodes='state_input'))
+
+            for control, values in data['controls'].items():
+                if control in phase.control_options and phase.control_options[control]['opt']:
+                    p.set_val(f'traj.{name}.controls:{control}',
+                              phase.interpolate(xs=time, ys=values, nodes='control_input'))
+
+        for name, value in self.parameters.items():
+            if name in traj.parameter_options:
+                p.set_val(f'traj.parameters:{name}', value)
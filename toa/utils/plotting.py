@@ -1,319 +1,216 @@
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 
+import matplotlib
 import matplotlib.pyplot as plt
-
-
-def plot_results(p_sol, p_sim, plots_dir='plots'):
-    time_sol = {
-        'initial_run': p_sol.get_val('traj.initial_run.timeseries.time'),
-        'rotation': p_sol.get_val('traj.rotation.timeseries.time'),
-        'transition': p_sol.get_val('traj.transition.timeseries.time')
-        }
-    time_sim = {
-        'initial_run': p_sim.get_val('traj.initial_run.timeseries.time'),
-        'rotation': p_sim.get_val('traj.rotation.timeseries.time'),
-        'transition': p_sim.get_val('traj.transition.timeseries.time')
-        }
-
-    mass_sol = {
-        'initial_run': p_sol.get_val('traj.initial_run.timeseries.states:mass'),
-        'rotation': p_sol.get_val('traj.rotation.timeseries.states:mass'),
-        'transition': p_sol.get_val('traj.transition.timeseries.states:mass')
-        }
-    mass_sim = {
-        'initial_run': p_sim.get_val('traj.initial_run.timeseries.states:mass'),
-        'rotation': p_sim.get_val('traj.rotation.timeseries.states:mass'),
-        'transition': p_sim.get_val('traj.transition.timeseries.states:mass')
-        }
-
-    x_sol = {
-        'initial_run': p_sol.get_val('traj.initial_run.timeseries.states:x'),
-        'rotation': p_sol.get_val('traj.rotation.timeseries.states:x'),
-        'transition': p_sol.get_val('traj.transition.timeseries.states:x')
-        }
-    x_sim = {
-        'initial_run': p_sim.get_val('traj.initial_run.timeseries.states:x'),
-        'rotation': p_sim.get_val('traj.rotation.timeseries.states:x'),
-        'transition': p_sim.get_val('traj.transition.timeseries.states:x')
-        }
-
-    xmlg_sol = {
-        'initial_run': p_sol.get_val('traj.initial_run.timeseries.x_mlg'),
-        'rotation': p_sol.get_val('traj.rotation.timeseries.x_mlg'),
-        'transition': p_sol.get_val('traj.transition.timeseries.x_mlg')
-        }
-    xmlg_sim = {
-        'initial_run': p_sim.get_val('traj.initial_run.timeseries.x_mlg'),
-        'rotation': p_sim.get_val('traj.rotation.timeseries.x_mlg'),
-        'transition': p_sim.get_val('traj.transition.timeseries.x_mlg')
-        }
-
-    h_sol = {
-        'initial_run': p_sol.get_val('traj.initial_run.timeseries.parameters:h', units='ft'),
-        'rotation': p_sol.get_val('traj.rotation.timeseries.states:h', units='ft'),
-        'transition': p_sol.get_val('traj.transition.timeseries.states:h', units='ft'),
-        }
-    h_sim = {
-        'initial_run': p_sim.get_val('traj.initial_run.timeseries.parameters:h', units='ft'),
-        'rotation': p_sim.get_val('traj.rotation.timeseries.states:h', units='ft'),
-        'transition': p_sim.get_val('traj.transition.timeseries.states:h', units='ft'),
-        }
-
-    hmlg_sol = {
-        'initial_run': p_sol.get_val('traj.initial_run.timeseries.h_mlg', units='ft'),
-        'rotation': p_sol.get_val('traj.rotation.timeseries.h_mlg', units='ft'),
-        'transition': p_sol.get_val('traj.transition.timeseries.h_mlg', units='ft'),
-        }
-    hmlg_sim = {
-        'initial_run': p_sim.get_val('traj.initial_run.timeseries.h_mlg', units='ft'),
-        'rotation': p_sim.get_val('traj.rotation.timeseries.h_mlg', units='ft'),
-        'transition': p_sim.get_val('traj.transition.timeseries.h_mlg', units='ft'),
+import numpy as np
+
+PHASES = ('initial_run', 'rotation', 'transition')
+
+# Timeseries of the plotted variables, record name -> (timeseries variable, units)
+_COMMON = {
+    'time': ('time', None),
+    'x_mlg': ('x_mlg', None),
+    'h_mlg': ('h_mlg', 'ft'),
+    'V': ('states:V', 'kn'),
+    'tas': ('tas', 'kn'),
+    'thrust': ('thrust', 'kN'),
+    'mass': ('states:mass', None),
     }
-
-    v_sol = {
-        'initial_run': p_sol.get_val('traj.initial_run.timeseries.states:V', units='kn'),
-        'rotation': p_sol.get_val('traj.rotation.timeseries.states:V', units='kn'),
-        'transition': p_sol.get_val('traj.transition.timeseries.states:V', units='kn'),
-        }
-    v_sim = {
-        'initial_run': p_sim.get_val('traj.initial_run.timeseries.states:V', units='kn'),
-        'rotation': p_sim.get_val('traj.rotation.timeseries.states:V', units='kn'),
-        'transition': p_sim.get_val('traj.transition.timeseries.states:V', units='kn'),
-        }
-
-    tas_sol = {
-        'initial_run': p_sol.get_val('traj.initial_run.timeseries.tas', units='kn'),
-        'rotation': p_sol.get_val('traj.rotation.timeseries.tas', units='kn'),
-        'transition': p_sol.get_val('traj.transition.timeseries.tas', units='kn'),
-        }
-    tas_sim = {
-        'initial_run': p_sim.get_val('traj.initial_run.timeseries.tas', units='kn'),
-        'rotation': p_sim.get_val('traj.rotation.timeseries.tas', units='kn'),
-        'transition': p_sim.get_val('traj.transition.timeseries.tas', units='kn'),
+TIMESERIES = {
+    'initial_run': {**_COMMON, 'f_mg': ('f_mg', None), 'f_ng': ('f_ng', None), 'theta': ('parameters:theta', None),
+                    'alpha': ('parameters:theta', None)},
+    'rotation': {**_COMMON, 'f_mg': ('f_mg', None), 'theta': ('states:theta', None),
+                 'alpha': ('states:theta', None)},
+    'transition': {**_COMMON, 'theta': ('states:theta', None), 'gam': ('states:gam', None),
+                   'alpha': ('alpha', 'deg')},
     }
 
-    roc_sol = {
-        'initial_run': p_sol.get_val('traj.initial_run.timeseries.parameters:theta'),
-        'rotation': p_sol.get_val('traj.rotation.timeseries.h_dot'),
-        'transition': p_sol.get_val('traj.transition.timeseries.h_dot'),
-        }
-    roc_sim = {
-        'initial_run': p_sim.get_val('traj.initial_run.timeseries.parameters:theta'),
-        'rotation': p_sim.get_val('traj.rotation.timeseries.h_dot'),
-        'transition': p_sim.get_val('traj.transition.timeseries.h_dot'),
-        }
-    fmg_sol = {
-        'initial_run': p_sol.get_val('traj.initial_run.timeseries.f_mg'),
-        'rotation': p_sol.get_val('traj.rotation.timeseries.f_mg')
-        }
-    fmg_sim = {
-        'initial_run': p_sim.get_val('traj.initial_run.timeseries.f_mg'),
-        'rotation': p_sim.get_val('traj.rotation.timeseries.f_mg')
-        }
-
-    fng_sol = {
-        'initial_run': p_sol.get_val('traj.initial_run.timeseries.f_ng'),
-        }
-    fng_sim = {
-        'initial_run': p_sim.get_val('traj.initial_run.timeseries.f_ng'),
-        }
-
-    theta_sol = {
-        'initial_run': p_sol.get_val('traj.initial_run.timeseries.parameters:theta'),
-        'rotation': p_sol.get_val('traj.rotation.timeseries.states:theta'),
-        'transition': p_sol.get_val('traj.transition.timeseries.states:theta'),
-        }
-    theta_sim = {
-        'initial_run': p_sim.get_val('traj.initial_run.timeseries.parameters:theta'),
-        'rotation': p_sim.get_val('traj.rotation.timeseries.states:theta'),
-        'transition': p_sim.get_val('traj.transition.timeseries.states:theta'),
-        }
-
-    gam_sol = {
-        'transition': p_sol.get_val('traj.transition.timeseries.states:gam'),
-        }
-    gam_sim = {
-        'transition': p_sim.get_val('traj.transition.timeseries.states:gam'),
-        }
-
-    alpha_sol = {
-        'initial_run': p_sol.get_val('traj.initial_run.timeseries.parameters:theta'),
-        'rotation': p_sol.get_val('traj.rotation.timeseries.states:theta'),
-        'transition': p_sol.get_val('traj.transition.timeseries.alpha', units='deg')
-        }
-    alpha_sim = {
-        'initial_run': p_sim.get_val('traj.initial_run.timeseries.parameters:theta'),
-        'rotation': p_sim.get_val('traj.rotation.timeseries.states:theta'),
-        'transition': p_sim.get_val('traj.transition.timeseries.alpha', units='deg')
-        }
-
-    thrust_sol = {
-        'initial_run': p_sol.get_val('traj.initial_run.timeseries.thrust', units='kN'),
-        'rotation': p_sol.get_val('traj.rotation.timeseries.thrust', units='kN'),
-        'transition': p_sol.get_val('traj.transition.timeseries.thrust', units='kN'),
-        }
-
-    thrust_sim = {
-        'initial_run': p_sim.get_val('traj.initial_run.timeseries.thrust', units='kN'),
-        'rotation': p_sim.get_val('traj.rotation.timeseries.thrust', units='kN'),
-        'transition': p_sim.get_val('traj.transition.timeseries.thrust', units='kN'),
-        }
-
-    de_sol = {
-        'initial_run': p_sol.get_val('traj.initial_run.timeseries.controls:de'),
-        'rotation': p_sol.get_val('traj.rotation.timeseries.controls:de'),
-        'transition': p_sol.get_val('traj.transition.timeseries.controls:de'),
-        }
-    de_sim = {
-        'initial_run': p_sim.get_val('traj.initial_run.timeseries.controls:de'),
-        'rotation': p_sim.get_val('traj.rotation.timeseries.controls:de'),
-        'transition': p_sim.get_val('traj.transition.timeseries.controls:de'),
-        }
-
-    # Plots
-    # Distancias
-    fig, axs = plt.subplots(nrows=4, ncols=1, figsize=(9.4, 6.2))
-    axs[0].plot(xmlg_sim['initial_run'], hmlg_sim['initial_run'], color='tab:orange', linewidth=2, linestyle='-', label='Simulação')
-    axs[0].plot(xmlg_sim['rotation'], hmlg_sim['rotation'], color='tab:orange', linewidth=2, linestyle='-')
-    axs[0].plot(xmlg_sim['transition'], hmlg_sim['transition'], color='tab:orange', linewidth=2, linestyle='-')
-
-    axs[0].plot(xmlg_sol['initial_run'], hmlg_sol['initial_run'], marker='o', color='tab:blue', linestyle='None', label='Colocação')
-    axs[0].plot(xmlg_sol['rotation'], hmlg_sol['rotation'], marker='o', color='tab:blue', linestyle='None')
-    axs[0].plot(xmlg_sol['transition'], hmlg_sol['transition'], marker='o', color='tab:blue', linestyle='None')
-    axs[0].set_xlabel('Distância (m)')
-    axs[0].set_ylabel('Altura (ft)')
-    axs[0].set_xlim(left=0, right=xmlg_sim['transition'][-1] + 50)
+
+def extract_results(p, de_timeseries='controls:de', traj='traj'):
+    """Return the plotted timeseries of a solution or simulation problem as {phase: {name: values}}.
+
+    Every variable is read once, as a flat array detached from the problem so the record can be sent to other
+    processes. de_timeseries is the timeseries name of the elevator deflection (see ElevatorParameterization) and
+    phases the problem does not have are left out.
+    """
+    record = {}
+    for phase in PHASES:
+        try:
+            read = {('time', None): np.array(p.get_val(f'{traj}.{phase}.timeseries.time')).ravel()}
+        except KeyError:
+            continue
+        values = {}
+        for name, (var, units) in {**TIMESERIES[phase], 'de': (de_timeseries, None)}.items():
+            if (var, units) not in read:
+                read[var, units] = np.array(p.get_val(f'{traj}.{phase}.timeseries.{var}', units=units)).ravel()
+            values[name] = read[var, units]
+        record[phase] = values
+    return record
+
+
+def _plot(ax, sol, sim, x, y):
+    """Plot y against x, the simulation as a line and the collocation nodes as markers, on the phases having y."""
+    sim_phases = [phase for phase in sim if y in sim[phase]]
+    sol_phases = [phase for phase in sol if y in sol[phase]]
+    for i, phase in enumerate(sim_phases):
+        ax.plot(sim[phase][x], sim[phase][y], color='tab:orange', linewidth=2, linestyle='-',
+                label='Simulação' if i == 0 else None)
+    for i, phase in enumerate(sol_phases):
+        ax.plot(sol[phase][x], sol[phase][y], marker='o', color='tab:blue', linestyle='None',
+                label='Colocação' if i == 0 else None)
+    ax.grid(True)
+    if sim_phases or sol_phases:
+        ax.legend()
+
+
+def _first(record, name):
+    return next(values[name] for values in record.values() if name in values)
+
+
+def _last(record, name):
+    return [values[name] for values in record.values() if name in values][-1]
+
+
+def plot_displacements(sol, sim, fixed_limits=False):
+    fig, axs = plt.subplots(nrows=4, ncols=1, figsize=(9.3, 6.3) if fixed_limits else (9.4, 6.2))
+    for ax, (x, y, xlabel, ylabel) in zip(axs, (('x_mlg', 'h_mlg', 'Distância (m)', 'Altura (ft)'),
+                                                ('time', 'V', 'Tempo (s)', 'Velocidade (kt)'),
+                                                ('time', 'f_mg', 'Tempo (s)', 'Fm (kN)'),
+                                                ('time', 'f_ng', 'Tempo (s)', 'Fn (kN)'))):
+        _plot(ax, sol, sim, x, y)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
     axs[0].set_ylim(top=40)
-    axs[0].grid(True)
-    axs[0].legend()
-
-    axs[1].plot(time_sim['initial_run'], v_sim['initial_run'], color='tab:orange', linewidth=2, linestyle='-', label='Simulação')
-    axs[1].plot(time_sim['rotation'], v_sim['rotation'], color='tab:orange', linewidth=2, linestyle='-')
-    axs[1].plot(time_sim['transition'], v_sim['transition'], color='tab:orange', linewidth=2, linestyle='-')
-
-    axs[1].plot(time_sol['initial_run'], v_sol['initial_run'], marker='o', color='tab:blue', linestyle='None', label='Colocação')
-    axs[1].plot(time_sol['rotation'], v_sol['rotation'], marker='o', color='tab:blue', linestyle='None')
-    axs[1].plot(time_sol['transition'], v_sol['transition'], marker='o', color='tab:blue', linestyle='None')
-    axs[1].set_xlabel('Tempo (s)')
-    axs[1].set_ylabel('Velocidade (kt)')
-    axs[1].set_xlim(0, time_sol['transition'][-1] + 3)
-    axs[1].set_ylim(top=v_sim['transition'][-1] + 40)
-    axs[1].grid(True)
-    axs[1].legend()
-
-    axs[2].plot(time_sim['initial_run'], fmg_sim['initial_run'], color='tab:orange', linewidth=2, linestyle='-', label='Simulação')
-    axs[2].plot(time_sim['rotation'], fmg_sim['rotation'], color='tab:orange', linewidth=2, linestyle='-')
-
-    axs[2].plot(time_sol['initial_run'], fmg_sol['initial_run'], marker='o', color='tab:blue', linestyle='None', label='Colocação')
-    axs[2].plot(time_sol['rotation'], fmg_sol['rotation'], marker='o', color='tab:blue', linestyle='None')
-    axs[2].set_xlabel('Tempo (s)')
-    axs[2].set_ylabel('Fm (kN)')
-    axs[2].set_xlim(0, time_sol['transition'][-1] + 3)
-    axs[2].set_ylim(top=fmg_sim['initial_run'][0] + 50)
-    axs[2].legend()
-    axs[2].grid(True)
-
-    axs[3].plot(time_sim['initial_run'], fng_sim['initial_run'], color='tab:orange', linewidth=2, linestyle='-', label='Simulação')
-
-    axs[3].plot(time_sol['initial_run'], fng_sol['initial_run'], marker='o', color='tab:blue', linestyle='None', label='Colocação')
-    axs[3].set_xlabel('Tempo (s)')
-    axs[3].set_ylabel('Fn (kN)')
-    axs[3].set_xlim(0, time_sol['transition'][-1] + 3)
-    axs[3].set_ylim(top=fng_sim['initial_run'][0] + 10)
-    axs[3].legend()
-    axs[3].grid(True)
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(plots_dir, 'deslocamentos.png'))
-
-    # Velocidade e Tracao e Massa
-    fig, axs = plt.subplots(nrows=3, ncols=1, figsize=(9.4, 6.2))
-    axs[0].plot(tas_sim['initial_run'], thrust_sim['initial_run'], color='tab:orange', linewidth=2, linestyle='-', label='Simulação')
-    axs[0].plot(tas_sim['rotation'], thrust_sim['rotation'], color='tab:orange', linewidth=2, linestyle='-')
-    axs[0].plot(tas_sim['transition'], thrust_sim['transition'], color='tab:orange', linewidth=2, linestyle='-')
-
-    axs[0].plot(tas_sol['initial_run'], thrust_sol['initial_run'], marker='o', color='tab:blue', linestyle='None', label='Colocação')
-    axs[0].plot(tas_sol['rotation'], thrust_sol['rotation'], marker='o', color='tab:blue', linestyle='None')
-    axs[0].plot(tas_sol['transition'], thrust_sol['transition'], marker='o', color='tab:blue', linestyle='None')
-    axs[0].set_xlabel('TAS (kt)')
-    axs[0].set_ylabel('Tração (kN)')
-    axs[0].set_xlim(left=0, right=tas_sol['transition'][-1] + 5)
-    axs[0].set_ylim(bottom=thrust_sol['transition'][-1] - 10, top=thrust_sol['initial_run'][0] + 10)
-    axs[0].grid(True)
-    axs[0].legend()
-
-    axs[1].plot(time_sim['initial_run'], mass_sim['initial_run'], color='tab:orange', linewidth=2, linestyle='-', label='Simulação')
-    axs[1].plot(time_sim['rotation'], mass_sim['rotation'], color='tab:orange', linewidth=2, linestyle='-')
-    axs[1].plot(time_sim['transition'], mass_sim['transition'], color='tab:orange', linewidth=2, linestyle='-')
-
-    axs[1].plot(time_sol['initial_run'], mass_sol['initial_run'], marker='o', color='tab:blue', linestyle='None', label='Colocação')
-    axs[1].plot(time_sol['rotation'], mass_sol['rotation'], marker='o', color='tab:blue', linestyle='None')
-    axs[1].plot(time_sol['transition'], mass_sol['transition'], marker='o', color='tab:blue', linestyle='None')
-    axs[1].set_xlabel('Tempo (s)')
-    axs[1].set_ylabel('Massa (kg)')
-    axs[1].set_xlim(0, time_sol['transition'][-1] + 3)
-    axs[1].set_ylim(mass_sol['transition'][-1] - 20, mass_sol['initial_run'][0] + 20)
-    axs[1].grid(True)
-    axs[1].legend()
-
-    axs[2].plot(time_sim['initial_run'], de_sim['initial_run'], color='tab:orange', linewidth=2, linestyle='-', label='Simulação')
-    axs[2].plot(time_sim['rotation'], de_sim['rotation'], color='tab:orange', linewidth=2, linestyle='-')
-    axs[2].plot(time_sim['transition'], de_sim['transition'], color='tab:orange', linewidth=2, linestyle='-')
-
-    axs[2].plot(time_sol['initial_run'], de_sol['initial_run'], marker='o', color='tab:blue', linestyle='None', label='Colocação')
-    axs[2].plot(time_sol['rotation'], de_sol['rotation'], marker='o', color='tab:blue', linestyle='None')
-    axs[2].plot(time_sol['transition'], de_sol['transition'], marker='o', color='tab:blue', linestyle='None')
-    axs[2].set_xlabel('Tempo (s)')
-    axs[2].set_ylabel('Profundor (deg)')
-    axs[2].set_xlim(0, time_sol['transition'][-1] + 3)
+
+    if fixed_limits:
+        axs[0].set_xlim(0, 2000)
+        for ax, top in zip(axs[1:], (200, 650, 60)):
+            ax.set_xlim(0)
+            ax.set_ylim(top=top)
+        return fig
+
+    t_end = _last(sol, 'time')[-1] + 3
+    axs[0].set_xlim(left=0, right=_last(sim, 'x_mlg')[-1] + 50)
+    axs[1].set_xlim(0, t_end)
+    axs[1].set_ylim(top=_last(sim, 'V')[-1] + 40)
+    axs[2].set_xlim(0, t_end)
+    axs[2].set_ylim(top=_first(sim, 'f_mg')[0] + 50)
+    axs[3].set_xlim(0, t_end)
+    axs[3].set_ylim(top=_first(sim, 'f_ng')[0] + 10)
+    return fig
+
+
+def plot_speed_and_mass(sol, sim, fixed_limits=False):
+    fig, axs = plt.subplots(nrows=3, ncols=1, figsize=(9.3, 6.3) if fixed_limits else (9.4, 6.2))
+    for ax, (x, y, xlabel, ylabel) in zip(axs, (('tas', 'thrust', 'TAS (kt)', 'Tração (kN)'),
+                                                ('time', 'mass', 'Tempo (s)', 'Massa (kg)'),
+                                                ('time', 'de', 'Tempo (s)', 'Profundor (deg)'))):
+        _plot(ax, sol, sim, x, y)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+
+    if fixed_limits:
+        for ax in axs:
+            ax.set_xlim(0)
+        return fig
+
+    t_end = _last(sol, 'time')[-1] + 3
+    axs[0].set_xlim(left=0, right=_last(sol, 'tas')[-1] + 5)
+    axs[0].set_ylim(bottom=_last(sol, 'thrust')[-1] - 10, top=_first(sol, 'thrust')[0] + 10)
+    axs[1].set_xlim(0, t_end)
+    axs[1].set_ylim(_last(sol, 'mass')[-1] - 20, _first(sol, 'mass')[0] + 20)
+    axs[2].set_xlim(0, t_end)
     axs[2].set_ylim(-25, 25)
-    axs[2].grid(True)
-    axs[2].legend()
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(plots_dir, 'velocidade_e_massa.png'))
-
-    # Angulos
-    fig, axs = plt.subplots(nrows=3, ncols=1, figsize=(9.4, 6.2))
-    axs[0].plot(time_sim['initial_run'], theta_sim['initial_run'], color='tab:orange', linewidth=2, linestyle='-',
-                label='Simulação')
-    axs[0].plot(time_sim['rotation'], theta_sim['rotation'], color='tab:orange', linewidth=2, linestyle='-')
-    axs[0].plot(time_sim['transition'], theta_sim['transition'], color='tab:orange', linewidth=2, linestyle='-')
-
-    axs[0].plot(time_sol['initial_run'], theta_sol['initial_run'], marker='o', color='tab:blue', linestyle='None',
-                label='Colocação')
-    axs[0].plot(time_sol['rotation'], theta_sol['rotation'], marker='o', color='tab:blue', linestyle='None')
-    axs[0].plot(time_sol['transition'], theta_sol['transition'], marker='o', color='tab:blue', linestyle='None')
-    axs[0].set_xlabel('Tempo (s)')
-    axs[0].set_ylabel('Arfagem (deg)')
-    axs[0].set_xlim(0, time_sol['transition'][-1] + 3)
-    axs[0].set_ylim(0, max(theta_sol['transition']) + 5)
-    axs[0].legend()
-    axs[0].grid(True)
-
-    axs[1].plot(time_sim['transition'], gam_sim['transition'], color='tab:orange', linewidth=2, linestyle='-', label='Simulação')
-
-    axs[1].plot(time_sol['transition'], gam_sol['transition'], marker='o', color='tab:blue', linestyle='None', label='Colocação')
-    axs[1].set_xlabel('Tempo (s)')
-    axs[1].set_ylabel('Trajetória (deg)')
-    axs[1].set_xlim(0, time_sol['transition'][-1] + 3)
-    axs[1].set_ylim(0, max(gam_sol['transition']) + 5)
-    axs[1].grid(True)
-    axs[1].legend()
-
-    axs[2].plot(time_sim['initial_run'], alpha_sim['initial_run'], color='tab:orange', linewidth=2, linestyle='-', label='Simulação')
-    axs[2].plot(time_sim['rotation'], alpha_sim['rotation'], color='tab:orange', linewidth=2, linestyle='-')
-    axs[2].plot(time_sim['transition'], alpha_sim['transition'], color='tab:orange', linewidth=2, linestyle='-')
-
-    axs[2].plot(time_sol['initial_run'], alpha_sol['initial_run'], marker='o', color='tab:blue', linestyle='None', label='Colocação')
-    axs[2].plot(time_sol['rotation'], alpha_sol['rotation'], marker='o', color='tab:blue', linestyle='None')
-    axs[2].plot(time_sol['transition'], alpha_sol['transition'], marker='o', color='tab:blue', linestyle='None')
-    axs[2].set_xlabel('Tempo (s)')
-    axs[2].set_ylabel('Alpha (deg)')
-    axs[2].set_xlim(0, time_sol['transition'][-1] + 3)
-    axs[2].set_ylim(0, max(alpha_sol['transition']) + 5)
-    axs[2].grid(True)
-    axs[2].legend()
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(plots_dir, 'angulos.png'))
\ No newline at end of file
+    return fig
+
+
+def plot_angles(sol, sim, fixed_limits=False):
+    fig, axs = plt.subplots(nrows=3, ncols=1, figsize=(9.3, 6.3) if fixed_limits else (9.4, 6.2))
+    for ax, (y, ylabel) in zip(axs, (('theta', 'Arfagem (deg)'), ('gam', 'Trajetória (deg)'),
+                                     ('alpha', 'Alpha (deg)'))):
+        _plot(ax, sol, sim, 'time', y)
+        ax.set_xlabel('Tempo (s)')
+        ax.set_ylabel(ylabel)
+
+    t_end = _last(sol, 'time')[-1] + 3
+    for ax, y in zip(axs, ('theta', 'gam', 'alpha')):
+        if fixed_limits:
+            ax.set_xlim(0)
+        elif any(y in values for values in sol.values()):
+            ax.set_xlim(0, t_end)
+            ax.set_ylim(0, max(_last(sol, y)) + 5)
+    return fig
+
+
+FIGURES = {
+    'deslocamentos.png': plot_displacements,
+    'velocidade_e_massa.png': plot_speed_and_mass,
+    'angulos.png': plot_angles,
+    }
+
+
+def save_figures(sol, sim, plots_dir='plots', fixed_limits=False, result_time=None, close=True):
+    """Draw the figure set of the solution and simulation records to plots_dir and return the written paths.
+
+    With a result_time (seconds since the epoch), figures whose file was modified after it are up to date and
+    are not drawn again.
+    """
+    written = []
+    for filename, plot in FIGURES.items():
+        path = os.path.join(plots_dir, filename)
+        if result_time is not None and os.path.exists(path) and os.path.getmtime(path) > result_time:
+            continue
+        fig = plot(sol, sim, fixed_limits=fixed_limits)
+        fig.tight_layout()
+        fig.savefig(path)
+        if close:
+            plt.close(fig)
+        written.append(path)
+    return written
+
+
+def plot_results(p_sol, p_sim, plots_dir='plots', de_timeseries='controls:de', fixed_limits=False):
+    save_figures(extract_results(p_sol, de_timeseries), extract_results(p_sim, de_timeseries), plots_dir,
+                 fixed_limits=fixed_limits, close=False)
+
+
+class PlotCase:
+    """Records of a solved case to plot with plot_cases, its figures are drawn to their own plots_dir.
+
+    result_time is the time the case result was produced, by default when the records are extracted; for results
+    loaded from a file pass the file modification time, so figures drawn after it are not drawn again.
+    """
+
+    def __init__(self, plots_dir, solution, simulation, result_time=None, fixed_limits=False):
+        self.plots_dir = plots_dir
+        self.solution = solution
+        self.simulation = simulation
+        self.result_time = time.time() if result_time is None else result_time
+        self.fixed_limits = fixed_limits
+
+    @classmethod
+    def from_problems(cls, plots_dir, p_sol, p_sim, de_timeseries='controls:de', result_time=None,
+                      fixed_limits=False):
+        return cls(plots_dir, extract_results(p_sol, de_timeseries), extract_results(p_sim, de_timeseries),
+                   result_time=result_time, fixed_limits=fixed_limits)
+
+
+def _use_headless_backend():
+    matplotlib.use('Agg')
+
+
+def _save_case(case):
+    os.makedirs(case.plots_dir, exist_ok=True)
+    return save_figures(case.solution, case.simulation, case.plots_dir, fixed_limits=case.fixed_limits,
+                        result_time=case.result_time)
+
+
+def plot_cases(cases, max_workers=None):
+    """Draw the figure sets of many PlotCase with the Agg backend in worker processes.
+
+    Returns the paths written for each case, figures newer than the case result are skipped.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_use_headless_backend) as executor:
+        return list(executor.map(_save_case, cases))
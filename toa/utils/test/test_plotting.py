@@ -0,0 +1,80 @@
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+from toa.utils import plotting
+from toa.utils.plotting import FIGURES
+from toa.utils.plotting import PlotCase
+from toa.utils.plotting import TIMESERIES
+from toa.utils.plotting import extract_results
+from toa.utils.plotting import plot_cases
+from toa.utils.plotting import save_figures
+
+
+class _Problem:
+    """get_val of the timeseries of a solved trajectory, counting the reads."""
+
+    def __init__(self, phases=plotting.PHASES, num_nodes=5):
+        self.calls = 0
+        self.values = {}
+        for i, phase in enumerate(phases):
+            for var, _ in list(TIMESERIES[phase].values()) + [('controls:de', None)]:
+                self.values[f'traj.{phase}.timeseries.{var}'] = np.linspace(i, i + 1, num_nodes).reshape(-1, 1)
+
+    def get_val(self, name, units=None):
+        self.calls += 1
+        return self.values[name]
+
+
+class TestExtractResults(unittest.TestCase):
+
+    def test_reads_each_variable_once(self):
+        p = _Problem()
+        record = extract_results(p)
+
+        self.assertEqual(list(record), list(plotting.PHASES))
+        self.assertEqual(p.calls, len(p.values))
+        np.testing.assert_array_equal(record['rotation']['alpha'], record['rotation']['theta'])
+        self.assertEqual(record['transition']['de'].shape, (5,))
+
+    def test_missing_phase(self):
+        record = extract_results(_Problem(phases=('initial_run', 'rotation')))
+
+        self.assertEqual(list(record), ['initial_run', 'rotation'])
+
+
+class TestSaveFigures(unittest.TestCase):
+
+    def setUp(self):
+        self.plots_dir = tempfile.mkdtemp()
+        self.record = extract_results(_Problem())
+
+    def test_skips_figures_newer_than_result(self):
+        written = save_figures(self.record, self.record, self.plots_dir)
+        self.assertEqual(sorted(written), sorted(os.path.join(self.plots_dir, name) for name in FIGURES))
+
+        self.assertEqual(save_figures(self.record, self.record, self.plots_dir, result_time=time.time() - 60), [])
+        self.assertEqual(len(save_figures(self.record, self.record, self.plots_dir, result_time=time.time() + 60)),
+                         len(FIGURES))
+
+    def test_without_transition(self):
+        record = extract_results(_Problem(phases=('initial_run', 'rotation')))
+
+        self.assertEqual(len(save_figures(record, record, self.plots_dir)), len(FIGURES))
+
+    def test_plot_cases(self):
+        cases = [PlotCase(os.path.join(self.plots_dir, name), self.record, self.record, fixed_limits=fixed)
+                 for name, fixed in (('auto', False), ('fixed', True))]
+
+        written = plot_cases(cases, max_workers=2)
+
+        for case, paths in zip(cases, written):
+            self.assertEqual(len(paths), len(FIGURES))
+            self.assertTrue(all(path.startswith(case.plots_dir) and os.path.exists(path) for path in paths))
+
+
+if __name__ == '__main__':
+    unittest.main()
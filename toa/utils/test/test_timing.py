@@ -0,0 +1,66 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import openmdao.api as om
+
+from toa.models.aero.dynamic_pressure_comp import DynamicPressureComp
+from toa.models.propulsion.mach_comp import MachComp
+from toa.utils import timing
+from toa.utils.timing import ComponentTimer
+
+
+class _ODE(om.Group):
+    def setup(self):
+        self.add_subsystem('dyn_press', DynamicPressureComp(num_nodes=3))
+        self.add_subsystem('mach_comp', MachComp(num_nodes=3))
+
+
+class TestComponentTimer(unittest.TestCase):
+
+    def setUp(self):
+        self.p = om.Problem()
+        phases = self.p.model.add_subsystem('traj', om.Group()).add_subsystem('phases', om.Group())
+        phases.add_subsystem('rotation', om.Group()).add_subsystem('rhs_disc', _ODE())
+        self.p.setup()
+
+    def test_records(self):
+        timer = ComponentTimer()
+        with mock.patch.object(timing, 'ODE_CLASSES', (_ODE,)):
+            timer.attach(self.p)
+
+        for _ in range(3):
+            self.p.run_model()
+        self.p.compute_totals(of=['traj.phases.rotation.rhs_disc.dyn_press.qbar'],
+                              wrt=['traj.phases.rotation.rhs_disc.dyn_press.tas'])
+
+        records = {(r['phase'], r['component'], r['method']): r for r in timer.records()}
+
+        self.assertEqual(records['rotation', 'dyn_press', 'compute']['calls'], 3)
+        self.assertEqual(records['rotation', 'mach_comp', 'compute']['calls'], 3)
+        self.assertEqual(records['rotation', 'dyn_press', 'compute_partials']['calls'], 1)
+        totals = [r['total_time'] for r in timer.records()]
+        self.assertEqual(totals, sorted(totals, reverse=True))
+
+        np.testing.assert_allclose(self.p.get_val('traj.phases.rotation.rhs_disc.dyn_press.qbar'), 0.5)
+
+    def test_detach(self):
+        timer = ComponentTimer()
+        with mock.patch.object(timing, 'ODE_CLASSES', (_ODE,)):
+            timer.attach(self.p)
+            timer.attach(self.p)
+        self.p.run_model()
+        timer.detach()
+        self.p.run_model()
+
+        records = {(r['phase'], r['component'], r['method']): r for r in timer.records()}
+        self.assertEqual(records['rotation', 'dyn_press', 'compute']['calls'], 1)
+        self.assertNotIn('compute', vars(self.p.model.traj.phases.rotation.rhs_disc.dyn_press))
+
+    def test_phase_name(self):
+        self.assertEqual(timing._phase_name('traj.phases.initial_run.rhs_disc'), 'initial_run')
+        self.assertEqual(timing._phase_name('rotation.rhs_col'), 'rotation')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+from openmdao.utils.assert_utils import assert_near_equal
+
+from toa.data import get_airplane_data
+from toa.utils.validation import flap_clmax
+from toa.utils.validation import validate_results
+
+# Values of a b734 takeoff with a transition phase, see VALIDATION_DATA
+CASE = {'VR': 75.0, 'T0': 200000.0, 'TR': 170000.0, 'm0': 60000.0, 'mR': 59950.0, 'x_ground': 1100.0, 'CLg': 0.8,
+        'CDg': 0.08, 'Vlof': 80.0, 't_rot0': 30.0, 't_lof': 33.0, 'theta_lof': 10.0, 'x_lof': 1330.0,
+        'm_lof': 59940.0, 'T_lof': 168000.0, 'D_lof': 25000.0, 'vlof_vs': 1.15, 'x_tr0': 1330.0,
+        'x_screen': 1700.0, 'h_screen': 10.67, 'distance': 1690.0}
+
+
+class TestValidateResults(unittest.TestCase):
+
+    def setUp(self):
+        self.airplane = get_airplane_data('b734')
+
+    def test_flap_clmax(self):
+        assert_near_equal(flap_clmax(self.airplane, [0, 5, 10, 15, 5]),
+                          [1.4156, 2.0581687373857513, 2.1299732557370072, 2.2234101823709764, 2.0581687373857513],
+                          tolerance=1e-12)
+
+    def test_batch_matches_single_cases(self):
+        n = 1000
+        rng = np.random.default_rng(0)
+        data = {name: np.full(n, value) for name, value in CASE.items()}
+        data['m0'] = data['mR'] = 60000.0 + rng.normal(0.0, 100.0, n)
+        flap_angle = rng.choice([5.0, 10.0], n)
+
+        table = validate_results(data, self.airplane, flap_angle)
+
+        for i in (0, n - 1):
+            single = validate_results([{name: value[i] for name, value in data.items()}], self.airplane,
+                                      flap_angle[i])
+            for name, value in single.items():
+                if name == 'outlier':
+                    continue
+                assert_near_equal(table[name][i], value[0], tolerance=1e-12)
+
+    def test_outliers(self):
+        cases = [dict(CASE) for _ in range(50)]
+        cases[7]['x_ground'] = 1500.0
+        cases[9]['VR'] = np.nan
+
+        table = validate_results(cases, self.airplane, 5.0)
+
+        self.assertEqual(list(np.flatnonzero(table['outlier'])), [7, 9])
+        self.assertTrue(np.all(validate_results(cases, self.airplane, 5.0, tolerance=10.0)['outlier']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import functools
+import json
+import time
+
+import openmdao.api as om
+
+from toa.ode.initialrun_ode import InitialRunODE
+from toa.ode.rotation_ode import RotationODE
+from toa.ode.transition_ode import TransitionODE
+
+ODE_CLASSES = (InitialRunODE, RotationODE, TransitionODE)
+TIMED_METHODS = ('compute', 'compute_partials')
+
+
+class ComponentTimer:
+    """Accumulates call counts and wall times of the phase ODE components.
+
+    Components evaluated by finite differences show the finite difference steps as compute calls.
+    """
+
+    def __init__(self):
+        self._stats = {}
+        self._wrapped = []
+
+    def attach(self, p):
+        """Wrap compute and compute_partials of every component under the phase ODEs of a set up problem.
+
+        Call detach once the timed runs are done, attaching again first detaches from the previous problem.
+        """
+        self.detach()
+        for ode in p.model.system_iter(recurse=True, typ=ODE_CLASSES):
+            phase = _phase_name(ode.pathname)
+            for comp in ode.system_iter(recurse=True, typ=om.ExplicitComponent):
+                component = comp.pathname[len(ode.pathname) + 1:]
+                for method in TIMED_METHODS:
+                    # Base class methods do nothing, timing them only adds noise to the report
+                    if getattr(type(comp), method) is getattr(om.ExplicitComponent, method):
+                        continue
+                    key = (phase, component, method)
+                    self._stats.setdefault(key, [0, 0.0])
+                    self._wrapped.append((comp, method, vars(comp).get(method)))
+                    setattr(comp, method, self._wrap(getattr(comp, method), self._stats[key]))
+
+    def detach(self):
+        """Restore the methods wrapped by attach, the accumulated timings are kept."""
+        for comp, method, original in reversed(self._wrapped):
+            if original is None:
+                delattr(comp, method)
+            else:
+                setattr(comp, method, original)
+        self._wrapped = []
+
+    @staticmethod
+    def _wrap(func, stats):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats[0] += 1
+                stats[1] += time.perf_counter() - start
+
+        return timed
+
+    def reset(self):
+        for stats in self._stats.values():
+            stats[0] = 0
+            stats[1] = 0.0
+
+    def records(self):
+        """Return the timing records sorted by decreasing cumulative time."""
+        records = [
+            {
+                'phase': phase,
+                'component': component,
+                'method': method,
+                'calls': calls,
+                'total_time': total,
+                'mean_time': total / calls if calls else 0.0,
+                }
+            for (phase, component, method), (calls, total) in self._stats.items() if calls
+            ]
+        return sorted(records, key=lambda record: record['total_time'], reverse=True)
+
+    def report(self):
+        records = self.records()
+        total = sum(record['total_time'] for record in records)
+        lines = [f"{'phase':<12} {'component':<36} {'method':<17} {'calls':>8} {'total (s)':>10} "
+                 f"{'mean (ms)':>10} {'share':>7}"]
+        for record in records:
+            share = record['total_time'] / total * 100 if total else 0.0
+            lines.append(f"{record['phase']:<12} {record['component']:<36} {record['method']:<17} "
+                         f"{record['calls']:>8} {record['total_time']:>10.4f} {record['mean_time'] * 1e3:>10.4f} "
+                         f"{share:>6.1f}%")
+        lines.append(f"Total timed: {total:.4f} s")
+        return '\n'.join(lines)
+
+    def save(self, filename):
+        """Write the sorted timing records to a JSON file."""
+        with open(filename, 'w') as file:
+            json.dump(self.records(), file, indent=2)
+
+
+def _phase_name(pathname):
+    """Return the phase name from an ODE pathname like traj.phases.rotation.rhs_disc."""
+    names = pathname.split('.')
+    if 'phases' in names[:-1]:
+        return names[names.index('phases') + 1]
+    return names[-2] if len(names) > 1 else names[-1]
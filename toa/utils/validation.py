@@ -1,81 +1,150 @@
-import math
-
-from ambiance import Atmosphere
+import numpy as np
+
+from toa.analysis.estimator import GRAV
+from toa.analysis.estimator import air_distance
+from toa.analysis.estimator import ground_run_distance
+from toa.models.aero.flap_slat_comp import FlapSlatComp
+from toa.models.atmosphere import P0
+from toa.models.atmosphere import atmosphere
+
+# Values of a solved takeoff read by the hand estimates, name -> (variable, index), in SI units
+VALIDATION_DATA = {
+    'VR': ('traj.initial_run.timeseries.states:V', -1),
+    'T0': ('traj.initial_run.timeseries.thrust', 0),
+    'TR': ('traj.initial_run.timeseries.thrust', -1),
+    'm0': ('traj.initial_run.timeseries.states:mass', 0),
+    'mR': ('traj.initial_run.timeseries.states:mass', -1),
+    'x_ground': ('traj.initial_run.timeseries.states:x', -1),
+    'CLg': ('traj.initial_run.timeseries.CLg', -1),
+    'CDg': ('traj.initial_run.timeseries.CD', -1),
+    'Vlof': ('traj.rotation.timeseries.states:V', -1),
+    't_rot0': ('traj.rotation.timeseries.time', 0),
+    't_lof': ('traj.rotation.timeseries.time', -1),
+    'theta_lof': ('traj.rotation.timeseries.states:theta', -1),
+    'x_lof': ('traj.rotation.timeseries.states:x', -1),
+    'm_lof': ('traj.rotation.timeseries.states:mass', -1),
+    'T_lof': ('traj.rotation.timeseries.thrust', -1),
+    'D_lof': ('traj.rotation.timeseries.D', -1),
+    'vlof_vs': ('traj.transition.timeseries.V_Vstall', 0),
+    'x_tr0': ('traj.transition.timeseries.states:x', 0),
+    'x_screen': ('traj.transition.timeseries.states:x', -1),
+    'h_screen': ('traj.transition.timeseries.h_mlg', -1),
+    'distance': ('traj.transition.timeseries.x_mlg', -1),
+    }
+
+# Segments compared by validate_results, analytic estimate name -> optimized value name
+SEGMENTS = {
+    'Sngr': 'Sngr_opt',
+    'Sr': 'Sr_opt',
+    'Sa': 'Sa_opt',
+    'Sroskam': 'Sopt',
+    }
+
+
+def extract_validation_data(p):
+    """Return the values of a solved takeoff (with a transition phase) used by the hand estimates, as floats."""
+    data = {}
+    for name, (var, index) in VALIDATION_DATA.items():
+        units = 'm' if name == 'h_screen' else None
+        data[name] = float(p.get_val(var, units=units)[index])
+    return data
+
+
+def flap_clmax(airplane, flap_angle):
+    """Return the maximum lift coefficient of the flap model (FlapSlatComp) for each flap deflection in deg."""
+    flap_angle = np.asarray(flap_angle, dtype=float)
+    comp = FlapSlatComp(airplane=airplane)
+    angles, inverse = np.unique(flap_angle, return_inverse=True)
+    clmax = np.empty(angles.size)
+    for i, angle in enumerate(angles):
+        outputs = {}
+        comp.compute({'flap_angle': np.array([angle])}, outputs)
+        clmax[i] = np.ravel(outputs['CLmax'])[0]
+    return clmax[inverse].reshape(flap_angle.shape)
+
+
+def roskam_estimates(data, airplane, flap_angle, elevation=0.0, slope=0.0, mu=0.025, isa_deviation=0.0, qnh=P0):
+    """Return the Roskam hand estimates of the ground run, rotation and air distances of solved takeoffs.
+
+    data maps the names of VALIDATION_DATA to arrays, one value per takeoff, and every other argument may also be an
+    array. The ground run uses the average acceleration between the start and the rotation, the rotation distance
+    the mean speed over the optimized rotation time and the air distance a transition arc followed by a straight
+    climb to the screen height.
+    """
+    data = {name: np.asarray(value, dtype=float) for name, value in data.items()}
+    rho = atmosphere(np.asarray(elevation, dtype=float), isa_deviation, qnh)['rho']
+    S = airplane.wing.area
+
+    # Ground run
+    VR = data['VR']
+    W0 = data['m0'] * GRAV
+    WR = data['mR'] * GRAV
+    agV0 = GRAV * (data['T0'] / W0 - mu - slope)
+    agVR = GRAV * ((data['TR'] / WR - mu) - (data['CDg'] - mu * data['CLg']) * rho * VR ** 2 / (2 * WR / S) - slope)
+    Sngr, _ = ground_run_distance(VR, agV0, agVR)
+
+    # Rotation
+    Sr = 0.5 * (VR + data['Vlof']) * (data['t_lof'] - data['t_rot0'])
+
+    # Transition and climb to the screen height
+    W = data['m_lof'] * GRAV
+    Sa = air_distance(W / S, rho, flap_clmax(airplane, flap_angle), data['vlof_vs'],
+                      (data['T_lof'] - data['D_lof']) / W, h_screen=data['h_screen'])
+
+    return {
+        'Sngr': Sngr,
+        'Sr': Sr,
+        'Sa': Sa,
+        'Sroskam': Sngr + Sr + Sa,
+        }
+
+
+def validate_results(data, airplane, flap_angle, elevation=0.0, slope=0.0, mu=0.025, isa_deviation=0.0, qnh=P0,
+                     tolerance=None, n_mad=5.0):
+    """Compare the hand estimates with the optimized distances of many solved takeoffs.
+
+    data is a list of extract_validation_data dicts or a dict of arrays. Returns a table, as a dict of arrays with
+    one value per takeoff, of the estimated and optimized distances of every segment (see SEGMENTS) in m and their
+    differences in % of the optimized ones. A takeoff is flagged as an outlier when a value is not finite, when its
+    total difference exceeds tolerance %, if given, or when a segment difference is more than n_mad median absolute
+    deviations away from the median of the batch.
+    """
+    if not isinstance(data, dict):
+        data = {name: np.array([case[name] for case in data]) for name in VALIDATION_DATA}
+    data = {name: np.atleast_1d(np.asarray(value, dtype=float)) for name, value in data.items()}
+
+    table = roskam_estimates(data, airplane, flap_angle, elevation=elevation, slope=slope, mu=mu,
+                             isa_deviation=isa_deviation, qnh=qnh)
+    table.update({
+        'Sngr_opt': data['x_ground'],
+        'Sr_opt': data['x_lof'] - data['x_ground'],
+        'Sa_opt': data['x_screen'] - data['x_tr0'],
+        'Sopt': data['distance'],
+        })
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        outlier = np.zeros(data['distance'].shape, dtype=bool)
+        for estimate, optimized in SEGMENTS.items():
+            diff = (table[optimized] - table[estimate]) / table[optimized] * 100
+            table[f'{estimate}_diff'] = diff
+            finite = np.isfinite(diff)
+            outlier |= ~finite
+            if np.any(finite):
+                median = np.median(diff[finite])
+                mad = np.median(np.abs(diff[finite] - median))
+                outlier |= finite & (np.abs(diff - median) > n_mad * max(mad, 1e-6))
+        if tolerance is not None:
+            outlier |= np.abs(table['Sroskam_diff']) > tolerance
+    table['outlier'] = outlier
+    return table
 
 
 def validate_result(p, airplane, runway, flap_angle):
-    ## Ground roll
-    mu = 0.025
-    g = 9.80665
-    atmos = Atmosphere(runway.elevation)
-
-    VR = p.get_val('traj.initial_run.timeseries.states:V')[-1]
-
-    T0 = p.get_val('traj.initial_run.timeseries.thrust')[0]
-    TR = p.get_val('traj.initial_run.timeseries.thrust')[-1]
-
-    W0 = p.get_val('traj.initial_run.timeseries.states:mass')[0] * g
-    WR = p.get_val('traj.initial_run.timeseries.states:mass')[-1] * g
-
-    Sngr_opt = p.get_val('traj.initial_run.timeseries.states:x')[-1]
-
-    CLg = p.get_val('traj.initial_run.timeseries.CLg')[-1]
-    CDg = p.get_val('traj.initial_run.timeseries.CD')[-1]
-
-    agV0 = g * (T0 / W0 - mu - runway.slope)
-    agVR = g * ((TR / WR - mu) - (CDg - mu * CLg) * atmos.density[0] * VR ** 2 / (
-                2 * WR / airplane.wing.area) - runway.slope)
-
-    k = ((1 - agVR/agV0)/math.log(agV0/agVR))
-    agave = k * agV0
-
-    Sngr = VR ** 2 / (2 * agave)
-
-    print(f"Sngr: {Sngr}, Sngr_opt: {Sngr_opt}, diff: {(Sngr_opt - Sngr)/Sngr_opt * 100}")
-
-    ## Rotation
-    Vlof = p.get_val('traj.rotation.timeseries.states:V')[-1]
-    tr = p.get_val('traj.rotation.timeseries.time')[-1] - p.get_val('traj.rotation.timeseries.time')[0]
-    alpha_max = p.get_val('traj.rotation.timeseries.states:theta')[-1]
-    Sr = 0.5 * (VR + Vlof) * tr
-    Sr_opt = p.get_val('traj.rotation.timeseries.states:x')[-1] - Sngr_opt
-
-    print(f"Sngr: {Sr}, Sngr_opt: {Sr_opt}, diff: {(Sr_opt - Sr) / Sr_opt * 100}, alpha_max: {alpha_max}, tr: {tr}")
-    p.get_val('traj.transition.timeseries.time')[-1] - p.get_val('traj.rotation.timeseries.time')[-1]
-    ## Transition
-    if flap_angle == 0:
-        CLmax = 1.4156
-    elif flap_angle == 5:
-        CLmax = 2.0581687373857513
-    elif flap_angle == 10:
-        CLmax = 2.1299732557370072
-    else:
-        CLmax = 2.2234101823709764
-
-    vlof_vs = p.get_val('traj.transition.timeseries.V_Vstall')[0]
-
-    deltaCL = 0.5 * (vlof_vs ** 2 - 1) * (CLmax * (vlof_vs ** 2 - 0.53) + 0.38)
-    W = p.get_val('traj.rotation.timeseries.states:mass')[-1] * g
-    Rtr = 2 * (W / airplane.wing.area) / (atmos.density[0] * g * deltaCL)
-    T = p.get_val('traj.rotation.timeseries.thrust')[-1]
-    D = p.get_val('traj.rotation.timeseries.D')[-1]
-    theta = (T - D)/W
-
-    Str = Rtr * math.sin(theta)
-
-    htr = Str * theta/2
-    hscreen = p.get_val('traj.transition.timeseries.h_mlg', units='m')[-1]
-    if htr > hscreen:
-        Scl = 0
-    if htr < hscreen:
-        Scl = (hscreen - htr)/math.tan(theta)
-
-    Sa = Str + Scl
-
-    Sa_opt = p.get_val('traj.transition.timeseries.states:x')[-1] - p.get_val('traj.transition.timeseries.states:x')[0]
-
-    print(f"Sa: {Sa}, Sa_opt: {Sa_opt}, diff: {(Sa_opt - Sa) / Sa_opt * 100}")
-
-    Sroskam = Sngr + Sr + Sa
-    Sopt = p.get_val('traj.transition.timeseries.x_mlg')[-1]
-    print(f"Sroskam: {Sroskam}, Programa: {Sopt}, diff: {(Sopt - Sroskam)/Sopt * 100}")
+    table = validate_results([extract_validation_data(p)], airplane, flap_angle, elevation=runway.elevation,
+                             slope=runway.slope, mu=runway.condition.mu)
+    row = {name: float(value[0]) for name, value in table.items()}
+
+    print(f"Sngr: {row['Sngr']}, Sngr_opt: {row['Sngr_opt']}, diff: {row['Sngr_diff']}")
+    print(f"Sr: {row['Sr']}, Sr_opt: {row['Sr_opt']}, diff: {row['Sr_diff']}")
+    print(f"Sa: {row['Sa']}, Sa_opt: {row['Sa_opt']}, diff: {row['Sa_diff']}")
+    print(f"Sroskam: {row['Sroskam']}, Programa: {row['Sopt']}, diff: {row['Sroskam_diff']}")